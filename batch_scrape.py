@@ -0,0 +1,158 @@
+import argparse
+import logging
+import threading
+import time
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+import pandas as pd
+import requests
+
+from driver_pool import DriverPool
+from main import (
+    fetch_unemployment_data_http,
+    get_scrape_profile,
+    save_data,
+    scrape_unemployment_table,
+    setup_driver,
+)
+from snapshots import EXPORT_FORMATS
+
+logger = logging.getLogger(__name__)
+
+# URL base das listas de países do Trading Economics
+COUNTRY_LIST_URL = "https://tradingeconomics.com/country-list/{indicator}?continent={continent}"
+
+# Continentes disponíveis nas listas de países
+CONTINENTS = ['america', 'europe', 'asia', 'africa', 'australia']
+
+# Indicadores padrão (slug usado na URL do Trading Economics)
+INDICATORS = ['unemployment-rate']
+
+
+class HostRateLimiter:
+    """Limita o número de requisições por segundo para cada host, entre todas as threads."""
+
+    def __init__(self, requests_per_second=1.0):
+        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = {}
+
+    def wait(self, url):
+        """Bloqueia até que uma nova requisição para o host da URL seja permitida."""
+        if not self._interval:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self._interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def build_jobs(indicators=INDICATORS, continents=CONTINENTS):
+    """Monta a lista de páginas a extrair (indicadores x continentes)."""
+    return [
+        {
+            'indicator': indicator,
+            'continent': continent,
+            'url': COUNTRY_LIST_URL.format(indicator=indicator, continent=continent),
+        }
+        for indicator in indicators
+        for continent in continents
+    ]
+
+
+def scrape_jobs(jobs, workers=4, requests_per_second=1.0, use_browser=True, wait_timeouts=None,
+                profile='production'):
+    """Extrai todas as páginas em paralelo e junta os resultados em um único DataFrame.
+
+    Cada página é buscada via HTTP; se a tabela não vier no HTML e use_browser for
+    True, a página é carregada em um navegador de um DriverPool compartilhado
+    (no máximo `workers` navegadores abertos ao mesmo tempo). As linhas recebem as
+    colunas Indicator e Continent. Páginas com erro são registradas no log e ignoradas.
+    Os navegadores usam o perfil de extração `profile` (padrão: 'production').
+    """
+    rate_limiter = HostRateLimiter(requests_per_second)
+    sessions = threading.local()
+    debug = get_scrape_profile(profile)['debug_artifacts']
+    pool = DriverPool(partial(setup_driver, profile=profile), size=workers) if use_browser else None
+
+    def run_job(job):
+        if not hasattr(sessions, 'session'):
+            sessions.session = requests.Session()
+
+        df = None
+        try:
+            rate_limiter.wait(job['url'])
+            df = fetch_unemployment_data_http(job['url'], session=sessions.session)
+        except Exception as e:
+            logger.info(f"Busca via HTTP falhou para {job['url']} ({str(e)})")
+
+        if df is None and pool is not None:
+            with pool.driver() as driver:
+                rate_limiter.wait(job['url'])
+                df = scrape_unemployment_table(driver, job['url'], wait_timeouts, debug=debug)
+
+        if df is None:
+            raise ValueError("Nenhuma tabela encontrada")
+
+        df.insert(0, 'Continent', job['continent'])
+        df.insert(0, 'Indicator', job['indicator'])
+        return df
+
+    frames = []
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run_job, job): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    frames.append(future.result())
+                    logger.info(f"Página extraída: {job['indicator']} / {job['continent']}")
+                except Exception as e:
+                    logger.error(f"Erro ao extrair {job['indicator']} / {job['continent']}: {str(e)}")
+    finally:
+        if pool is not None:
+            pool.close()
+
+    if not frames:
+        return pd.DataFrame(columns=['Indicator', 'Continent'])
+
+    df = pd.concat(frames, ignore_index=True, sort=False)
+    return df.sort_values(['Indicator', 'Continent'], kind='stable').reset_index(drop=True)
+
+
+def main():
+    """Executa a extração em lote a partir da linha de comando."""
+    parser = argparse.ArgumentParser(description="Extração paralela de indicadores por continente")
+    parser.add_argument('--indicators', nargs='+', default=INDICATORS)
+    parser.add_argument('--continents', nargs='+', default=CONTINENTS)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--rate', type=float, default=1.0, help="Requisições por segundo por host")
+    parser.add_argument('--no-browser', action='store_true', help="Não usar o Selenium como alternativa")
+    parser.add_argument('--profile', default='production', help="Perfil do navegador (production ou debug)")
+    parser.add_argument('--export', nargs='*', choices=EXPORT_FORMATS, default=[], help="Exportações CSV/Excel opcionais")
+    args = parser.parse_args()
+
+    jobs = build_jobs(args.indicators, args.continents)
+    logger.info(f"Extraindo {len(jobs)} páginas com {args.workers} workers...")
+    df = scrape_jobs(
+        jobs, workers=args.workers, requests_per_second=args.rate,
+        use_browser=not args.no_browser, profile=args.profile
+    )
+
+    if df.empty:
+        print("Nenhuma página foi extraída com sucesso.")
+        return
+
+    # Salvar em uma subpasta para não substituir os dados das Américas usados pelo dashboard
+    snapshot_path = save_data(df, name='indicators_by_continent', data_dir='data/batch', exports=args.export)
+    print(f"{len(df)} linhas extraídas de {df.groupby(['Indicator', 'Continent']).ngroups} páginas. Dados salvos em {snapshot_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark do tamanho das respostas do dashboard (bytes transferidos por visualização).
+
+Gera um snapshot sintético em uma pasta temporária, carrega o dashboard e mede,
+para cada recurso de uma visualização, os bytes enviados sem compressão, com
+gzip e com brotli, e os bytes de uma revisita (requisições condicionais com a
+ETag recebida, que devem resultar em 304 sem corpo).
+
+Uso: python benchmarks/bench_payload_sizes.py [--rows 31 1000 10000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+os.environ.setdefault('DASHBOARD_RELOAD_INTERVAL', '0')
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_prepare_data import make_dataset  # noqa: E402
+from snapshots import SNAPSHOT_EXTENSION, SnapshotManifest, write_snapshot  # noqa: E402
+
+ENCODINGS = ['identity', 'gzip', 'br']
+
+
+def write_dataset(data_dir, rows):
+    """Grava um snapshot sintético com `rows` linhas e o registra no manifest."""
+    os.makedirs(data_dir, exist_ok=True)
+    df = make_dataset(rows)
+    path = os.path.join(data_dir, f'bench_{rows}{SNAPSHOT_EXTENSION}')
+    write_snapshot(df, path)
+    SnapshotManifest(data_dir).append(path, df)
+
+
+def table_page_request():
+    """Corpo da requisição do callback da tabela (primeira página, ordenada pela taxa)."""
+    return {
+        'output': '..data-table.data...data-table.page_count..',
+        'outputs': [{'id': 'data-table', 'property': 'data'}, {'id': 'data-table', 'property': 'page_count'}],
+        'inputs': [
+            {'id': 'data-table', 'property': 'page_current', 'value': 0},
+            {'id': 'data-table', 'property': 'page_size', 'value': 10},
+            {'id': 'data-table', 'property': 'sort_by', 'value': [{'column_id': 'Last', 'direction': 'desc'}]},
+            {'id': 'data-table', 'property': 'filter_query', 'value': ''},
+            {'id': 'data-version', 'property': 'data', 'value': None},
+        ],
+        'changedPropIds': ['data-table.sort_by'],
+    }
+
+
+def measure_view(client, dashboard):
+    """Retorna {recurso: {codificação: bytes}} para uma visualização completa."""
+    version = dashboard.data_provider.current().version
+    resources = {
+        'index': ('get', '/'),
+        'layout': ('get', '/_dash-layout'),
+        'dependencies': ('get', '/_dash-dependencies'),
+        'figures': ('get', f'/_figures/{version}.json'),
+    }
+    if dashboard.SERVER_SIDE_TABLE:
+        resources['table_page'] = ('post', '/_dash-update-component')
+
+    sizes = {}
+    for name, (method, url) in resources.items():
+        sizes[name] = {}
+        etag = None
+        for encoding in ENCODINGS:
+            headers = {'Accept-Encoding': encoding}
+            if method == 'get':
+                response = client.get(url, headers=headers)
+            else:
+                response = client.post(url, json=table_page_request(), headers=headers)
+            sizes[name][encoding] = len(response.data)
+            etag = response.headers.get('ETag') or etag
+
+        # Revisita: o navegador envia a ETag da última resposta (brotli)
+        if method == 'get' and etag:
+            response = client.get(url, headers={'Accept-Encoding': 'br', 'If-None-Match': etag})
+            sizes[name]['revisit'] = len(response.data) if response.status_code != 304 else 0
+        else:
+            sizes[name]['revisit'] = sizes[name]['br']
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=31, help="Linhas do snapshot sintético")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        write_dataset(os.path.join(workdir, 'data'), args.rows)
+        os.chdir(workdir)
+        import dashboard
+
+        sizes = measure_view(dashboard.server.test_client(), dashboard)
+
+    columns = ENCODINGS + ['revisit']
+    print(f"{'recurso':<14}" + ''.join(f"{column:>12}" for column in columns))
+    for name, values in sizes.items():
+        print(f"{name:<14}" + ''.join(f"{values[column]:>12,}" for column in columns))
+    totals = {column: sum(values[column] for values in sizes.values()) for column in columns}
+    print(f"{'total':<14}" + ''.join(f"{totals[column]:>12,}" for column in columns))
+    print(f"\nRedução com brotli: {1 - totals['br'] / totals['identity']:.1%}; "
+          f"revisita: {totals['revisit']:,} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark da preparação de dados (data_prep.prepare_data).
+
+Compara o pipeline vetorizado com a implementação antiga (lambda por linha para a
+região e df.apply por linha para a saúde) e mostra o tempo por linha em cada
+tamanho, para conferir que o custo cresce linearmente.
+
+Uso: python benchmarks/bench_prepare_data.py [--sizes 1000 10000 100000 200000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_prep import COUNTRY_REGION, REGIONS, prepare_data  # noqa: E402
+
+
+def make_dataset(rows, seed=0):
+    """Gera um DataFrame sintético com o mesmo formato da extração (valores em texto)."""
+    rng = np.random.default_rng(seed)
+    countries = np.array(list(COUNTRY_REGION) + ['Atlantis', 'Utopia'])
+    last = rng.uniform(0, 20, rows).round(1)
+    previous = rng.uniform(0.5, 20, rows).round(1)
+    last[rng.random(rows) < 0.02] = np.nan
+    return pd.DataFrame({
+        'Country': rng.choice(countries, rows),
+        'Last': last.astype(str),
+        'Previous': previous.astype(str),
+        'Reference': rng.choice(['Dec/23', 'Sep/24', 'Dec/24', 'Jan/25', 'Feb/25', 'Mar/25'], rows),
+        'Unit': '%',
+    })
+
+
+def legacy_prepare_data(df):
+    """Implementação anterior (por linha), mantida apenas para comparação."""
+    df = df.copy()
+    for col in ['Last', 'Previous']:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df['Change'] = ((df['Last'] - df['Previous']) / df['Previous'] * 100).round(2)
+    df['Region'] = df['Country'].apply(lambda x: next((k for k, v in REGIONS.items() if x in v), 'Other'))
+
+    def calculate_unemployment_health(row):
+        rate = row['Last']
+        if pd.notna(rate):
+            if rate < 5:
+                return 'Bom'
+            elif rate < 10:
+                return 'Médio'
+            else:
+                return 'Ruim'
+        return 'Neutro'
+
+    df['Health'] = df.apply(calculate_unemployment_health, axis=1)
+    return df
+
+
+def best_time(func, df, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000, 100000, 200000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-legacy', action='store_true', help="Não medir a implementação antiga")
+    args = parser.parse_args()
+
+    print(f"{'linhas':>10} {'vetorizado (s)':>15} {'µs/linha':>10} {'antigo (s)':>12} {'ganho':>8}")
+    for rows in args.sizes:
+        df = make_dataset(rows)
+        new = best_time(prepare_data, df, args.repeat)
+
+        if args.skip_legacy:
+            print(f"{rows:>10} {new:>15.4f} {new / rows * 1e6:>10.3f}")
+            continue
+
+        expected = legacy_prepare_data(df)
+        pd.testing.assert_frame_equal(prepare_data(df)[expected.columns], expected)
+        old = best_time(legacy_prepare_data, df, 1)
+        print(f"{rows:>10} {new:>15.4f} {new / rows * 1e6:>10.3f} {old:>12.4f} {old / new:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""Suíte de benchmarks dos caminhos críticos de dados e renderização do dashboard.
+
+Para cada tamanho de base sintética (31, 1k, 10k e 100k linhas por padrão) mede:
+preparação dos dados (prepare_data + optimize_dtypes), carga completa de um snapshot
+pelo dashboard (DataSnapshot: leitura, preparação, índice da tabela e resumo),
+resumo estatístico, conversão para registros do DataTable, uma página da tabela no
+servidor, cada tipo do gráfico principal e a serialização JSON de cada figura.
+
+Os resultados são gravados em JSON; com --compare, são comparados a uma execução
+anterior e o script termina com código 1 se algum caso ficar mais lento que o limite.
+
+Uso: python benchmarks/bench_suite.py [--sizes 31 1000 10000 100000] [--repeat 3]
+                                      [--output resultado.json] [--compare anterior.json]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+os.environ.setdefault('DASHBOARD_RELOAD_INTERVAL', '0')
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd  # noqa: E402
+import plotly  # noqa: E402
+
+from bench_payload_sizes import write_dataset  # noqa: E402
+from bench_prepare_data import make_dataset  # noqa: E402
+from data_prep import TABLE_COLUMNS, optimize_dtypes, prepare_data, summarize, to_records  # noqa: E402
+from snapshots import SNAPSHOT_EXTENSION  # noqa: E402
+
+DEFAULT_SIZES = [31, 1000, 10000, 100000]
+
+# Caso mais lento que a execução anterior por mais que este fator é considerado regressão
+DEFAULT_THRESHOLD = 1.25
+
+
+def measure(func, repeat):
+    """Executa func() `repeat` vezes e retorna (melhor tempo, média) em segundos."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), statistics.mean(timings)
+
+
+def run_suite(sizes, repeat, workdir):
+    """Executa todos os casos e retorna a lista de resultados."""
+    data_dir = os.path.join(workdir, 'data')
+    for rows in sizes:
+        write_dataset(data_dir, rows)
+
+    # O dashboard carrega um snapshot ao ser importado; as medições usam os DataFrames abaixo
+    os.chdir(workdir)
+    import dashboard
+    from data_provider import DataSnapshot
+
+    results = []
+
+    def record(name, rows, func):
+        best, mean = measure(func, repeat)
+        results.append({'name': name, 'rows': rows, 'best_s': round(best, 6), 'mean_s': round(mean, 6)})
+        print(f"{name:<32} {rows:>8} {best * 1000:>12.2f} {mean * 1000:>12.2f}")
+
+    print(f"{'caso':<32} {'linhas':>8} {'melhor (ms)':>12} {'média (ms)':>12}")
+    for rows in sizes:
+        raw = make_dataset(rows)
+        path = os.path.join(data_dir, f'bench_{rows}{SNAPSHOT_EXTENSION}')
+        df = optimize_dtypes(prepare_data(raw))
+        data = DataSnapshot(path)
+
+        record('prepare_data_for_dashboard', rows, lambda: optimize_dtypes(prepare_data(raw)))
+        record('dashboard_load_snapshot', rows, lambda: DataSnapshot(path))
+        record('summarize', rows, lambda: summarize(df))
+        record('to_dict_records', rows, lambda: df[TABLE_COLUMNS].to_dict('records'))
+        record('to_records', rows, lambda: to_records(df, TABLE_COLUMNS))
+        record('table_query_page', rows, lambda: data.table_index.query(
+            3, 10, [{'column_id': 'Change', 'direction': 'desc'}], '{Region} contains "south" && {Last} > 5'
+        ))
+
+        for chart_type in dashboard.CHART_TYPES:
+            figure = dashboard.build_chart(chart_type, df)
+            record(f'chart_{chart_type}', rows, lambda: dashboard.build_chart(chart_type, df))
+            record(f'chart_{chart_type}_json', rows,
+                   lambda: json.dumps(figure, cls=plotly.utils.PlotlyJSONEncoder))
+    return results
+
+
+def compare(results, baseline_path, threshold):
+    """Compara com uma execução anterior e retorna os casos mais lentos que o limite."""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(item['name'], item['rows']): item for item in json.load(f)['results']}
+
+    regressions = []
+    print(f"\nComparação com {baseline_path} (limite {threshold:.2f}x):")
+    for item in results:
+        previous = baseline.get((item['name'], item['rows']))
+        if not previous or not previous['best_s']:
+            continue
+        ratio = item['best_s'] / previous['best_s']
+        if ratio > threshold:
+            regressions.append({**item, 'baseline_s': previous['best_s'], 'ratio': round(ratio, 3)})
+            print(f"  REGRESSÃO {item['name']} ({item['rows']} linhas): {ratio:.2f}x")
+    if not regressions:
+        print("  Nenhuma regressão encontrada")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="Arquivo JSON de resultados (padrão: benchmarks/results/<data>.json)")
+    parser.add_argument('--compare', help="Resultado anterior (JSON) para detectar regressões")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Fator de lentidão considerado regressão (padrão: 1.25)")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(
+        BASE_DIR, 'benchmarks', 'results', f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    output = os.path.abspath(output)
+    baseline = os.path.abspath(args.compare) if args.compare else None
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = run_suite(args.sizes, args.repeat, workdir)
+        os.chdir(BASE_DIR)
+
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pandas': pd.__version__,
+        'plotly': plotly.__version__,
+        'repeat': args.repeat,
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResultados gravados em {output}")
+
+    if baseline and compare(results, baseline, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
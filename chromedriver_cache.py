@@ -0,0 +1,138 @@
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Pasta do cache local do ChromeDriver (pode ser alterada pela variável CHROMEDRIVER_CACHE_DIR)
+CACHE_DIR = os.environ.get(
+    'CHROMEDRIVER_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'dashboard-desemprego', 'chromedriver')
+)
+MANIFEST_NAME = 'manifest.json'
+
+# Executáveis e chaves de registro usados para descobrir a versão do Chrome instalada
+CHROME_BINARIES = [
+    'google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+]
+CHROME_REGISTRY_KEYS = [
+    r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon',
+    r'HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon',
+]
+
+_VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+_resolved_path = None
+_lock = threading.Lock()
+
+
+def _run_version_command(command):
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = _VERSION_PATTERN.search(output or '')
+    return match.group(0) if match else None
+
+
+def detect_chrome_version():
+    """Descobre a versão do Chrome instalado localmente, sem acessar a rede."""
+    binary = os.environ.get('CHROME_BINARY')
+    candidates = [binary] if binary else CHROME_BINARIES
+
+    if sys.platform.startswith('win') and not binary:
+        for key in CHROME_REGISTRY_KEYS:
+            version = _run_version_command(['reg', 'query', key, '/v', 'version'])
+            if version:
+                return version
+
+    for candidate in candidates:
+        version = _run_version_command([candidate, '--version'])
+        if version:
+            return version
+    return None
+
+
+def _major(version):
+    return version.split('.')[0] if version else None
+
+
+def load_manifest(cache_dir=CACHE_DIR):
+    """Lê o manifest do cache (ou retorna None se não existir ou estiver corrompido)."""
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(manifest, cache_dir):
+    path = os.path.join(cache_dir, MANIFEST_NAME)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _install_with_webdriver_manager(chrome_version, cache_dir):
+    """Baixa o ChromeDriver pelo webdriver-manager e o fixa no cache local."""
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    downloaded_path = ChromeDriverManager().install()
+    driver_version = _run_version_command([downloaded_path, '--version'])
+
+    target_dir = os.path.join(cache_dir, driver_version or _major(chrome_version) or 'unknown')
+    os.makedirs(target_dir, exist_ok=True)
+    driver_path = os.path.join(target_dir, os.path.basename(downloaded_path))
+    shutil.copy2(downloaded_path, driver_path)
+
+    _write_manifest({
+        'chrome_version': chrome_version,
+        'driver_version': driver_version,
+        'driver_path': driver_path,
+    }, cache_dir)
+    logger.info(f"ChromeDriver {driver_version} fixado no cache em {driver_path}")
+    return driver_path
+
+
+def resolve_chromedriver(cache_dir=CACHE_DIR):
+    """Retorna o caminho do ChromeDriver, usando o cache local sempre que possível.
+
+    Ordem de resolução:
+    1. Variável CHROMEDRIVER_PATH, se definida.
+    2. Caminho já resolvido neste processo.
+    3. Manifest do cache, se a versão principal do driver for a mesma do Chrome
+       instalado (ou se não for possível detectar o Chrome).
+    4. webdriver-manager (acessa a rede), e o resultado é gravado no cache.
+    """
+    global _resolved_path
+
+    pinned = os.environ.get('CHROMEDRIVER_PATH')
+    if pinned:
+        return pinned
+
+    with _lock:
+        if _resolved_path and os.path.exists(_resolved_path):
+            return _resolved_path
+
+        chrome_version = detect_chrome_version()
+        manifest = load_manifest(cache_dir)
+
+        if manifest and os.path.exists(manifest.get('driver_path') or ''):
+            driver_major = _major(manifest.get('driver_version') or manifest.get('chrome_version'))
+            if chrome_version is None or driver_major == _major(chrome_version):
+                _resolved_path = manifest['driver_path']
+                return _resolved_path
+            logger.info(
+                f"ChromeDriver em cache ({manifest.get('driver_version')}) não corresponde "
+                f"ao Chrome instalado ({chrome_version}), atualizando"
+            )
+
+        os.makedirs(cache_dir, exist_ok=True)
+        _resolved_path = _install_with_webdriver_manager(chrome_version, cache_dir)
+        return _resolved_path
@@ -1,939 +1,1222 @@
-import dash
-from dash import dcc, html, Input, Output, dash_table
-import dash_bootstrap_components as dbc
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import os
-import glob
-import warnings
-from datetime import datetime
-
-# Suprimir o aviso de depreciação relacionado à análise de datas
-warnings.filterwarnings("ignore", category=DeprecationWarning)
-
-# Encontrar o arquivo CSV mais recente na pasta data
-list_of_files = glob.glob('data/*.csv')
-latest_file = max(list_of_files, key=os.path.getctime) if list_of_files else None
-
-if not latest_file:
-    raise FileNotFoundError("Nenhum arquivo CSV encontrado na pasta 'data'. Execute main.py primeiro para extrair os dados.")
-
-# Carregar os dados
-df = pd.read_csv(latest_file)
-
-# Converter colunas numéricas
-for col in ['Last', 'Previous']:
-    if col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
-
-# Calcular a variação percentual
-df['Change'] = ((df['Last'] - df['Previous']) / df['Previous'] * 100).round(2)
-
-# Definir regiões para análise
-regions = {
-    'North America': ['Canada', 'United States', 'Mexico'],
-    'Central America': ['Belize', 'Costa Rica', 'El Salvador', 'Guatemala', 'Honduras', 'Nicaragua', 'Panama'],
-    'Caribbean': ['Bahamas', 'Barbados', 'Cayman Islands', 'Cuba', 'Dominican Republic', 'Haiti', 'Jamaica', 'Puerto Rico', 'Trinidad and Tobago'],
-    'South America': ['Argentina', 'Bolivia', 'Brazil', 'Chile', 'Colombia', 'Ecuador', 'Guyana', 'Paraguay', 'Peru', 'Suriname', 'Uruguay', 'Venezuela']
-}
-
-# Adicionar coluna de região
-df['Region'] = df['Country'].apply(lambda x: next((k for k, v in regions.items() if x in v), 'Other'))
-
-# Adicionar coluna de "saúde" do indicador
-def calculate_unemployment_health(row):
-    rate = row['Last']
-    if pd.notna(rate):
-        if rate < 5:
-            return 'Bom'
-        elif rate < 10:
-            return 'Médio'
-        else:
-            return 'Ruim'
-    return 'Neutro'
-
-df['Health'] = df.apply(calculate_unemployment_health, axis=1)
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-# Nova paleta de cores com quadros mais escuros e texto branco
-dark_theme_colors = {
-    'background': '#121212',          # Fundo muito escuro
-    'card_bg': 'rgba(18, 18, 18, 0.95)', # Fundo dos cards mais escuro e quase opaco
-    'card_bg_lighter': 'rgba(30, 30, 30, 0.95)', # Fundo dos cards um pouco mais claro
-    'primary': '#BB86FC',             # Roxo/lilás
-    'secondary': '#03DAC6',           # Verde-água
-    'accent1': '#CF6679',             # Rosa
-    'accent2': '#4dabf5',             # Azul
-    'accent3': '#FFB74D',             # Laranja
-    'text': '#FFFFFF',                # Texto branco
-    'light_text': '#E0E0E0',          # Texto levemente acinzentado
-    'gradient_start': '#121212',      # Gradiente início (escuro)
-    'gradient_end': '#1F1F1F',        # Gradiente fim (um pouco menos escuro)
-    'positive': '#4CAF50',            # Verde para valores positivos
-    'negative': '#F44336',            # Vermelho para valores negativos
-    'border': '#333333',              # Cor da borda dos cards
-}
-
-# Paleta para gráficos
-
-
-
-
-
-
-dark_theme_palette = [
-    dark_theme_colors['primary'], 
-    dark_theme_colors['secondary'], 
-    dark_theme_colors['accent1'], 
-    dark_theme_colors['accent2'], 
-    dark_theme_colors['accent3']
-]
-
-
-# Manter a mesma imagem de fundo (cityscape noturno com pôr do sol)
-background_image = 'https://images.unsplash.com/photo-1477959858617-67f85cf4f1df?ixlib=rb-4.0.3&auto=format&fit=crop&w=1920&q=80'
-
-# Inicializar o app Dash com tema Bootstrap e folha de estilo personalizada
-app = dash.Dash(
-    __name__, 
-    external_stylesheets=[
-        dbc.themes.DARKLY,  # Tema base escuro
-
-        'https://fonts.googleapis.com/css2?family=Open+Sans:wght@300;400;600;700&display=swap'  # Fonte Sans-serif
-    ]
-)
-
-# Estilo CSS personalizado para o dropdown escuro
-app.index_string = '''
-<!DOCTYPE html>
-<html>
-    <head>
-        {%metas%}
-        <title>{%title%}</title>
-        {%favicon%}
-        {%css%}
-        <style>
-            /* Estilo para o dropdown escuro */
-            .Select-control, .Select-menu-outer, .Select-menu, .Select-option, .Select-value {
-
-                background-color: #121212 !important;
-                color: white !important;
-            }
-            .Select-value-label, .Select-option {
-                color: white !important;
-            }
-            .Select-control, .Select-menu-outer {
-
-                border: 1px solid #333333 !important;
-            }
-            .Select-option.is-focused, .Select-option:hover {
-
-                background-color: #1F1F1F !important;
-            }
-            .Select-arrow {
-
-                border-color: #BB86FC transparent transparent !important;
-            }
-            .Select.is-open > .Select-control .Select-arrow {
-
-                border-color: transparent transparent #BB86FC !important;
-            }
-            .dash-dropdown-dark .Select-value-label {
-                color: white !important;
-            }
-            
-            /* Estilo global para texto */
-            body {
-                font-family: 'Open Sans', sans-serif !important;
-            }
-        </style>
-    </head>
-    <body>
-        {%app_entry%}
-        <footer>
-            {%config%}
-            {%scripts%}
-            {%renderer%}
-        </footer>
-    </body>
-</html>
-'''
-
-server = app.server
-
-# Título do dashboard
-
-app.title = "Dashboard de Desemprego nas Américas"
-
-# Estilo personalizado para o container principal
-app_style = {
-
-    'background': f'linear-gradient(rgba(18, 18, 18, 0.92), rgba(31, 31, 31, 0.92)), url({background_image})',
-    'backgroundSize': 'cover',
-    'backgroundAttachment': 'fixed',
-    'backgroundPosition': 'center',
-    'minHeight': '100vh',
-
-
-    'fontFamily': '"Open Sans", sans-serif',
-    'color': dark_theme_colors['text'],
-    'padding': '20px',
-}
-
-
-# Estilo para os cards (mais escuros)
-card_style = {
-
-
-
-
-    'backgroundColor': dark_theme_colors['card_bg'],
-    'borderRadius': '8px',
-    'boxShadow': '0 4px 20px rgba(0, 0, 0, 0.5)',
-    'border': f'1px solid {dark_theme_colors["border"]}',
-    'marginBottom': '20px',
-    'backdropFilter': 'blur(10px)',
-
-    'padding': '15px'
-}
-
-card_header_style = {
-    'backgroundColor': 'transparent',
-
-
-    'borderBottom': f'1px solid {dark_theme_colors["border"]}',
-    'color': dark_theme_colors['primary'],
-    'fontWeight': '600',
-    'fontSize': '1.2rem',
-    'padding': '15px 20px',
-    'fontFamily': '"Open Sans", sans-serif',
-}
-
-# Estilo para os contêineres de gráficos
-graph_container_style = {
-
-
-    'backgroundColor': 'rgba(18, 18, 18, 0.8)',
-    'borderRadius': '8px',
-    'boxShadow': '0 4px 20px rgba(0, 0, 0, 0.3)',
-    'padding': '15px'
-}
-
-# Layout do dashboard
-app.layout = dbc.Container([
-    # Div de background
-    html.Div(style={
-        'position': 'fixed',
-        'top': 0,
-        'left': 0,
-        'right': 0,
-        'bottom': 0,
-        'backgroundImage': f'url({background_image})',
-        'backgroundSize': 'cover',
-        'backgroundPosition': 'center',
-        'zIndex': -1,
-        'opacity': 0.5,
-    }),
-    
-    # Cabeçalho
-    dbc.Row([
-        dbc.Col([
-            html.Div([
-                html.H1("Taxa de Desemprego nas Américas", 
-                        style={
-
-                            'fontFamily': '"Open Sans", sans-serif',
-                            'fontWeight': '700',
-
-                            'color': dark_theme_colors['text'],
-                            'textAlign': 'center',
-                            'marginTop': '20px',
-                            'marginBottom': '10px',
-                            'fontSize': '2.5rem',
-
-
-                            'textShadow': '0 0 20px rgba(0, 0, 0, 0.7)',
-                            'letterSpacing': '1px',
-                        }),
-                html.P([
-                    "Análise comparativa das taxas de desemprego nos países das Américas - ",
-                    html.A(
-                        "Trading Economics", 
-                        href="https://tradingeconomics.com/country-list/unemployment-rate?continent=america",
-                        target="_blank",
-                        style={
-
-                            'color': dark_theme_colors['primary'],
-                            'textDecoration': 'underline'
-                        }
-                    )
-
-                ], className="text-center", style={'color': dark_theme_colors['light_text']}),
-                html.Div(style={
-
-                    'borderBottom': f'2px solid {dark_theme_colors["primary"]}',
-                    'width': '60%',
-                    'margin': '0 auto 30px auto',
-
-                    'boxShadow': f'0 0 10px {dark_theme_colors["primary"]}',
-                })
-            ], style={
-
-                'backgroundColor': 'rgba(18, 18, 18, 0.9)',
-                'backdropFilter': 'blur(5px)',
-                'padding': '20px',
-
-
-                'borderRadius': '8px',
-                'boxShadow': '0 4px 30px rgba(0, 0, 0, 0.3)',
-                'marginBottom': '30px',
-
-                'border': f'1px solid {dark_theme_colors["border"]}',
-            })
-        ], width=12, style={'marginBottom': '20px'})
-    ], className='mb-4'),
-    
-    # Cards de indicadores principais
-    dbc.Row([
-        # Card de Média de Desemprego
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H5("Média de Desemprego", className="card-title", style={
-                        'textAlign': 'center',
-
-                        'color': dark_theme_colors['primary'],
-                        'fontWeight': '600',
-                        'marginBottom': '10px',
-
-                        'fontFamily': '"Open Sans", sans-serif',
-                    }),
-                    html.H3(
-                        f"{df['Last'].mean():.2f}%", 
-                        style={
-                            'textAlign': 'center',
-
-                            'color': dark_theme_colors['text'],
-                            'fontSize': '2.5rem',
-                            'fontWeight': '700',
-                            'margin': '15px 0',
-
-                            'fontFamily': '"Open Sans", sans-serif',
-                        }
-                    ),
-                    html.Div([
-
-                        html.Span("vs anterior: ", style={'fontSize': '0.9rem', 'color': dark_theme_colors['light_text']}),
-                        html.Span(
-                            f"{df['Last'].mean() - df['Previous'].mean():+.2f}%",
-                            style={
-
-                                'color': dark_theme_colors['negative'] if df['Last'].mean() > df['Previous'].mean() else dark_theme_colors['positive'],
-                                'fontWeight': '600',
-                                'fontSize': '0.9rem',
-
-                            }
-                        )
-                    ], style={'textAlign': 'center'})
-                ])
-
-
-            ], style={**card_style, 'height': '100%', 'border': f'1px solid {dark_theme_colors["border"]}'}),
-        ], width=12, md=6, lg=3, className='mb-4'),
-        
-        # Card de Maior Taxa
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H5("Maior Taxa", className="card-title", style={
-                        'textAlign': 'center',
-
-                        'color': dark_theme_colors['secondary'],
-                        'fontWeight': '600',
-                        'marginBottom': '10px',
-
-                        'fontFamily': '"Open Sans", sans-serif',
-                    }),
-                    html.H3(
-                        f"{df['Last'].max():.2f}%", 
-                        style={
-                            'textAlign': 'center',
-
-                            'color': dark_theme_colors['text'],
-                            'fontSize': '2.5rem',
-                            'fontWeight': '700',
-                            'margin': '15px 0',
-
-                            'fontFamily': '"Open Sans", sans-serif',
-                        }
-                    ),
-                    html.Div([
-
-                        html.Span("País: ", style={'fontSize': '0.9rem', 'color': dark_theme_colors['light_text']}),
-                        html.Span(
-                            f"{df.loc[df['Last'].idxmax(), 'Country']}",
-                            style={
-
-                                'color': dark_theme_colors['text'],
-                                'fontWeight': '600',
-                                'fontSize': '0.9rem',
-
-                            }
-                        )
-                    ], style={'textAlign': 'center'})
-                ])
-
-
-            ], style={**card_style, 'height': '100%', 'border': f'1px solid {dark_theme_colors["border"]}'}),
-        ], width=12, md=6, lg=3, className='mb-4'),
-        
-        # Card de Menor Taxa
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H5("Menor Taxa", className="card-title", style={
-                        'textAlign': 'center',
-
-                        'color': dark_theme_colors['accent1'],
-                        'fontWeight': '600',
-                        'marginBottom': '10px',
-
-                        'fontFamily': '"Open Sans", sans-serif',
-                    }),
-                    html.H3(
-                        f"{df['Last'].min():.2f}%", 
-                        style={
-                            'textAlign': 'center',
-
-                            'color': dark_theme_colors['text'],
-                            'fontSize': '2.5rem',
-                            'fontWeight': '700',
-                            'margin': '15px 0',
-
-                            'fontFamily': '"Open Sans", sans-serif',
-                        }
-                    ),
-                    html.Div([
-
-                        html.Span("País: ", style={'fontSize': '0.9rem', 'color': dark_theme_colors['light_text']}),
-                        html.Span(
-                            f"{df.loc[df['Last'].idxmin(), 'Country']}",
-                            style={
-
-                                'color': dark_theme_colors['text'],
-                                'fontWeight': '600',
-                                'fontSize': '0.9rem',
-
-                            }
-                        )
-                    ], style={'textAlign': 'center'})
-                ])
-
-
-            ], style={**card_style, 'height': '100%', 'border': f'1px solid {dark_theme_colors["border"]}'}),
-        ], width=12, md=6, lg=3, className='mb-4'),
-        
-        # Card de Melhora/Piora
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H5("Tendência", className="card-title", style={
-                        'textAlign': 'center',
-
-                        'color': dark_theme_colors['accent3'],
-                        'fontWeight': '600',
-                        'marginBottom': '10px',
-
-                        'fontFamily': '"Open Sans", sans-serif',
-                    }),
-                    html.H3([
-                        html.Span(f"{(df['Change'] < 0).sum()}", 
-
-
-                                 style={'color': dark_theme_colors['positive']}),
-                        html.Span(" / ", style={'color': dark_theme_colors['text']}),
-                        html.Span(f"{(df['Change'] > 0).sum()}", 
-
-                                 style={'color': dark_theme_colors['negative']})
-                    ], style={
-                        'textAlign': 'center',
-                        'fontSize': '2.5rem',
-                        'fontWeight': '700',
-                        'margin': '15px 0',
-
-                        'fontFamily': '"Open Sans", sans-serif',
-                    }),
-                    html.Div([
-                        html.Span("Melhora / Piora", style={
-
-                            'color': dark_theme_colors['light_text'],
-                            'fontWeight': '600',
-                            'fontSize': '0.9rem',
-
-                        })
-                    ], style={'textAlign': 'center'})
-                ])
-
-
-            ], style={**card_style, 'height': '100%', 'border': f'1px solid {dark_theme_colors["border"]}'}),
-        ], width=12, md=6, lg=3, className='mb-4')
-    ], className='g-3'),
-    
-    # Seleção de Visualização
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader("Selecione o Tipo de Visualização", style=card_header_style),
-                dbc.CardBody([
-                    dcc.Dropdown(
-                        id='chart-type',
-                        options=[
-                            {'label': 'Mapa de Calor por Região', 'value': 'heatmap'},
-                            {'label': 'Gráfico de Barras - Taxa Atual', 'value': 'bar_current'},
-                            {'label': 'Gráfico de Barras - Comparação Atual vs Anterior', 'value': 'bar_compare'},
-                            {'label': 'Gráfico de Dispersão - Taxa Atual vs Variação', 'value': 'scatter'},
-                            {'label': 'Treemap por Região', 'value': 'treemap'},
-                            {'label': 'Top 5 Maiores Taxas', 'value': 'top5_high'},
-                            {'label': 'Top 5 Menores Taxas', 'value': 'top5_low'}
-                        ],
-                        value='bar_current',
-                        clearable=False,
-                        className='dash-dropdown-dark',
-                        style={
-
-
-                            'backgroundColor': dark_theme_colors['background'],
-                            'color': dark_theme_colors['text'],
-                            'borderRadius': '8px',
-
-                            'border': f'1px solid {dark_theme_colors["border"]}',
-                        }
-                    )
-
-                ], style={'backgroundColor': 'rgba(18, 18, 18, 0.8)'})
-            ], style=card_style)
-        ], width=12, className='mb-4')
-    ]),
-    
-    # Visualização Principal
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader("Visualização", style=card_header_style),
-                dbc.CardBody([
-                    dcc.Graph(
-                        id='main-chart', 
-                        style={'height': '600px'},
-                        config={'displayModeBar': False}
-                    )
-                ], style=graph_container_style)
-            ], style=card_style)
-        ], width=12, className='mb-4')
-    ]),
-    
-    # Tabela de Dados
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader("Tabela de Dados - Taxas de Desemprego por País", style=card_header_style),
-                dbc.CardBody([
-                    dash_table.DataTable(
-                        id='data-table',
-                        columns=[
-                            {'name': 'País', 'id': 'Country'},
-                            {'name': 'Taxa Atual (%)', 'id': 'Last'},
-                            {'name': 'Taxa Anterior (%)', 'id': 'Previous'},
-                            {'name': 'Variação (%)', 'id': 'Change'},
-                            {'name': 'Região', 'id': 'Region'},
-                            {'name': 'Situação', 'id': 'Health'},
-                            {'name': 'Referência', 'id': 'Reference'}
-                        ],
-                        data=df.to_dict('records'),
-                        sort_action='native',
-                        filter_action='native',
-                        page_size=10,
-                        style_table={'overflowX': 'auto'},
-                        style_cell={
-                            'textAlign': 'left',
-                            'padding': '8px',
-                            'minWidth': '100px',
-
-
-
-                            'backgroundColor': 'rgba(18, 18, 18, 0.9)',
-                            'color': dark_theme_colors['text'],
-                            'border': f'1px solid {dark_theme_colors["border"]}',
-                            'fontFamily': '"Open Sans", sans-serif',
-                        },
-                        style_header={
-
-                            'backgroundColor': 'rgba(18, 18, 18, 0.95)',
-                            'fontWeight': 'bold',
-
-
-                            'color': dark_theme_colors['primary'],
-                            'border': f'1px solid {dark_theme_colors["border"]}',
-                            'fontFamily': '"Open Sans", sans-serif',
-                        },
-                        style_data_conditional=[
-                            {
-                                'if': {'row_index': 'odd'},
-
-                                'backgroundColor': 'rgba(30, 30, 30, 0.9)',
-                            },
-                            {
-                                'if': {'column_id': 'Health', 'filter_query': '{Health} = "Bom"'},
-
-
-                                'backgroundColor': 'rgba(76, 175, 80, 0.2)',
-                                'color': dark_theme_colors['positive']
-                            },
-                            {
-                                'if': {'column_id': 'Health', 'filter_query': '{Health} = "Médio"'},
-
-
-                                'backgroundColor': 'rgba(255, 193, 7, 0.2)',
-                                'color': '#FFB74D'
-                            },
-                            {
-                                'if': {'column_id': 'Health', 'filter_query': '{Health} = "Ruim"'},
-
-
-                                'backgroundColor': 'rgba(244, 67, 54, 0.2)',
-                                'color': dark_theme_colors['negative']
-                            },
-                            {
-                                'if': {'column_id': 'Change', 'filter_query': '{Change} < 0'},
-
-                                'color': dark_theme_colors['positive']
-                            },
-                            {
-                                'if': {'column_id': 'Change', 'filter_query': '{Change} > 0'},
-
-                                'color': dark_theme_colors['negative']
-                            }
-                        ]
-                    )
-                ], style=graph_container_style)
-            ], style=card_style)
-        ], width=12, className='mb-4')
-    ]),
-    
-    # Resumo Estatístico
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader("Resumo Estatístico", style=card_header_style),
-                dbc.CardBody([
-                    html.Div([
-                        html.P(f"Média de Desemprego: {df['Last'].mean():.2f}%", 
-
-                               style={'color': dark_theme_colors['text'], 'fontWeight': '500', 'fontFamily': '"Open Sans", sans-serif'}),
-                        html.P(f"Mediana de Desemprego: {df['Last'].median():.2f}%", 
-
-                               style={'color': dark_theme_colors['text'], 'fontWeight': '500', 'fontFamily': '"Open Sans", sans-serif'}),
-                        html.P(f"Maior Taxa: {df['Last'].max():.2f}% ({df.loc[df['Last'].idxmax(), 'Country']})", 
-
-                               style={'color': dark_theme_colors['text'], 'fontWeight': '500', 'fontFamily': '"Open Sans", sans-serif'}),
-                        html.P(f"Menor Taxa: {df['Last'].min():.2f}% ({df.loc[df['Last'].idxmin(), 'Country']})", 
-
-                               style={'color': dark_theme_colors['text'], 'fontWeight': '500', 'fontFamily': '"Open Sans", sans-serif'}),
-                        html.P([
-                            "Países com Melhora: ",
-                            html.Span(f"{(df['Change'] < 0).sum()} ({(df['Change'] < 0).sum() / len(df) * 100:.1f}%)", 
-
-
-                                     style={'color': dark_theme_colors['positive'], 'fontWeight': '600'})
-                        ], style={'color': dark_theme_colors['text'], 'fontWeight': '500', 'fontFamily': '"Open Sans", sans-serif'}),
-                        html.P([
-                            "Países com Piora: ",
-                            html.Span(f"{(df['Change'] > 0).sum()} ({(df['Change'] > 0).sum() / len(df) * 100:.1f}%)", 
-
-
-                                     style={'color': dark_theme_colors['negative'], 'fontWeight': '600'})
-                        ], style={'color': dark_theme_colors['text'], 'fontWeight': '500', 'fontFamily': '"Open Sans", sans-serif'})
-                    ], style={'padding': '10px'})
-                ], style=graph_container_style)
-            ], style=card_style)
-        ], width=12, className='mb-4')
-    ]),
-    
-    # Rodapé
-    dbc.Row([
-        dbc.Col([
-            html.Footer([
-                html.P([
-                    "Fonte: Trading Economics - Dados extraídos em ",
-                    html.Span(datetime.now().strftime("%d/%m/%Y %H:%M:%S"), 
-                             style={'fontWeight': '500'})
-
-                ], className="text-center", style={'color': dark_theme_colors['light_text'], 'fontFamily': '"Open Sans", sans-serif'}),
-                html.P("Dashboard desenvolvido com Python, Dash e Plotly", 
-
-                       className="text-center", style={'color': dark_theme_colors['light_text'], 'fontFamily': '"Open Sans", sans-serif'})
-            ], style={
-                'padding': '20px 0',
-
-                'borderTop': f'1px solid {dark_theme_colors["border"]}',
-                'marginTop': '20px',
-
-            })
-        ], width=12)
-    ])
-], fluid=True, style=app_style)
-
-# Callback para atualizar o gráfico principal
-@app.callback(
-    Output('main-chart', 'figure'),
-    [Input('chart-type', 'value')]
-)
-def update_chart(chart_type):
-    """Atualiza o gráfico principal com base no tipo selecionado."""
-    if chart_type == 'heatmap':
-        # Criar um pivot table para o mapa de calor
-        pivot_df = df.pivot_table(
-            values='Last', 
-            index='Country', 
-            columns='Region', 
-            aggfunc='first'
-        ).fillna(0)
-        
-        fig = px.imshow(
-            pivot_df,
-            labels=dict(x="Região", y="País", color="Taxa de Desemprego (%)"),
-            title="Mapa de Calor das Taxas de Desemprego por Região",
-            color_continuous_scale='YlOrRd'
-        )
-        
-        fig.update_layout(
-
-            plot_bgcolor='rgba(18, 18, 18, 0.3)',
-            paper_bgcolor='rgba(0,0,0,0)',
-
-
-            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            margin=dict(l=40, r=40, t=50, b=40),
-        )
-        
-        return fig
-        
-    elif chart_type == 'bar_current':
-        # Ordenar por taxa atual
-        sorted_df = df.sort_values('Last', ascending=False)
-        
-        fig = px.bar(
-            sorted_df,
-            x='Country',
-            y='Last',
-            color='Region',
-            title="Taxa de Desemprego Atual por País",
-            labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'},
-
-            color_discrete_sequence=dark_theme_palette
-        )
-        
-        fig.update_layout(
-
-            plot_bgcolor='rgba(18, 18, 18, 0.3)',
-            paper_bgcolor='rgba(0,0,0,0)',
-
-
-            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            xaxis_tickangle=-45,
-            margin=dict(l=40, r=40, t=50, b=80),
-            xaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
-            yaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'}
-        )
-        
-        return fig
-        
-    elif chart_type == 'bar_compare':
-        # Selecionar os 15 principais países para melhor visualização
-        top_df = df.sort_values('Last', ascending=False).head(15)
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
-            x=top_df['Country'],
-            y=top_df['Last'],
-            name='Taxa Atual',
-            marker_color=dark_theme_colors['primary']
-        ))
-        
-        fig.add_trace(go.Bar(
-            x=top_df['Country'],
-            y=top_df['Previous'],
-            name='Taxa Anterior',
-            marker_color=dark_theme_colors['secondary']
-        ))
-        
-        fig.update_layout(
-            title="Comparação: Taxa de Desemprego Atual vs Anterior (Top 15)",
-            xaxis_title="País",
-            yaxis_title="Taxa de Desemprego (%)",
-            barmode='group',
-            xaxis_tickangle=-45,
-            plot_bgcolor='rgba(18, 18, 18, 0.3)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            margin=dict(l=40, r=40, t=50, b=80),
-            xaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
-            yaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
-            legend=dict(
-                font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-                bgcolor='rgba(18, 18, 18, 0.7)',
-                bordercolor=dark_theme_colors['border']
-            )
-        )
-        
-        return fig
-        
-    elif chart_type == 'scatter':
-        fig = px.scatter(
-            df,
-            x='Last',
-            y='Change',
-            color='Region',
-            size='Last',
-            hover_name='Country',
-            title="Relação entre Taxa Atual e Variação Percentual",
-            labels={
-                'Last': 'Taxa de Desemprego Atual (%)',
-                'Change': 'Variação em relação à taxa anterior (%)'
-            },
-            color_discrete_sequence=dark_theme_palette
-        )
-        
-        # Adicionar linha horizontal em y=0 para referência
-        fig.add_hline(y=0, line_dash="dash", line_color="rgba(255, 255, 255, 0.5)")
-        
-        fig.update_layout(
-            plot_bgcolor='rgba(18, 18, 18, 0.3)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            margin=dict(l=40, r=40, t=50, b=40),
-            xaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
-            yaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
-            legend=dict(
-                font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-                bgcolor='rgba(18, 18, 18, 0.7)',
-                bordercolor=dark_theme_colors['border']
-            )
-        )
-        
-        return fig
-        
-    elif chart_type == 'treemap':
-        fig = px.treemap(
-            df,
-            path=[px.Constant("Américas"), 'Region', 'Country'],
-            values='Last',
-            color='Last',
-            hover_data=['Previous', 'Change'],
-            color_continuous_scale=[dark_theme_colors['secondary'], dark_theme_colors['primary']],
-            title="Treemap das Taxas de Desemprego por Região e País"
-        )
-        
-        fig.update_layout(
-            plot_bgcolor='rgba(18, 18, 18, 0.3)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            margin=dict(l=20, r=20, t=50, b=20),
-        )
-        
-        return fig
-        
-    elif chart_type == 'top5_high':
-        # Top 5 maiores taxas
-        top5_df = df.sort_values('Last', ascending=False).head(5)
-        
-        fig = px.bar(
-            top5_df,
-            x='Country',
-            y='Last',
-            color='Last',
-            text='Last',
-            title="Top 5 Países com Maiores Taxas de Desemprego",
-            labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'},
-            color_continuous_scale=[dark_theme_colors['secondary'], dark_theme_colors['primary']]
-        )
-        
-        fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-        
-        fig.update_layout(
-            plot_bgcolor='rgba(18, 18, 18, 0.3)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            margin=dict(l=40, r=40, t=50, b=40),
-            xaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
-            yaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
-            coloraxis_showscale=False
-        )
-        
-        return fig
-        
-    elif chart_type == 'top5_low':
-        # Top 5 menores taxas
-        top5_df = df.sort_values('Last').head(5)
-        
-        fig = px.bar(
-            top5_df,
-            x='Country',
-            y='Last',
-            color='Last',
-            text='Last',
-            title="Top 5 Países com Menores Taxas de Desemprego",
-            labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'},
-            color_continuous_scale=[dark_theme_colors['accent3'], dark_theme_colors['secondary']]
-        )
-        
-        fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-        
-        fig.update_layout(
-            plot_bgcolor='rgba(18, 18, 18, 0.3)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
-            margin=dict(l=40, r=40, t=50, b=40),
-            xaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
-            yaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
-            coloraxis_showscale=False
-        )
-        
-        return fig
-    
-    # Caso padrão
-    return px.bar(
-        df.sort_values('Last', ascending=False),
-        x='Country',
-        y='Last',
-        title="Taxa de Desemprego Atual por País",
-        labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'},
-        color_discrete_sequence=[dark_theme_colors['primary']]
-    )
-
-if __name__ == '__main__':
-    app.run(debug=True)
+import dash
+from dash import dcc, html, Input, Output, State, dash_table
+import dash_bootstrap_components as dbc
+import plotly.express as px
+import plotly.graph_objects as go
+import json
+import os
+import warnings
+import plotly
+from flask import Response, abort, jsonify, request
+
+from data_prep import TABLE_COLUMNS, to_records
+from data_provider import DEFAULT_POLL_INTERVAL, DataProvider
+from figure_cache import FigureCache
+from http_caching import DEFAULT_COMPRESS_MIN_SIZE, etag_matches, install_compression, install_version_validators
+from metrics import UNKNOWN_LABEL, MetricsRegistry, instrument_dash
+from static_assets import ASSETS_IGNORE, StaticAssets
+
+# Suprimir o aviso de depreciação relacionado à análise de datas
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+# Dados do dashboard: o snapshot mais recente da pasta data (Parquet, ou CSV de execuções
+# antigas), já preparado e com tipos compactos. Novos snapshots são carregados em segundo
+# plano sem reiniciar o servidor (DASHBOARD_RELOAD_INTERVAL=0 desativa a verificação)
+data_provider = DataProvider(
+    'data', poll_interval=float(os.environ.get('DASHBOARD_RELOAD_INTERVAL', DEFAULT_POLL_INTERVAL))
+)
+
+# Cache das figuras do gráfico principal
+THEME = 'dark'
+figure_cache = FigureCache()
+
+# Ao trocar de snapshot, descarta as figuras das versões anteriores
+data_provider.on_change(lambda data: figure_cache.invalidate(keep_version=data.version))
+data_provider.start()
+
+# Tipos de gráfico disponíveis no seletor
+CHART_TYPES = ['heatmap', 'bar_current', 'bar_compare', 'scatter', 'treemap', 'top5_high', 'top5_low']
+DEFAULT_CHART_TYPE = 'bar_current'
+
+# Troca de gráfico no navegador: todas as figuras são enviadas uma vez por versão dos dados
+# (desative com DASHBOARD_CLIENTSIDE_CHARTS=0 para gerar cada gráfico no servidor)
+CLIENTSIDE_CHARTS = os.environ.get('DASHBOARD_CLIENTSIDE_CHARTS', '1') == '1'
+
+# Paginação, ordenação e filtro da tabela no servidor: o navegador recebe só a página visível
+# (desative com DASHBOARD_SERVER_SIDE_TABLE=0 para enviar todas as linhas ao navegador)
+SERVER_SIDE_TABLE = os.environ.get('DASHBOARD_SERVER_SIDE_TABLE', '1') == '1'
+TABLE_PAGE_SIZE = 10
+
+# Intervalo (segundos) entre as consultas do navegador à versão dos dados (0 desativa)
+VERSION_POLL_INTERVAL = float(os.environ.get('DASHBOARD_VERSION_POLL_INTERVAL', 30))
+
+
+def table_data_props(data):
+    """Propriedades de dados do DataTable para o snapshot informado."""
+    if SERVER_SIDE_TABLE:
+        # A primeira página já vai no layout; as demais são pedidas pelo callback update_table
+        first_page, page_count = data.table_index.query(0, TABLE_PAGE_SIZE)
+        return dict(
+            data=first_page,
+            page_action='custom',
+            sort_action='custom',
+            filter_action='custom',
+            page_current=0,
+            page_count=page_count,
+        )
+    return dict(
+        data=to_records(data.df, TABLE_COLUMNS),
+        sort_action='native',
+        filter_action='native',
+    )
+
+
+# Nova paleta de cores com quadros mais escuros e texto branco
+dark_theme_colors = {
+    'background': '#121212',          # Fundo muito escuro
+    'card_bg': 'rgba(18, 18, 18, 0.95)', # Fundo dos cards mais escuro e quase opaco
+    'card_bg_lighter': 'rgba(30, 30, 30, 0.95)', # Fundo dos cards um pouco mais claro
+    'primary': '#BB86FC',             # Roxo/lilás
+    'secondary': '#03DAC6',           # Verde-água
+    'accent1': '#CF6679',             # Rosa
+    'accent2': '#4dabf5',             # Azul
+    'accent3': '#FFB74D',             # Laranja
+    'text': '#FFFFFF',                # Texto branco
+    'light_text': '#E0E0E0',          # Texto levemente acinzentado
+    'gradient_start': '#121212',      # Gradiente início (escuro)
+    'gradient_end': '#1F1F1F',        # Gradiente fim (um pouco menos escuro)
+    'positive': '#4CAF50',            # Verde para valores positivos
+    'negative': '#F44336',            # Vermelho para valores negativos
+    'border': '#333333',              # Cor da borda dos cards
+}
+
+# Paleta para gráficos
+
+
+
+
+
+
+dark_theme_palette = [
+    dark_theme_colors['primary'], 
+    dark_theme_colors['secondary'], 
+    dark_theme_colors['accent1'], 
+    dark_theme_colors['accent2'], 
+    dark_theme_colors['accent3']
+]
+
+
+# Arquivos estáticos servidos de assets/ (nomes com hash e cache de longa duração) depois
+# de gerados com python static_assets.py; até lá, são carregados dos CDNs originais
+static_assets = StaticAssets()
+
+# Manter a mesma imagem de fundo (cityscape noturno com pôr do sol), em WebP quando local
+background_image = static_assets.url('background.webp')
+
+# Inicializar o app Dash com tema Bootstrap e folha de estilo personalizada
+app = dash.Dash(
+    __name__, 
+    external_stylesheets=[
+        static_assets.url('bootstrap.css'),  # Tema base escuro (Darkly)
+
+        static_assets.url('fonts.css')  # Fonte Sans-serif (Open Sans)
+    ],
+    assets_ignore=ASSETS_IGNORE
+)
+static_assets.install_cache_headers(app.server)
+
+# Estilo CSS personalizado para o dropdown escuro
+app.index_string = '''
+<!DOCTYPE html>
+<html>
+    <head>
+        {%metas%}
+        <title>{%title%}</title>
+        {%favicon%}
+        {%css%}
+        <style>
+            /* Estilo para o dropdown escuro */
+            .Select-control, .Select-menu-outer, .Select-menu, .Select-option, .Select-value {
+
+                background-color: #121212 !important;
+                color: white !important;
+            }
+            .Select-value-label, .Select-option {
+                color: white !important;
+            }
+            .Select-control, .Select-menu-outer {
+
+                border: 1px solid #333333 !important;
+            }
+            .Select-option.is-focused, .Select-option:hover {
+
+                background-color: #1F1F1F !important;
+            }
+            .Select-arrow {
+
+                border-color: #BB86FC transparent transparent !important;
+            }
+            .Select.is-open > .Select-control .Select-arrow {
+
+                border-color: transparent transparent #BB86FC !important;
+            }
+            .dash-dropdown-dark .Select-value-label {
+                color: white !important;
+            }
+            
+            /* Estilo global para texto */
+            body {
+                font-family: 'Open Sans', sans-serif !important;
+            }
+        </style>
+    </head>
+    <body>
+        {%app_entry%}
+        <footer>
+            {%config%}
+            {%scripts%}
+            {%renderer%}
+        </footer>
+    </body>
+</html>
+'''
+
+server = app.server
+
+# Compressão brotli/gzip das respostas acima de DASHBOARD_COMPRESS_MIN_SIZE bytes
+install_compression(server, min_size=int(os.environ.get('DASHBOARD_COMPRESS_MIN_SIZE', DEFAULT_COMPRESS_MIN_SIZE)))
+
+# Métricas de latência, tamanho das respostas e erros dos callbacks e dos gráficos,
+# publicadas em /metrics no formato do Prometheus (DASHBOARD_METRICS=0 desativa).
+# Com DASHBOARD_METRICS_DIR (definida pelo gunicorn.conf.py), os workers somam as métricas nessa pasta
+METRICS_ENABLED = os.environ.get('DASHBOARD_METRICS', '1') == '1'
+metrics_registry = MetricsRegistry(
+    enabled=METRICS_ENABLED, multiprocess_dir=os.environ.get('DASHBOARD_METRICS_DIR') or None
+)
+metrics_registry.start()
+chart_latency = metrics_registry.histogram(
+    'dashboard_chart_duration_seconds', 'Tempo para obter a figura do gráfico principal (com cache)', ['chart_type']
+)
+chart_build_latency = metrics_registry.histogram(
+    'dashboard_chart_build_seconds', 'Tempo de construção da figura quando ela não está em cache', ['chart_type']
+)
+chart_errors = metrics_registry.counter(
+    'dashboard_chart_errors_total', 'Falhas ao construir a figura do gráfico principal', ['chart_type']
+)
+# Seleções do gráfico principal: no navegador (troca sem chamar o servidor, informada por
+# um beacon em /_chart-view) ou no servidor (DASHBOARD_CLIENTSIDE_CHARTS=0)
+chart_views = metrics_registry.counter(
+    'dashboard_chart_views_total', 'Exibições do gráfico principal por tipo', ['chart_type', 'source']
+)
+CHART_VIEW_PATH = '/_chart-view'
+if METRICS_ENABLED:
+    instrument_dash(app, metrics_registry)
+
+# Título do dashboard
+
+app.title = "Dashboard de Desemprego nas Américas"
+
+# Estilo personalizado para o container principal
+app_style = {
+
+    'background': f'linear-gradient(rgba(18, 18, 18, 0.92), rgba(31, 31, 31, 0.92)), url({background_image})',
+    'backgroundSize': 'cover',
+    'backgroundAttachment': 'fixed',
+    'backgroundPosition': 'center',
+    'minHeight': '100vh',
+
+
+    'fontFamily': '"Open Sans", sans-serif',
+    'color': dark_theme_colors['text'],
+    'padding': '20px',
+}
+
+
+# Estilo para os cards (mais escuros)
+card_style = {
+
+
+
+
+    'backgroundColor': dark_theme_colors['card_bg'],
+    'borderRadius': '8px',
+    'boxShadow': '0 4px 20px rgba(0, 0, 0, 0.5)',
+    'border': f'1px solid {dark_theme_colors["border"]}',
+    'marginBottom': '20px',
+    'backdropFilter': 'blur(10px)',
+
+    'padding': '15px'
+}
+
+card_header_style = {
+    'backgroundColor': 'transparent',
+
+
+    'borderBottom': f'1px solid {dark_theme_colors["border"]}',
+    'color': dark_theme_colors['primary'],
+    'fontWeight': '600',
+    'fontSize': '1.2rem',
+    'padding': '15px 20px',
+    'fontFamily': '"Open Sans", sans-serif',
+}
+
+# Estilo para os contêineres de gráficos
+graph_container_style = {
+
+
+    'backgroundColor': 'rgba(18, 18, 18, 0.8)',
+    'borderRadius': '8px',
+    'boxShadow': '0 4px 20px rgba(0, 0, 0, 0.3)',
+    'padding': '15px'
+}
+
+def figures_url(version):
+    """Endereço do JSON com todas as figuras de uma versão dos dados."""
+    return app.get_relative_path(f'/_figures/{version}.json')
+
+# Layout do dashboard, gerado a cada carregamento da página a partir do snapshot ativo
+def serve_layout():
+    data = data_provider.current()
+    summary = data.summary['overall']
+
+    return dbc.Container([
+        # Div de background
+        html.Div(style={
+            'position': 'fixed',
+            'top': 0,
+            'left': 0,
+            'right': 0,
+            'bottom': 0,
+            'backgroundImage': f'url({background_image})',
+            'backgroundSize': 'cover',
+            'backgroundPosition': 'center',
+            'zIndex': -1,
+            'opacity': 0.5,
+        }),
+
+        # Versão dos dados exibida e consulta periódica por novos snapshots
+        dcc.Store(id='data-version', data=data.version),
+        dcc.Interval(
+            id='version-poll',
+            interval=max(VERSION_POLL_INTERVAL, 1) * 1000,
+            disabled=VERSION_POLL_INTERVAL <= 0
+        ),
+    
+        # Cabeçalho
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    html.H1("Taxa de Desemprego nas Américas", 
+                            style={
+
+                                'fontFamily': '"Open Sans", sans-serif',
+                                'fontWeight': '700',
+
+                                'color': dark_theme_colors['text'],
+                                'textAlign': 'center',
+                                'marginTop': '20px',
+                                'marginBottom': '10px',
+                                'fontSize': '2.5rem',
+
+
+                                'textShadow': '0 0 20px rgba(0, 0, 0, 0.7)',
+                                'letterSpacing': '1px',
+                            }),
+                    html.P([
+                        "Análise comparativa das taxas de desemprego nos países das Américas - ",
+                        html.A(
+                            "Trading Economics", 
+                            href="https://tradingeconomics.com/country-list/unemployment-rate?continent=america",
+                            target="_blank",
+                            style={
+
+                                'color': dark_theme_colors['primary'],
+                                'textDecoration': 'underline'
+                            }
+                        )
+
+                    ], className="text-center", style={'color': dark_theme_colors['light_text']}),
+                    html.Div(style={
+
+                        'borderBottom': f'2px solid {dark_theme_colors["primary"]}',
+                        'width': '60%',
+                        'margin': '0 auto 30px auto',
+
+                        'boxShadow': f'0 0 10px {dark_theme_colors["primary"]}',
+                    })
+                ], style={
+
+                    'backgroundColor': 'rgba(18, 18, 18, 0.9)',
+                    'backdropFilter': 'blur(5px)',
+                    'padding': '20px',
+
+
+                    'borderRadius': '8px',
+                    'boxShadow': '0 4px 30px rgba(0, 0, 0, 0.3)',
+                    'marginBottom': '30px',
+
+                    'border': f'1px solid {dark_theme_colors["border"]}',
+                })
+            ], width=12, style={'marginBottom': '20px'})
+        ], className='mb-4'),
+    
+        # Cards de indicadores principais
+        dbc.Row([
+            # Card de Média de Desemprego
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H5("Média de Desemprego", className="card-title", style={
+                            'textAlign': 'center',
+
+                            'color': dark_theme_colors['primary'],
+                            'fontWeight': '600',
+                            'marginBottom': '10px',
+
+                            'fontFamily': '"Open Sans", sans-serif',
+                        }),
+                        html.H3(
+                            f"{summary['mean_last']:.2f}%", 
+                            style={
+                                'textAlign': 'center',
+
+                                'color': dark_theme_colors['text'],
+                                'fontSize': '2.5rem',
+                                'fontWeight': '700',
+                                'margin': '15px 0',
+
+                                'fontFamily': '"Open Sans", sans-serif',
+                            }
+                        ),
+                        html.Div([
+
+                            html.Span("vs anterior: ", style={'fontSize': '0.9rem', 'color': dark_theme_colors['light_text']}),
+                            html.Span(
+                                f"{summary['mean_delta']:+.2f}%",
+                                style={
+
+                                    'color': dark_theme_colors['negative'] if summary['mean_delta'] > 0 else dark_theme_colors['positive'],
+                                    'fontWeight': '600',
+                                    'fontSize': '0.9rem',
+
+                                }
+                            )
+                        ], style={'textAlign': 'center'})
+                    ])
+
+
+                ], style={**card_style, 'height': '100%', 'border': f'1px solid {dark_theme_colors["border"]}'}),
+            ], width=12, md=6, lg=3, className='mb-4'),
+        
+            # Card de Maior Taxa
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H5("Maior Taxa", className="card-title", style={
+                            'textAlign': 'center',
+
+                            'color': dark_theme_colors['secondary'],
+                            'fontWeight': '600',
+                            'marginBottom': '10px',
+
+                            'fontFamily': '"Open Sans", sans-serif',
+                        }),
+                        html.H3(
+                            f"{summary['max_last']:.2f}%", 
+                            style={
+                                'textAlign': 'center',
+
+                                'color': dark_theme_colors['text'],
+                                'fontSize': '2.5rem',
+                                'fontWeight': '700',
+                                'margin': '15px 0',
+
+                                'fontFamily': '"Open Sans", sans-serif',
+                            }
+                        ),
+                        html.Div([
+
+                            html.Span("País: ", style={'fontSize': '0.9rem', 'color': dark_theme_colors['light_text']}),
+                            html.Span(
+                                f"{summary['max_country']}",
+                                style={
+
+                                    'color': dark_theme_colors['text'],
+                                    'fontWeight': '600',
+                                    'fontSize': '0.9rem',
+
+                                }
+                            )
+                        ], style={'textAlign': 'center'})
+                    ])
+
+
+                ], style={**card_style, 'height': '100%', 'border': f'1px solid {dark_theme_colors["border"]}'}),
+            ], width=12, md=6, lg=3, className='mb-4'),
+        
+            # Card de Menor Taxa
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H5("Menor Taxa", className="card-title", style={
+                            'textAlign': 'center',
+
+                            'color': dark_theme_colors['accent1'],
+                            'fontWeight': '600',
+                            'marginBottom': '10px',
+
+                            'fontFamily': '"Open Sans", sans-serif',
+                        }),
+                        html.H3(
+                            f"{summary['min_last']:.2f}%", 
+                            style={
+                                'textAlign': 'center',
+
+                                'color': dark_theme_colors['text'],
+                                'fontSize': '2.5rem',
+                                'fontWeight': '700',
+                                'margin': '15px 0',
+
+                                'fontFamily': '"Open Sans", sans-serif',
+                            }
+                        ),
+                        html.Div([
+
+                            html.Span("País: ", style={'fontSize': '0.9rem', 'color': dark_theme_colors['light_text']}),
+                            html.Span(
+                                f"{summary['min_country']}",
+                                style={
+
+                                    'color': dark_theme_colors['text'],
+                                    'fontWeight': '600',
+                                    'fontSize': '0.9rem',
+
+                                }
+                            )
+                        ], style={'textAlign': 'center'})
+                    ])
+
+
+                ], style={**card_style, 'height': '100%', 'border': f'1px solid {dark_theme_colors["border"]}'}),
+            ], width=12, md=6, lg=3, className='mb-4'),
+        
+            # Card de Melhora/Piora
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H5("Tendência", className="card-title", style={
+                            'textAlign': 'center',
+
+                            'color': dark_theme_colors['accent3'],
+                            'fontWeight': '600',
+                            'marginBottom': '10px',
+
+                            'fontFamily': '"Open Sans", sans-serif',
+                        }),
+                        html.H3([
+                            html.Span(f"{summary['improved']}", 
+
+
+                                     style={'color': dark_theme_colors['positive']}),
+                            html.Span(" / ", style={'color': dark_theme_colors['text']}),
+                            html.Span(f"{summary['worsened']}", 
+
+                                     style={'color': dark_theme_colors['negative']})
+                        ], style={
+                            'textAlign': 'center',
+                            'fontSize': '2.5rem',
+                            'fontWeight': '700',
+                            'margin': '15px 0',
+
+                            'fontFamily': '"Open Sans", sans-serif',
+                        }),
+                        html.Div([
+                            html.Span("Melhora / Piora", style={
+
+                                'color': dark_theme_colors['light_text'],
+                                'fontWeight': '600',
+                                'fontSize': '0.9rem',
+
+                            })
+                        ], style={'textAlign': 'center'})
+                    ])
+
+
+                ], style={**card_style, 'height': '100%', 'border': f'1px solid {dark_theme_colors["border"]}'}),
+            ], width=12, md=6, lg=3, className='mb-4')
+        ], className='g-3'),
+    
+        # Seleção de Visualização
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Selecione o Tipo de Visualização", style=card_header_style),
+                    dbc.CardBody([
+                        dcc.Dropdown(
+                            id='chart-type',
+                            options=[
+                                {'label': 'Mapa de Calor por Região', 'value': 'heatmap'},
+                                {'label': 'Gráfico de Barras - Taxa Atual', 'value': 'bar_current'},
+                                {'label': 'Gráfico de Barras - Comparação Atual vs Anterior', 'value': 'bar_compare'},
+                                {'label': 'Gráfico de Dispersão - Taxa Atual vs Variação', 'value': 'scatter'},
+                                {'label': 'Treemap por Região', 'value': 'treemap'},
+                                {'label': 'Top 5 Maiores Taxas', 'value': 'top5_high'},
+                                {'label': 'Top 5 Menores Taxas', 'value': 'top5_low'}
+                            ],
+                            value=DEFAULT_CHART_TYPE,
+                            clearable=False,
+                            className='dash-dropdown-dark',
+                            style={
+
+
+                                'backgroundColor': dark_theme_colors['background'],
+                                'color': dark_theme_colors['text'],
+                                'borderRadius': '8px',
+
+                                'border': f'1px solid {dark_theme_colors["border"]}',
+                            }
+                        )
+
+                    ], style={'backgroundColor': 'rgba(18, 18, 18, 0.8)'})
+                ], style=card_style)
+            ], width=12, className='mb-4')
+        ]),
+    
+        # Visualização Principal
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Visualização", style=card_header_style),
+                    dbc.CardBody([
+                        dcc.Graph(
+                            id='main-chart', 
+                            style={'height': '600px'},
+                            config={'displayModeBar': False}
+                        ),
+                        # Endereço do JSON com todas as figuras (troca de gráfico no navegador)
+                        dcc.Store(
+                            id='chart-figures-url',
+                            data=figures_url(data.version) if CLIENTSIDE_CHARTS else None
+                        )
+                    ], style=graph_container_style)
+                ], style=card_style)
+            ], width=12, className='mb-4')
+        ]),
+    
+        # Tabela de Dados
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Tabela de Dados - Taxas de Desemprego por País", style=card_header_style),
+                    dbc.CardBody([
+                        dash_table.DataTable(
+                            id='data-table',
+                            columns=[
+                                {'name': 'País', 'id': 'Country'},
+                                {'name': 'Taxa Atual (%)', 'id': 'Last'},
+                                {'name': 'Taxa Anterior (%)', 'id': 'Previous'},
+                                {'name': 'Variação (%)', 'id': 'Change'},
+                                {'name': 'Região', 'id': 'Region'},
+                                {'name': 'Situação', 'id': 'Health'},
+                                {'name': 'Referência', 'id': 'Reference'},
+                                {'name': 'Meses desde a Referência', 'id': 'MonthsStale', 'type': 'numeric'}
+                            ],
+                            **table_data_props(data),
+                            page_size=TABLE_PAGE_SIZE,
+                            style_table={'overflowX': 'auto'},
+                            style_cell={
+                                'textAlign': 'left',
+                                'padding': '8px',
+                                'minWidth': '100px',
+
+
+
+                                'backgroundColor': 'rgba(18, 18, 18, 0.9)',
+                                'color': dark_theme_colors['text'],
+                                'border': f'1px solid {dark_theme_colors["border"]}',
+                                'fontFamily': '"Open Sans", sans-serif',
+                            },
+                            style_header={
+
+                                'backgroundColor': 'rgba(18, 18, 18, 0.95)',
+                                'fontWeight': 'bold',
+
+
+                                'color': dark_theme_colors['primary'],
+                                'border': f'1px solid {dark_theme_colors["border"]}',
+                                'fontFamily': '"Open Sans", sans-serif',
+                            },
+                            style_data_conditional=[
+                                {
+                                    'if': {'row_index': 'odd'},
+
+                                    'backgroundColor': 'rgba(30, 30, 30, 0.9)',
+                                },
+                                {
+                                    'if': {'column_id': 'Health', 'filter_query': '{Health} = "Bom"'},
+
+
+                                    'backgroundColor': 'rgba(76, 175, 80, 0.2)',
+                                    'color': dark_theme_colors['positive']
+                                },
+                                {
+                                    'if': {'column_id': 'Health', 'filter_query': '{Health} = "Médio"'},
+
+
+                                    'backgroundColor': 'rgba(255, 193, 7, 0.2)',
+                                    'color': '#FFB74D'
+                                },
+                                {
+                                    'if': {'column_id': 'Health', 'filter_query': '{Health} = "Ruim"'},
+
+
+                                    'backgroundColor': 'rgba(244, 67, 54, 0.2)',
+                                    'color': dark_theme_colors['negative']
+                                },
+                                {
+                                    'if': {'column_id': 'Change', 'filter_query': '{Change} < 0'},
+
+                                    'color': dark_theme_colors['positive']
+                                },
+                                {
+                                    'if': {'column_id': 'Change', 'filter_query': '{Change} > 0'},
+
+                                    'color': dark_theme_colors['negative']
+                                },
+                                {
+                                    'if': {'column_id': 'MonthsStale', 'filter_query': '{MonthsStale} >= 12'},
+
+                                    'color': dark_theme_colors['accent3']
+                                }
+                            ]
+                        )
+                    ], style=graph_container_style)
+                ], style=card_style)
+            ], width=12, className='mb-4')
+        ]),
+    
+        # Resumo Estatístico
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Resumo Estatístico", style=card_header_style),
+                    dbc.CardBody([
+                        html.Div([
+                            html.P(f"Média de Desemprego: {summary['mean_last']:.2f}%", 
+
+                                   style={'color': dark_theme_colors['text'], 'fontWeight': '500', 'fontFamily': '"Open Sans", sans-serif'}),
+                            html.P(f"Mediana de Desemprego: {summary['median_last']:.2f}%", 
+
+                                   style={'color': dark_theme_colors['text'], 'fontWeight': '500', 'fontFamily': '"Open Sans", sans-serif'}),
+                            html.P(f"Maior Taxa: {summary['max_last']:.2f}% ({summary['max_country']})", 
+
+                                   style={'color': dark_theme_colors['text'], 'fontWeight': '500', 'fontFamily': '"Open Sans", sans-serif'}),
+                            html.P(f"Menor Taxa: {summary['min_last']:.2f}% ({summary['min_country']})", 
+
+                                   style={'color': dark_theme_colors['text'], 'fontWeight': '500', 'fontFamily': '"Open Sans", sans-serif'}),
+                            html.P([
+                                "Países com Melhora: ",
+                                html.Span(f"{summary['improved']} ({summary['improved_pct']:.1f}%)", 
+
+
+                                         style={'color': dark_theme_colors['positive'], 'fontWeight': '600'})
+                            ], style={'color': dark_theme_colors['text'], 'fontWeight': '500', 'fontFamily': '"Open Sans", sans-serif'}),
+                            html.P([
+                                "Países com Piora: ",
+                                html.Span(f"{summary['worsened']} ({summary['worsened_pct']:.1f}%)", 
+
+
+                                         style={'color': dark_theme_colors['negative'], 'fontWeight': '600'})
+                            ], style={'color': dark_theme_colors['text'], 'fontWeight': '500', 'fontFamily': '"Open Sans", sans-serif'})
+                        ], style={'padding': '10px'})
+                    ], style=graph_container_style)
+                ], style=card_style)
+            ], width=12, className='mb-4')
+        ]),
+    
+        # Rodapé
+        dbc.Row([
+            dbc.Col([
+                html.Footer([
+                    html.P([
+                        "Fonte: Trading Economics - Dados extraídos em ",
+                        html.Span(data.extracted_at.astimezone().strftime("%d/%m/%Y %H:%M:%S"), 
+                                 style={'fontWeight': '500'})
+
+                    ], className="text-center", style={'color': dark_theme_colors['light_text'], 'fontFamily': '"Open Sans", sans-serif'}),
+                    html.P("Dashboard desenvolvido com Python, Dash e Plotly", 
+
+                           className="text-center", style={'color': dark_theme_colors['light_text'], 'fontFamily': '"Open Sans", sans-serif'})
+                ], style={
+                    'padding': '20px 0',
+
+                    'borderTop': f'1px solid {dark_theme_colors["border"]}',
+                    'marginTop': '20px',
+
+                })
+            ], width=12)
+        ])
+    ], fluid=True, style=app_style)
+
+app.layout = serve_layout
+
+def update_chart(chart_type, data=None):
+    """Atualiza o gráfico principal com base no tipo selecionado (usando o cache de figuras).
+
+    Tipos fora de CHART_TYPES (enviados pelo cliente) usam o gráfico padrão, para não
+    criar novas entradas no cache nem novas séries nas métricas.
+    """
+    if chart_type not in CHART_TYPES:
+        chart_type = DEFAULT_CHART_TYPE
+    data = data or data_provider.current()
+    with chart_latency.time(chart_type=chart_type):
+        return figure_cache.get_or_build(chart_type, data.version, THEME, lambda: build_chart_timed(chart_type, data.df))
+
+def build_chart_timed(chart_type, df):
+    """Constrói o gráfico registrando o tempo de construção e as falhas por tipo."""
+    try:
+        with chart_build_latency.time(chart_type=chart_type):
+            return build_chart(chart_type, df)
+    except Exception:
+        chart_errors.inc(chart_type=chart_type)
+        raise
+
+def record_chart_view(chart_type, source):
+    """Conta uma exibição do gráfico principal (tipos desconhecidos viram 'unknown')."""
+    chart_views.inc(chart_type=chart_type if chart_type in CHART_TYPES else UNKNOWN_LABEL, source=source)
+
+def serialize_all_charts(data):
+    """Serializa todas as variações do gráfico principal em um único JSON (uma vez por versão dos dados)."""
+    figures = {chart_type: update_chart(chart_type, data) for chart_type in CHART_TYPES}
+    return json.dumps(figures, cls=plotly.utils.PlotlyJSONEncoder).encode('utf-8')
+
+# Tentativas de baixar o JSON de figuras antes de desistir
+FIGURES_FETCH_ATTEMPTS = 4
+
+# Função executada no navegador: baixa o JSON com todas as figuras uma vez por versão
+# dos dados (o navegador também o guarda em cache) e troca o gráfico sem chamar o servidor
+CLIENTSIDE_CHART_SWITCH = """
+function(chartType, figuresUrl) {
+    if (!figuresUrl) {
+        return window.dash_clientside.no_update;
+    }
+    window._chartFigures = window._chartFigures || {};
+    // Falhas temporárias (ex.: worker trocando de snapshot) são repetidas com espera crescente
+    function load(attempt) {
+        return fetch(figuresUrl).then(function(response) {
+            if (!response.ok) {
+                throw new Error('Falha ao carregar as figuras: ' + response.status);
+            }
+            return response.json();
+        }).catch(function(error) {
+            if (attempt >= %d) {
+                delete window._chartFigures[figuresUrl];
+                throw error;
+            }
+            return new Promise(function(resolve) {
+                setTimeout(resolve, 1000 * attempt);
+            }).then(function() {
+                return load(attempt + 1);
+            });
+        });
+    }
+    if (!window._chartFigures[figuresUrl]) {
+        window._chartFigures[figuresUrl] = load(1);
+    }
+    // Informa ao servidor cada tipo de gráfico exibido (só quando o tipo muda, não a cada nova versão)
+    var beaconUrl = %s;
+    if (beaconUrl && chartType !== window._lastChartView && navigator.sendBeacon) {
+        window._lastChartView = chartType;
+        navigator.sendBeacon(beaconUrl, String(chartType));
+    }
+    return window._chartFigures[figuresUrl].then(function(figures) {
+        return figures[chartType] || figures['%s'];
+    });
+}
+""" % (
+    FIGURES_FETCH_ATTEMPTS,
+    json.dumps(app.get_relative_path(CHART_VIEW_PATH) if METRICS_ENABLED else ''),
+    DEFAULT_CHART_TYPE,
+)
+
+# Função executada no navegador: consulta a versão dos dados (com ETag, a resposta
+# costuma ser um 304 vazio) e só altera o Store data-version quando ela muda
+VERSION_POLL = """
+function(nIntervals, currentVersion) {
+    return fetch('%s', {cache: 'no-cache'}).then(function(response) {
+        return response.ok ? response.json() : null;
+    }).then(function(payload) {
+        if (!payload || payload.version === currentVersion) {
+            return window.dash_clientside.no_update;
+        }
+        return payload.version;
+    }).catch(function() {
+        return window.dash_clientside.no_update;
+    });
+}
+""" % app.get_relative_path('/_data-version')
+
+app.clientside_callback(
+    VERSION_POLL,
+    Output('data-version', 'data'),
+    [Input('version-poll', 'n_intervals')],
+    [State('data-version', 'data')],
+    prevent_initial_call=True
+)
+
+if CLIENTSIDE_CHARTS:
+    app.clientside_callback(
+        CLIENTSIDE_CHART_SWITCH,
+        Output('main-chart', 'figure'),
+        [Input('chart-type', 'value'), Input('chart-figures-url', 'data')]
+    )
+
+    # Nova versão dos dados: aponta para o JSON de figuras da versão ativa
+    @app.callback(
+        Output('chart-figures-url', 'data'),
+        [Input('data-version', 'data')],
+        prevent_initial_call=True
+    )
+    def refresh_figures_url(version):
+        return figures_url(data_provider.current().version)
+else:
+    # Callback para atualizar o gráfico principal no servidor (também quando os dados mudam)
+    @app.callback(
+        Output('main-chart', 'figure'),
+        [Input('chart-type', 'value'), Input('data-version', 'data')]
+    )
+    def update_main_chart(chart_type, version):
+        if dash.callback_context.triggered_id != 'data-version':
+            record_chart_view(chart_type, 'server')
+        return update_chart(chart_type)
+
+# Callback da tabela no servidor: aplica filtro, ordenação e paginação e retorna só a página visível
+if SERVER_SIDE_TABLE:
+    @app.callback(
+        [Output('data-table', 'data'), Output('data-table', 'page_count')],
+        [Input('data-table', 'page_current'),
+         Input('data-table', 'page_size'),
+         Input('data-table', 'sort_by'),
+         Input('data-table', 'filter_query'),
+         Input('data-version', 'data')],
+        prevent_initial_call=True
+    )
+    def update_table(page_current, page_size, sort_by, filter_query, version):
+        return data_provider.current().table_index.query(page_current, page_size, sort_by, filter_query)
+else:
+    # Tabela no navegador: envia todas as linhas novamente quando os dados mudam
+    @app.callback(
+        Output('data-table', 'data'),
+        [Input('data-version', 'data')],
+        prevent_initial_call=True
+    )
+    def refresh_table(version):
+        return to_records(data_provider.current().df, TABLE_COLUMNS)
+
+# Versão dos dados ativa, consultada periodicamente pelos navegadores abertos
+@server.route('/_data-version')
+def current_data_version():
+    version = data_provider.current().version
+    if etag_matches(version):
+        response = Response(status=304)
+    else:
+        response = jsonify({'version': version})
+    response.set_etag(version)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+# Beacon enviado pelo navegador a cada troca do gráfico principal feita no cliente
+@server.route(CHART_VIEW_PATH, methods=['POST'])
+def chart_view():
+    record_chart_view(request.get_data(as_text=True)[:64].strip(), 'client')
+    return Response(status=204)
+
+# Todas as figuras de uma versão dos dados, com cache HTTP (a URL muda a cada versão).
+# Versões diferentes da ativa também são atendidas: com vários workers, a página pode
+# ter sido gerada por um worker que já (ou ainda) está em outra versão
+@server.route('/_figures/<version>.json')
+def chart_figures(version):
+    data = data_provider.snapshot(version)
+    if data is None:
+        abort(404)
+    etag = f'{data.version}-{THEME}'
+    if etag_matches(etag):
+        response = Response(status=304)
+    else:
+        body = figure_cache.get_or_build('__all__', data.version, THEME, lambda: serialize_all_charts(data))
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.last_modified = data.extracted_at
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
+# O layout só muda com a versão dos dados (ou com o código do dashboard): ETag/Last-Modified
+# e 304 quando o navegador já tem a versão atual
+LAYOUT_REVISION = int(os.path.getmtime(__file__))
+
+def layout_validators():
+    data = data_provider.current()
+    return f'{data.version}-{THEME}-{LAYOUT_REVISION}', data.extracted_at
+
+install_version_validators(server, [app.config.routes_pathname_prefix + '_dash-layout'], layout_validators)
+
+# Verificação de saúde para o balanceador/orquestrador: 200 com a versão ativa dos dados
+@server.route('/healthz')
+def healthz():
+    data = data_provider.current()
+    if data is None:
+        return jsonify({'status': 'unavailable'}), 503
+    return jsonify({
+        'status': 'ok',
+        'version': data.version,
+        'rows': len(data.df),
+        'pid': os.getpid(),
+    })
+
+# Estatísticas do cache de figuras (acertos, falhas e ocupação)
+@server.route('/_figure-cache')
+def figure_cache_stats():
+    return jsonify(figure_cache.stats())
+
+def build_chart(chart_type, df):
+    """Constrói o gráfico principal para o tipo selecionado."""
+    if chart_type == 'heatmap':
+        # Criar um pivot table para o mapa de calor
+        pivot_df = df.pivot_table(
+            values='Last', 
+            index='Country', 
+            columns='Region', 
+            aggfunc='first',
+            observed=True
+        ).fillna(0)
+        
+        fig = px.imshow(
+            pivot_df,
+            labels=dict(x="Região", y="País", color="Taxa de Desemprego (%)"),
+            title="Mapa de Calor das Taxas de Desemprego por Região",
+            color_continuous_scale='YlOrRd'
+        )
+        
+        fig.update_layout(
+
+            plot_bgcolor='rgba(18, 18, 18, 0.3)',
+            paper_bgcolor='rgba(0,0,0,0)',
+
+
+            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            margin=dict(l=40, r=40, t=50, b=40),
+        )
+        
+        return fig
+        
+    elif chart_type == 'bar_current':
+        # Ordenar por taxa atual
+        sorted_df = df.sort_values('Last', ascending=False)
+        
+        # Região como object: agrupar por cor em coluna categórica gera FutureWarning no pandas
+        fig = px.bar(
+            sorted_df.astype({'Region': 'object'}),
+            x='Country',
+            y='Last',
+            color='Region',
+            title="Taxa de Desemprego Atual por País",
+            hover_data=['Reference', 'MonthsStale'],
+            labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País', 'MonthsStale': 'Meses desde a Referência'},
+
+            color_discrete_sequence=dark_theme_palette
+        )
+        
+        fig.update_layout(
+
+            plot_bgcolor='rgba(18, 18, 18, 0.3)',
+            paper_bgcolor='rgba(0,0,0,0)',
+
+
+            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            xaxis_tickangle=-45,
+            margin=dict(l=40, r=40, t=50, b=80),
+            xaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
+            yaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'}
+        )
+        
+        return fig
+        
+    elif chart_type == 'bar_compare':
+        # Selecionar os 15 principais países para melhor visualização
+        top_df = df.sort_values('Last', ascending=False).head(15)
+        
+        fig = go.Figure()
+        
+        fig.add_trace(go.Bar(
+            x=top_df['Country'],
+            y=top_df['Last'],
+            name='Taxa Atual',
+            marker_color=dark_theme_colors['primary']
+        ))
+        
+        fig.add_trace(go.Bar(
+            x=top_df['Country'],
+            y=top_df['Previous'],
+            name='Taxa Anterior',
+            marker_color=dark_theme_colors['secondary']
+        ))
+        
+        fig.update_layout(
+            title="Comparação: Taxa de Desemprego Atual vs Anterior (Top 15)",
+            xaxis_title="País",
+            yaxis_title="Taxa de Desemprego (%)",
+            barmode='group',
+            xaxis_tickangle=-45,
+            plot_bgcolor='rgba(18, 18, 18, 0.3)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            margin=dict(l=40, r=40, t=50, b=80),
+            xaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
+            yaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
+            legend=dict(
+                font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+                bgcolor='rgba(18, 18, 18, 0.7)',
+                bordercolor=dark_theme_colors['border']
+            )
+        )
+        
+        return fig
+        
+    elif chart_type == 'scatter':
+        # O tamanho do marcador não aceita valores ausentes
+        fig = px.scatter(
+            df.dropna(subset=['Last']).astype({'Region': 'object'}),
+            x='Last',
+            y='Change',
+            color='Region',
+            size='Last',
+            hover_name='Country',
+            hover_data=['Reference', 'MonthsStale'],
+            title="Relação entre Taxa Atual e Variação Percentual",
+            labels={
+                'Last': 'Taxa de Desemprego Atual (%)',
+                'Change': 'Variação em relação à taxa anterior (%)',
+                'MonthsStale': 'Meses desde a Referência'
+            },
+            color_discrete_sequence=dark_theme_palette
+        )
+        
+        # Adicionar linha horizontal em y=0 para referência
+        fig.add_hline(y=0, line_dash="dash", line_color="rgba(255, 255, 255, 0.5)")
+        
+        fig.update_layout(
+            plot_bgcolor='rgba(18, 18, 18, 0.3)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            margin=dict(l=40, r=40, t=50, b=40),
+            xaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
+            yaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
+            legend=dict(
+                font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+                bgcolor='rgba(18, 18, 18, 0.7)',
+                bordercolor=dark_theme_colors['border']
+            )
+        )
+        
+        return fig
+        
+    elif chart_type == 'treemap':
+        # O treemap agrupa pelo caminho: categorias viram texto para não gerar combinações vazias
+        fig = px.treemap(
+            df.astype({'Region': 'object', 'Country': 'object'}),
+            path=[px.Constant("Américas"), 'Region', 'Country'],
+            values='Last',
+            color='Last',
+            hover_data=['Previous', 'Change', 'Reference', 'MonthsStale'],
+            color_continuous_scale=[dark_theme_colors['secondary'], dark_theme_colors['primary']],
+            title="Treemap das Taxas de Desemprego por Região e País"
+        )
+        
+        fig.update_layout(
+            plot_bgcolor='rgba(18, 18, 18, 0.3)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            margin=dict(l=20, r=20, t=50, b=20),
+        )
+        
+        return fig
+        
+    elif chart_type == 'top5_high':
+        # Top 5 maiores taxas
+        top5_df = df.sort_values('Last', ascending=False).head(5)
+        
+        fig = px.bar(
+            top5_df,
+            x='Country',
+            y='Last',
+            color='Last',
+            text='Last',
+            title="Top 5 Países com Maiores Taxas de Desemprego",
+            labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'},
+            color_continuous_scale=[dark_theme_colors['secondary'], dark_theme_colors['primary']]
+        )
+        
+        fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
+        
+        fig.update_layout(
+            plot_bgcolor='rgba(18, 18, 18, 0.3)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            margin=dict(l=40, r=40, t=50, b=40),
+            xaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
+            yaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
+            coloraxis_showscale=False
+        )
+        
+        return fig
+        
+    elif chart_type == 'top5_low':
+        # Top 5 menores taxas
+        top5_df = df.sort_values('Last').head(5)
+        
+        fig = px.bar(
+            top5_df,
+            x='Country',
+            y='Last',
+            color='Last',
+            text='Last',
+            title="Top 5 Países com Menores Taxas de Desemprego",
+            labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'},
+            color_continuous_scale=[dark_theme_colors['accent3'], dark_theme_colors['secondary']]
+        )
+        
+        fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
+        
+        fig.update_layout(
+            plot_bgcolor='rgba(18, 18, 18, 0.3)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            title_font=dict(size=20, color=dark_theme_colors['text'], family='"Open Sans", sans-serif'),
+            margin=dict(l=40, r=40, t=50, b=40),
+            xaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
+            yaxis={'gridcolor': 'rgba(255, 255, 255, 0.1)'},
+            coloraxis_showscale=False
+        )
+        
+        return fig
+    
+    # Caso padrão
+    return px.bar(
+        df.sort_values('Last', ascending=False),
+        x='Country',
+        y='Last',
+        title="Taxa de Desemprego Atual por País",
+        labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'},
+        color_discrete_sequence=[dark_theme_colors['primary']]
+    )
+
+if __name__ == '__main__':
+    # Servidor de desenvolvimento; em produção use serve.py (gunicorn/waitress, sem debug)
+    app.run(debug=os.environ.get('DASHBOARD_DEBUG', '1') == '1')
     
\ No newline at end of file
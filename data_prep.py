@@ -0,0 +1,223 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Regiões usadas na análise
+REGIONS = {
+    'North America': ['Canada', 'United States', 'Mexico'],
+    'Central America': ['Belize', 'Costa Rica', 'El Salvador', 'Guatemala', 'Honduras', 'Nicaragua', 'Panama'],
+    'Caribbean': ['Bahamas', 'Barbados', 'Cayman Islands', 'Cuba', 'Dominican Republic', 'Haiti', 'Jamaica', 'Puerto Rico', 'Trinidad and Tobago'],
+    'South America': ['Argentina', 'Bolivia', 'Brazil', 'Chile', 'Colombia', 'Ecuador', 'Guyana', 'Paraguay', 'Peru', 'Suriname', 'Uruguay', 'Venezuela']
+}
+
+# Índice invertido país -> região (uma consulta por país, em vez de percorrer todas as listas)
+COUNTRY_REGION = {country: region for region, countries in REGIONS.items() for country in countries}
+
+DEFAULT_REGION = 'Other'
+
+# Faixas da "saúde" do indicador: < 5% Bom, < 10% Médio, demais Ruim; sem valor, Neutro
+HEALTH_THRESHOLDS = (5, 10)
+HEALTH_LABELS = ('Bom', 'Médio', 'Ruim')
+HEALTH_MISSING = 'Neutro'
+
+
+def calculate_change(last, previous):
+    """Variação percentual entre a taxa atual e a anterior, arredondada em 2 casas."""
+    return ((last - previous) / previous * 100).round(2)
+
+
+def assign_region(countries):
+    """Mapeia cada país para sua região (DEFAULT_REGION para países fora da lista)."""
+    return countries.map(COUNTRY_REGION).fillna(DEFAULT_REGION)
+
+
+def classify_health(rates):
+    """Classifica as taxas em Bom/Médio/Ruim (Neutro quando não há valor)."""
+    low, high = HEALTH_THRESHOLDS
+    values = rates.to_numpy(dtype='float64', na_value=np.nan)
+    labels = np.select(
+        [np.isnan(values), values < low, values < high],
+        [HEALTH_MISSING, HEALTH_LABELS[0], HEALTH_LABELS[1]],
+        default=HEALTH_LABELS[2]
+    )
+    return pd.Series(labels, index=rates.index)
+
+
+# Cache das referências já convertidas ('Dec/24' -> Period('2024-12', 'M')), compartilhado
+# entre recargas: cada texto distinto é analisado uma única vez por processo
+_REFERENCE_PERIODS = {}
+
+
+def parse_reference_periods(references):
+    """Converte referências como 'Dec/24' em Period[M] (NaT quando não reconhecidas).
+
+    Apenas os valores distintos ainda não vistos passam pelo parser; as linhas
+    são então mapeadas de forma vetorizada.
+    """
+    unique = pd.unique(references.dropna())
+    new_values = [value for value in unique if value not in _REFERENCE_PERIODS]
+    if new_values:
+        parsed = pd.to_datetime(
+            pd.Index(new_values, dtype='object'), format='%b/%y', errors='coerce'
+        ).to_period('M')
+        _REFERENCE_PERIODS.update(zip(new_values, parsed))
+
+    mapping = pd.Series([_REFERENCE_PERIODS[value] for value in unique], index=unique, dtype='period[M]')
+    return references.map(mapping).astype('period[M]')
+
+
+def current_month():
+    """Mês atual como Period[M], a referência padrão da defasagem (MonthsStale)."""
+    return pd.Period(pd.Timestamp.today(), freq='M')
+
+
+def months_stale(periods, as_of=None):
+    """Número de meses entre o período de referência e `as_of` (padrão: mês atual)."""
+    as_of = pd.Period(as_of, freq='M') if as_of is not None else current_month()
+    missing = periods.isna().to_numpy()
+    ordinals = np.where(missing, as_of.ordinal, periods.array.asi8)
+    values = (as_of.ordinal - ordinals).astype('int16')
+    return pd.Series(pd.arrays.IntegerArray(values, missing), index=periods.index)
+
+
+def prepare_data(df, as_of=None):
+    """Prepara os dados para o dashboard: tipos numéricos, variação, região, saúde e defasagem.
+
+    Todas as etapas são vetorizadas, então o custo cresce linearmente com o número de linhas.
+    Retorna um novo DataFrame, sem alterar o original.
+    """
+    df = df.copy()
+
+    # Converter colunas numéricas
+    for col in ['Last', 'Previous']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+
+    # Calcular a variação percentual
+    df['Change'] = calculate_change(df['Last'], df['Previous'])
+
+    # Adicionar coluna de região
+    df['Region'] = assign_region(df['Country'])
+
+    # Adicionar coluna de "saúde" do indicador
+    df['Health'] = classify_health(df['Last'])
+
+    # Converter a referência em período e calcular há quantos meses o dado foi publicado
+    if 'Reference' in df.columns:
+        df['ReferencePeriod'] = parse_reference_periods(df['Reference'])
+        df['MonthsStale'] = months_stale(df['ReferencePeriod'], as_of)
+
+    return df
+
+
+
+def _summary_stats(countries, last, previous, change):
+    """Estatísticas de um conjunto de linhas (arrays já extraídos do DataFrame).
+
+    Sem nenhuma taxa numérica, as estatísticas ficam NaN (exibidas como 'nan%',
+    como as funções do pandas) e os países, None.
+    """
+    rows = len(last)
+    has_last = not np.isnan(last).all() if rows else False
+    has_previous = not np.isnan(previous).all() if rows else False
+    improved = int(np.count_nonzero(change < 0))
+    worsened = int(np.count_nonzero(change > 0))
+    mean_last = float(np.nanmean(last)) if has_last else np.nan
+    mean_previous = float(np.nanmean(previous)) if has_previous else np.nan
+    max_index = int(np.nanargmax(last)) if has_last else None
+    min_index = int(np.nanargmin(last)) if has_last else None
+    return {
+        'rows': rows,
+        'mean_last': mean_last,
+        'mean_previous': mean_previous,
+        'mean_delta': mean_last - mean_previous,
+        'median_last': float(np.nanmedian(last)) if has_last else np.nan,
+        'max_last': float(last[max_index]) if has_last else np.nan,
+        'max_country': countries[max_index] if has_last else None,
+        'min_last': float(last[min_index]) if has_last else np.nan,
+        'min_country': countries[min_index] if has_last else None,
+        'improved': improved,
+        'worsened': worsened,
+        'improved_pct': improved / rows * 100 if rows else 0.0,
+        'worsened_pct': worsened / rows * 100 if rows else 0.0,
+    }
+
+
+def summarize(df):
+    """Estatísticas dos indicadores e do "Resumo Estatístico", no total e por região.
+
+    Cada coluna é convertida para array uma única vez e cada estatística é
+    calculada uma vez por grupo, em vez de repetir média, máximo e contagens
+    em cada trecho do layout. Retorna {'overall': {...}, 'regions': {região: {...}}}.
+    """
+    countries = df['Country'].astype('object').to_numpy()
+    last = df['Last'].to_numpy(dtype='float64', na_value=np.nan)
+    previous = df['Previous'].to_numpy(dtype='float64', na_value=np.nan)
+    change = df['Change'].to_numpy(dtype='float64', na_value=np.nan)
+
+    summary = {'overall': _summary_stats(countries, last, previous, change), 'regions': {}}
+    if 'Region' in df.columns:
+        regions = df['Region'].astype('object').to_numpy()
+        for region in pd.unique(regions):
+            mask = regions == region
+            summary['regions'][region] = _summary_stats(countries[mask], last[mask], previous[mask], change[mask])
+    return summary
+
+# Colunas exibidas no DataTable
+TABLE_COLUMNS = ['Country', 'Last', 'Previous', 'Change', 'Region', 'Health', 'Reference', 'MonthsStale']
+
+# Colunas de texto com poucos valores distintos, armazenadas como categorias
+CATEGORICAL_COLUMNS = ['Country', 'Region', 'Health', 'Unit', 'Reference']
+
+# Taxas com 1-2 casas decimais: float32 (7 dígitos significativos) é suficiente
+FLOAT32_COLUMNS = ['Last', 'Previous', 'Change']
+
+
+def memory_usage_kb(df):
+    """Memória ocupada pelo DataFrame, incluindo o conteúdo das strings, em KB."""
+    return df.memory_usage(deep=True).sum() / 1024
+
+
+def optimize_dtypes(df):
+    """Converte o DataFrame preparado para tipos compactos.
+
+    Texto repetido vira categoria e taxas viram float32. Registra no log a
+    memória antes e depois da conversão. Retorna um novo DataFrame.
+    """
+    before = memory_usage_kb(df)
+    df = df.copy()
+
+    for col in FLOAT32_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('float32')
+
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    after = memory_usage_kb(df)
+    logger.info(f"Memória do DataFrame: {before:.1f} KB -> {after:.1f} KB ({len(df)} linhas)")
+    return df
+
+
+def to_records(df, columns=None):
+    """Converte o DataFrame em registros para o DataTable.
+
+    Valores float32 são convertidos de volta para float com arredondamento, para
+    que 10.33 não apareça como 10.329999923706055 na tabela.
+    """
+    if columns is not None:
+        df = df[columns]
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype == 'float32':
+            df[col] = df[col].astype('float64').round(4)
+        elif isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('object')
+        elif isinstance(df[col].dtype, pd.api.extensions.ExtensionDtype):
+            # Inteiros anuláveis: pd.NA não é serializável em JSON
+            df[col] = df[col].astype('object').where(df[col].notna(), None)
+    return df.to_dict('records')
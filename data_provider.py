@@ -0,0 +1,246 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from data_prep import TABLE_COLUMNS, current_month, optimize_dtypes, prepare_data, summarize
+from snapshots import SnapshotManifest, find_latest_snapshot, load_snapshot
+from table_query import TableIndex
+
+logger = logging.getLogger(__name__)
+
+# Intervalo (segundos) entre as verificações de novos snapshots
+DEFAULT_POLL_INTERVAL = 10
+
+# Versões atendidas além da ativa: apenas as últimas entradas do manifest, mantidas
+# em memória, para páginas geradas por outro worker (ou antes da última troca)
+RECENT_SNAPSHOTS = 3
+
+
+def snapshot_version(snapshot_id, as_of):
+    """Versão dos dados: o snapshot e o mês usado no cálculo da defasagem (ex.: 'snap@2025-03').
+
+    Figuras, tabela e ETags dependem do mês atual (MonthsStale), então a versão muda
+    na virada do mês mesmo sem um novo snapshot.
+    """
+    return f'{snapshot_id}@{as_of}'
+
+
+class DataSnapshot:
+    """Conjunto de dados ativo do dashboard e tudo o que é derivado dele.
+
+    Uma instância nunca é alterada depois de criada: recarregar os dados cria
+    uma nova instância, então quem já obteve a atual continua com dados completos.
+    A defasagem (MonthsStale) é calculada em relação a `as_of` (padrão: mês atual).
+    """
+
+    def __init__(self, path, as_of=None):
+        self.path = path
+        self.snapshot_id = os.path.splitext(os.path.basename(path))[0]
+        self.as_of = as_of if as_of is not None else current_month()
+        self.version = snapshot_version(self.snapshot_id, self.as_of)
+        # Em UTC (com fuso): usado nos cabeçalhos Last-Modified e nas comparações com If-Modified-Since
+        self.extracted_at = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
+        self.df = optimize_dtypes(prepare_data(load_snapshot(path), as_of=self.as_of))
+        self.table_index = TableIndex(self.df, TABLE_COLUMNS)
+        # Estatísticas calculadas uma vez por snapshot, reaproveitadas em cada carregamento da página
+        self.summary = summarize(self.df)
+
+
+class DataProvider:
+    """Mantém o snapshot ativo do dashboard e o troca quando um novo é gravado.
+
+    Uma thread em segundo plano consulta o manifest (ou a pasta, sem manifest) a
+    cada poll_interval segundos. O novo snapshot é carregado e preparado por
+    completo antes de substituir o atual em uma única atribuição, de modo que
+    callbacks em andamento nunca veem dados pela metade.
+    """
+
+    def __init__(self, data_dir='data', poll_interval=DEFAULT_POLL_INTERVAL):
+        self.data_dir = data_dir
+        self.poll_interval = poll_interval
+        self._current = None
+        self._listeners = []
+        self._manifest = SnapshotManifest(data_dir)
+        self._recent = OrderedDict()
+        self._recent_lock = threading.Lock()
+        self._loading = {}
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._fork_hook = False
+
+        if not self.refresh():
+            raise FileNotFoundError(
+                f"Nenhum snapshot encontrado na pasta '{data_dir}'. "
+                "Execute main.py primeiro para extrair os dados."
+            )
+
+    def current(self):
+        """Retorna o DataSnapshot ativo, recalculado na virada do mês.
+
+        A thread de verificação também detecta a virada; a checagem aqui cobre o
+        intervalo até a próxima verificação e o modo sem thread (poll_interval <= 0).
+        """
+        data = self._current
+        if data is not None and data.as_of != current_month():
+            self.refresh()
+            data = self._current
+        return data
+
+    def snapshot(self, version):
+        """Retorna o DataSnapshot de uma versão específica (a ativa ou uma das mais recentes).
+
+        Com vários workers, cada um troca de snapshot no seu próprio ritmo: uma página
+        gerada por um worker já na versão nova pode pedir figuras a outro ainda na
+        anterior (e vice-versa). Só são atendidas as últimas RECENT_SNAPSHOTS + 1
+        entradas do manifest, calculadas no mês atual ou no anterior (páginas abertas
+        antes da virada); para as demais, retorna None. Requisições simultâneas para
+        a mesma versão aguardam uma única carga.
+        """
+        data = self._current
+        if data is not None and data.version == version:
+            return data
+        data = self._recent_snapshot(version)
+        if data is not None:
+            return data
+
+        as_of = self._version_month(version)
+        if as_of is None:
+            return None
+        path = self._snapshot_path(version.rpartition('@')[0])
+        if path is None:
+            return None
+
+        with self._recent_lock:
+            lock = self._loading.setdefault(version, threading.Lock())
+        try:
+            with lock:
+                # Outra requisição pode ter carregado a versão enquanto esta aguardava
+                data = self._recent_snapshot(version)
+                if data is not None:
+                    return data
+                try:
+                    data = DataSnapshot(path, as_of)
+                except Exception as e:
+                    logger.error(f"Erro ao carregar o snapshot {path}: {e}")
+                    return None
+                self._remember(data)
+                return data
+        finally:
+            with self._recent_lock:
+                self._loading.pop(version, None)
+
+    def _recent_snapshot(self, version):
+        with self._recent_lock:
+            data = self._recent.get(version)
+            if data is not None:
+                self._recent.move_to_end(version)
+            return data
+
+    @staticmethod
+    def _version_month(version):
+        # Só o mês atual e o anterior: a versão vem da URL e cada mês seria uma nova carga
+        snapshot_id, _, month = version.rpartition('@')
+        if not snapshot_id:
+            return None
+        try:
+            as_of = pd.Period(month, freq='M')
+        except ValueError:
+            return None
+        this_month = current_month()
+        if str(as_of) != month or as_of not in (this_month, this_month - 1):
+            return None
+        return as_of
+
+    def _snapshot_path(self, snapshot_id):
+        # A versão vem da URL: o caminho sai do manifest, nunca do texto recebido
+        for entry in self._manifest.recent(RECENT_SNAPSHOTS + 1):
+            if entry['snapshot_id'] == snapshot_id:
+                return self._manifest.resolve_path(entry)
+        return None
+
+    def _remember(self, data):
+        with self._recent_lock:
+            self._recent[data.version] = data
+            self._recent.move_to_end(data.version)
+            # Uma posição a mais que as versões atendidas: todas cabem, mesmo com o worker atrasado
+            while len(self._recent) > RECENT_SNAPSHOTS + 1:
+                self._recent.popitem(last=False)
+
+    def on_change(self, listener):
+        """Registra uma função chamada com o novo DataSnapshot após cada troca."""
+        self._listeners.append(listener)
+        return listener
+
+    def refresh(self):
+        """Carrega o snapshot mais recente se ele (ou o mês atual) for diferente do ativo.
+
+        Retorna True quando há dados ativos (carregados agora ou antes).
+        """
+        with self._reload_lock:
+            path = find_latest_snapshot(self.data_dir, self._manifest)
+            if not path:
+                return self._current is not None
+            as_of = current_month()
+            if self._current is not None and path == self._current.path and self._current.as_of == as_of:
+                return True
+
+            # Reaproveita o snapshot se ele já foi carregado por snapshot(version)
+            version = snapshot_version(os.path.splitext(os.path.basename(path))[0], as_of)
+            with self._recent_lock:
+                data = self._recent.pop(version, None)
+            try:
+                data = data or DataSnapshot(path, as_of)
+            except Exception as e:
+                # Mantém os dados atuais se o novo snapshot não puder ser lido
+                logger.error(f"Erro ao carregar o snapshot {path}: {e}")
+                return self._current is not None
+
+            previous = self._current
+            if previous is not None:
+                self._remember(previous)
+            self._current = data
+            logger.info(f"Snapshot ativo: {data.version} ({len(data.df)} linhas)")
+
+        if previous is not None:
+            for listener in self._listeners:
+                try:
+                    listener(data)
+                except Exception as e:
+                    logger.error(f"Erro ao notificar a troca de snapshot: {e}")
+        return True
+
+    def start(self):
+        """Inicia a verificação periódica em segundo plano (sem efeito se poll_interval <= 0).
+
+        Em servidores que carregam o app antes de criar os workers (gunicorn com
+        preload_app), a thread não sobrevive ao fork: cada worker reinicia a sua.
+        """
+        if self.poll_interval <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return
+        if not self._fork_hook and hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+            self._fork_hook = True
+        self._thread = threading.Thread(target=self._watch, name='snapshot-watcher', daemon=True)
+        self._thread.start()
+
+    def _after_fork(self):
+        # Os locks podem ter sido copiados travados pela thread do processo pai
+        self._reload_lock = threading.Lock()
+        self._recent_lock = threading.Lock()
+        self._loading = {}
+        self._manifest = SnapshotManifest(self.data_dir)
+        self._stop = threading.Event()
+        self._thread = None
+        self.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            self.refresh()
@@ -0,0 +1,134 @@
+import logging
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPool:
+    """Pool de drivers do Chrome reutilizados entre várias páginas.
+
+    Os navegadores são criados sob demanda (até `size` simultâneos) pela função
+    `factory` e devolvidos ao pool após cada página. Um driver é descartado e
+    substituído quando atinge `max_pages_per_driver` páginas ou quando a página
+    termina com erro (por exemplo, queda do navegador).
+    """
+
+    def __init__(self, factory, size=1, max_pages_per_driver=20):
+        self._factory = factory
+        self._max_pages = max_pages_per_driver
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle = []
+        self._pages = {}
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @contextmanager
+    def driver(self):
+        """Empresta um driver do pool durante o bloco `with`."""
+        self._slots.acquire()
+        try:
+            driver = self._checkout()
+            healthy = False
+            try:
+                yield driver
+                healthy = True
+            finally:
+                self._checkin(driver, healthy)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Encerra todos os navegadores do pool."""
+        with self._lock:
+            self._closed = True
+            drivers = list(self._pages)
+            self._idle.clear()
+            self._pages.clear()
+        for driver in drivers:
+            self._quit(driver)
+
+    def _checkout(self):
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("O pool de drivers já foi encerrado")
+                driver = self._idle.pop() if self._idle else None
+
+            if driver is None:
+                logger.info("Iniciando um novo navegador para o pool")
+                driver = self._factory()
+                with self._lock:
+                    self._pages[driver] = 0
+                return driver
+
+            if self._is_alive(driver):
+                return driver
+
+            logger.info("Navegador do pool não responde, substituindo")
+            self._discard(driver)
+
+    def _checkin(self, driver, healthy):
+        with self._lock:
+            pages = self._pages.get(driver, 0) + 1
+            self._pages[driver] = pages
+            closed = self._closed
+
+        if closed or not healthy:
+            self._discard(driver)
+            return
+
+        if pages >= self._max_pages:
+            logger.info(f"Navegador atingiu {pages} páginas, reciclando")
+            self._discard(driver)
+            return
+
+        if not self._reset(driver):
+            self._discard(driver)
+            return
+
+        with self._lock:
+            if self._closed:
+                closed = True
+            else:
+                self._idle.append(driver)
+        if closed:
+            self._discard(driver)
+
+    def _discard(self, driver):
+        with self._lock:
+            self._pages.pop(driver, None)
+        self._quit(driver)
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(driver):
+        """Limpa cookies e armazenamento local para que a próxima página comece do zero."""
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.info(f"Falha ao limpar o estado do navegador ({str(e)}), descartando")
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,71 @@
+import threading
+from collections import OrderedDict
+
+
+class FigureCache:
+    """Cache LRU de figuras Plotly, indexado por (tipo de gráfico, versão dos dados, tema).
+
+    Enquanto os dados não mudam, cada figura é construída uma única vez; requisições
+    simultâneas para a mesma chave esperam a primeira construção em vez de repeti-la.
+    Quando novos dados são carregados, invalidate() descarta as figuras antigas.
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+        self._building = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, chart_type, data_version, theme, builder):
+        """Retorna a figura em cache ou a constrói com builder() e guarda o resultado."""
+        key = (chart_type, data_version, theme)
+
+        while True:
+            with self._lock:
+                if key in self._figures:
+                    self._figures.move_to_end(key)
+                    self.hits += 1
+                    return self._figures[key]
+
+                pending = self._building.get(key)
+                if pending is None:
+                    pending = self._building[key] = threading.Event()
+                    self.misses += 1
+                    break
+
+            # Outra requisição já está construindo esta figura
+            pending.wait()
+
+        try:
+            figure = builder()
+            with self._lock:
+                self._figures[key] = figure
+                self._figures.move_to_end(key)
+                while len(self._figures) > self.maxsize:
+                    self._figures.popitem(last=False)
+            return figure
+        finally:
+            with self._lock:
+                del self._building[key]
+            pending.set()
+
+    def invalidate(self, keep_version=None):
+        """Remove as figuras em cache (exceto as da versão keep_version, se informada)."""
+        with self._lock:
+            for key in list(self._figures):
+                if key[1] != keep_version:
+                    del self._figures[key]
+
+    def stats(self):
+        """Contadores de acertos e falhas e ocupação atual do cache."""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / requests, 4) if requests else 0.0,
+                'size': len(self._figures),
+                'maxsize': self.maxsize,
+            }
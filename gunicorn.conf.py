@@ -0,0 +1,61 @@
+"""Configuração do gunicorn para servir o dashboard em produção.
+
+Uso: gunicorn dashboard:server (este arquivo é lido automaticamente na pasta atual)
+ou python serve.py. Os valores podem ser ajustados por variáveis de ambiente.
+"""
+import gc
+import glob
+import multiprocessing
+import os
+import re
+import sys
+import tempfile
+
+bind = os.environ.get('DASHBOARD_BIND', '0.0.0.0:8050')
+
+# Processos x threads: os callbacks passam a maior parte do tempo serializando JSON
+# (CPU), então poucos processos com algumas threads cada atendem dezenas de usuários
+workers = int(os.environ.get('DASHBOARD_WORKERS', min(multiprocessing.cpu_count() * 2 + 1, 8)))
+worker_class = 'gthread'
+threads = int(os.environ.get('DASHBOARD_THREADS', 4))
+
+# Carrega o app (e os dados) uma vez no processo principal, antes do fork: os workers
+# compartilham os DataFrames por copy-on-write em vez de cada um ler o snapshot
+preload_app = True
+
+timeout = int(os.environ.get('DASHBOARD_TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+
+# Recicla os workers periodicamente (com variação para não reiniciarem todos juntos)
+max_requests = 1000
+max_requests_jitter = 100
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('DASHBOARD_LOG_LEVEL', 'info')
+
+# Pasta onde cada worker grava as suas métricas; /metrics soma todos os workers.
+# Definida antes de o app ser carregado, para que dashboard.py a encontre
+os.environ.setdefault(
+    'DASHBOARD_METRICS_DIR', os.path.join(tempfile.gettempdir(), f'dashboard-metrics-{re.sub(r"[^A-Za-z0-9_.-]", "_", bind)}')
+)
+
+
+def on_starting(server):
+    # Métricas de uma execução anterior não devem somar com as desta
+    for path in glob.glob(os.path.join(os.environ['DASHBOARD_METRICS_DIR'], 'metrics_*.json')):
+        os.remove(path)
+
+
+def pre_fork(server, worker):
+    # Move os objetos já carregados para uma geração permanente do coletor de lixo,
+    # evitando que a contagem de referências do gc copie as páginas compartilhadas
+    gc.freeze()
+
+
+def worker_exit(server, worker):
+    # Grava as últimas observações do worker antes que ele seja encerrado ou reciclado
+    dashboard = sys.modules.get('dashboard')
+    if dashboard is not None:
+        dashboard.metrics_registry.stop()
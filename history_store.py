@@ -0,0 +1,211 @@
+import argparse
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+from data_prep import parse_reference_periods
+from snapshots import SnapshotManifest, load_snapshot, parse_numeric_columns
+
+logger = logging.getLogger(__name__)
+
+# Banco SQLite com o histórico de todas as extrações
+HISTORY_DB_PATH = os.path.join('data', 'history.sqlite3')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    country     TEXT NOT NULL,
+    reference   TEXT NOT NULL,
+    period      TEXT,
+    last        REAL,
+    previous    REAL,
+    unit        TEXT,
+    snapshot_id TEXT,
+    first_seen  TEXT NOT NULL,
+    last_seen   TEXT NOT NULL,
+    PRIMARY KEY (country, reference)
+);
+CREATE INDEX IF NOT EXISTS idx_observations_country ON observations (country, period);
+CREATE INDEX IF NOT EXISTS idx_observations_period ON observations (period);
+CREATE TABLE IF NOT EXISTS ingested_snapshots (
+    snapshot_id TEXT PRIMARY KEY,
+    rows        INTEGER NOT NULL,
+    ingested_at TEXT NOT NULL
+);
+"""
+
+UPSERT = """
+INSERT INTO observations (country, reference, period, last, previous, unit, snapshot_id, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (country, reference) DO UPDATE SET
+    last = excluded.last,
+    previous = excluded.previous,
+    unit = excluded.unit,
+    snapshot_id = excluded.snapshot_id,
+    last_seen = excluded.last_seen
+"""
+
+
+def reference_to_period(references):
+    """Converte referências como 'Dec/24' em períodos 'AAAA-MM' (None se não reconhecidas)."""
+    periods = parse_reference_periods(pd.Series(references, dtype='object'))
+    return periods.dt.strftime('%Y-%m').where(periods.notna(), None)
+
+
+class HistoryStore:
+    """Histórico das taxas em SQLite, com uma linha por (Country, Reference).
+
+    Extrações repetidas que trazem o mesmo mês de referência apenas atualizam a
+    linha existente (valores e last_seen), em vez de duplicar os dados.
+    """
+
+    def __init__(self, path=HISTORY_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Abre uma conexão, confirma a transação ao final e fecha a conexão."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def is_ingested(self, snapshot_id):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM ingested_snapshots WHERE snapshot_id = ?", (snapshot_id,)
+            ).fetchone()
+        return row is not None
+
+    def ingest(self, df, snapshot_id):
+        """Incorpora um snapshot ao histórico e retorna o número de linhas novas.
+
+        Snapshots já incorporados são ignorados, então a função pode ser chamada
+        novamente para o mesmo snapshot sem efeito.
+        """
+        df = parse_numeric_columns(df)
+        now = datetime.now().isoformat(timespec='seconds')
+        periods = reference_to_period(df['Reference'])
+        unit = df['Unit'] if 'Unit' in df.columns else pd.Series([None] * len(df), index=df.index)
+
+        records = [
+            (
+                country, reference, period,
+                None if pd.isna(last) else float(last),
+                None if pd.isna(previous) else float(previous),
+                None if pd.isna(unit_value) else unit_value,
+                snapshot_id, now, now,
+            )
+            for country, reference, period, last, previous, unit_value in zip(
+                df['Country'], df['Reference'], periods, df['Last'], df['Previous'], unit
+            )
+            if pd.notna(country) and pd.notna(reference)
+        ]
+
+        with self._lock, self._connect() as conn:
+            if conn.execute(
+                "SELECT 1 FROM ingested_snapshots WHERE snapshot_id = ?", (snapshot_id,)
+            ).fetchone():
+                logger.info(f"Snapshot {snapshot_id} já está no histórico")
+                return 0
+
+            before = conn.execute("SELECT COUNT(*) FROM observations").fetchone()[0]
+            conn.executemany(UPSERT, records)
+            conn.execute(
+                "INSERT INTO ingested_snapshots (snapshot_id, rows, ingested_at) VALUES (?, ?, ?)",
+                (snapshot_id, len(records), now)
+            )
+            after = conn.execute("SELECT COUNT(*) FROM observations").fetchone()[0]
+
+        logger.info(f"Snapshot {snapshot_id} incorporado ao histórico: {after - before} observações novas")
+        return after - before
+
+    def ingest_manifest(self, data_dir='data'):
+        """Incorpora todos os snapshots do manifest que ainda não estão no histórico.
+
+        Snapshots gravados com os dados estáticos de reserva (static_fallback) são ignorados.
+        """
+        manifest = SnapshotManifest(data_dir)
+        added = 0
+        for entry in manifest.entries():
+            if entry.get('static_fallback'):
+                logger.info(f"Snapshot {entry['snapshot_id']} usa dados estáticos; ignorado")
+                continue
+            if self.is_ingested(entry['snapshot_id']):
+                continue
+            path = manifest.resolve_path(entry)
+            if not os.path.exists(path):
+                logger.info(f"Snapshot {entry['snapshot_id']} não encontrado em {path}")
+                continue
+            added += self.ingest(load_snapshot(path), entry['snapshot_id'])
+        return added
+
+    def series(self, countries=None, start=None, end=None):
+        """Retorna a série histórica em formato tidy, ordenada por país e período.
+
+        countries filtra por lista de países; start/end ('AAAA-MM') limitam o período.
+        """
+        query = (
+            "SELECT country AS Country, reference AS Reference, period AS Period, "
+            "last AS Last, previous AS Previous, unit AS Unit, "
+            "first_seen AS FirstSeen, last_seen AS LastSeen FROM observations"
+        )
+        conditions, params = [], []
+        if countries:
+            conditions.append(f"country IN ({', '.join('?' * len(countries))})")
+            params.extend(countries)
+        if start:
+            conditions.append("period >= ?")
+            params.append(start)
+        if end:
+            conditions.append("period <= ?")
+            params.append(end)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY country, period"
+
+        with self._connect() as conn:
+            df = pd.read_sql_query(query, conn, params=params)
+        df['Period'] = pd.PeriodIndex(df['Period'], freq='M') if len(df) else df['Period']
+        return df
+
+    def latest_per_country(self):
+        """Retorna a observação mais recente de cada país."""
+        query = """
+            SELECT country AS Country, reference AS Reference, period AS Period,
+                   last AS Last, previous AS Previous, unit AS Unit
+            FROM observations AS o
+            WHERE period = (SELECT MAX(period) FROM observations WHERE country = o.country)
+            ORDER BY country
+        """
+        with self._connect() as conn:
+            return pd.read_sql_query(query, conn)
+
+
+def main():
+    """Incorpora ao histórico os snapshots do manifest (útil para dados antigos)."""
+    parser = argparse.ArgumentParser(description="Histórico de taxas de desemprego em SQLite")
+    parser.add_argument('--data-dir', default='data')
+    parser.add_argument('--db', default=HISTORY_DB_PATH)
+    args = parser.parse_args()
+
+    store = HistoryStore(args.db)
+    added = store.ingest_manifest(args.data_dir)
+    print(f"{added} observações novas incorporadas ao histórico em {args.db}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
@@ -0,0 +1,81 @@
+import logging
+from datetime import timezone
+
+from flask import Response, request
+
+logger = logging.getLogger(__name__)
+
+# Algoritmos de compressão, em ordem de preferência (brotli apenas se o pacote estiver instalado)
+COMPRESS_ALGORITHMS = ['br', 'gzip']
+
+# Respostas menores que isso (em bytes) não compensam a compressão
+DEFAULT_COMPRESS_MIN_SIZE = 500
+
+
+def install_compression(server, min_size=DEFAULT_COMPRESS_MIN_SIZE, algorithms=COMPRESS_ALGORITHMS):
+    """Comprime (brotli/gzip) as respostas HTML, JSON, CSS e JS do servidor Flask.
+
+    Usa o flask-compress; sem ele instalado, as respostas seguem sem compressão.
+    Retorna o objeto Compress (ou None).
+    """
+    try:
+        from flask_compress import Compress
+    except ImportError:
+        logger.warning("flask-compress não está instalado; respostas sem compressão")
+        return None
+
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        algorithms = [algorithm for algorithm in algorithms if algorithm != 'br']
+
+    server.config['COMPRESS_ALGORITHM'] = list(algorithms)
+    server.config['COMPRESS_MIN_SIZE'] = min_size
+    return Compress(server)
+
+
+def etag_matches(etag):
+    """Verifica o If-None-Match da requisição, aceitando também a ETag com o sufixo
+    que o flask-compress acrescenta às respostas comprimidas ('versão:gzip')."""
+    if_none_match = request.if_none_match
+    if if_none_match.contains(etag):
+        return True
+    return any(if_none_match.contains(f'{etag}:{algorithm}') for algorithm in COMPRESS_ALGORITHMS)
+
+
+def not_modified(etag, last_modified=None):
+    """Indica se o navegador já tem a versão atual (If-None-Match ou If-Modified-Since).
+
+    last_modified deve ter fuso horário (ex.: UTC); datas sem fuso seriam enviadas
+    pelo werkzeug como se já estivessem em GMT.
+    """
+    if request.if_none_match:
+        return etag_matches(etag)
+    if last_modified is not None and request.if_modified_since is not None:
+        return last_modified.astimezone(timezone.utc).replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+def install_version_validators(server, paths, validators):
+    """Adiciona ETag/Last-Modified às respostas GET de `paths` e responde 304 quando possível.
+
+    validators() retorna (etag, last_modified) da versão atual dos dados. As
+    respostas usam Cache-Control: no-cache, então o navegador sempre revalida,
+    mas só baixa o conteúdo de novo quando a versão muda.
+    """
+    paths = set(paths)
+
+    @server.after_request
+    def version_validators(response):
+        if request.method != 'GET' or request.path not in paths or response.status_code != 200:
+            return response
+
+        etag, last_modified = validators()
+        if not_modified(etag, last_modified):
+            response = Response(status=304)
+        response.set_etag(etag)
+        response.last_modified = last_modified
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    return version_validators
@@ -1,574 +1,905 @@
-import time
-import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from datetime import datetime
-import os
-import logging
-import dash
-from dash import dcc, html, dash_table
-from dash.dependencies import Input, Output
-import plotly.express as px
-import plotly.graph_objects as go
-import dash_bootstrap_components as dbc
-
-# Configurar logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
-
-def setup_driver():
-    """Configura e retorna o driver do Chrome para automação."""
-    chrome_options = Options()
-    # Comentando o modo headless para debug
-    # chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-extensions")
-    # Desabilitar o TensorFlow Lite
-    chrome_options.add_argument("--disable-features=NativeNotifications")
-    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-    
-    # Usar webdriver_manager para gerenciar o ChromeDriver automaticamente
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    return driver
-
-def extract_unemployment_data():
-    """Extrai dados de desemprego nas Américas do site Trading Economics."""
-    # Nova URL para taxas de desemprego nas Américas
-    url = "https://tradingeconomics.com/country-list/unemployment-rate?continent=america"
-    
-    driver = setup_driver()
-    logger.info("Acessando o site Trading Economics para dados de desemprego nas Américas...")
-    driver.get(url)
-    
-    try:
-        # Aumentar o tempo de espera e usar um seletor CSS mais específico
-        wait = WebDriverWait(driver, 30)
-        
-        # Primeiro, verificar se há algum popup ou cookie banner e fechar
-        try:
-            cookie_button = wait.until(EC.element_to_be_clickable((By.ID, "cookieAcceptButton")))
-            cookie_button.click()
-            logger.info("Banner de cookies fechado")
-        except:
-            logger.info("Nenhum banner de cookies encontrado ou já foi aceito")
-        
-        # Tentar localizar a tabela com diferentes estratégias
-        logger.info("Tentando localizar a tabela de taxas de desemprego...")
-        
-        # Estratégia 1: Pela classe da tabela (mais comum no Trading Economics)
-        try:
-            table = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table.table")))
-            logger.info("Tabela encontrada pela classe table")
-        except:
-            logger.info("Não foi possível encontrar a tabela pela classe, tentando seletor alternativo")
-            
-            # Estratégia 2: Qualquer tabela na página
-            table = wait.until(EC.presence_of_element_located((By.TAG_NAME, "table")))
-        
-        # Tirar screenshot para debug
-        driver.save_screenshot("unemployment_page_screenshot.png")
-        logger.info("Screenshot salvo como unemployment_page_screenshot.png")
-        
-        # Extrair cabeçalhos
-        headers = []
-        header_elements = table.find_elements(By.TAG_NAME, "th")
-        for header in header_elements:
-            headers.append(header.text.strip())
-        
-        logger.info(f"Cabeçalhos encontrados: {headers}")
-        
-        # Extrair linhas de dados
-        rows = []
-        row_elements = table.find_elements(By.TAG_NAME, "tr")[1:]  # Pular a linha de cabeçalho
-        
-        for row_element in row_elements:
-            row_data = []
-            cell_elements = row_element.find_elements(By.TAG_NAME, "td")
-            
-            for cell in cell_elements:
-                row_data.append(cell.text.strip())
-            
-            if row_data:  # Verificar se a linha não está vazia
-                rows.append(row_data)
-        
-        logger.info(f"Total de {len(rows)} linhas de dados extraídas")
-        
-        # Criar DataFrame
-        if headers and rows:
-            # Ajustar o número de colunas se necessário
-            max_cols = max(len(headers), max(len(row) for row in rows))
-            
-            # Expandir headers se necessário
-            if len(headers) < max_cols:
-                headers.extend([f"Coluna {i+1}" for i in range(len(headers), max_cols)])
-            
-            # Garantir que todas as linhas tenham o mesmo número de colunas
-            for i in range(len(rows)):
-                if len(rows[i]) < max_cols:
-                    rows[i].extend([''] * (max_cols - len(rows[i])))
-                elif len(rows[i]) > max_cols:
-                    rows[i] = rows[i][:max_cols]
-            
-            df = pd.DataFrame(rows, columns=headers)
-            
-            # Renomear colunas para o formato esperado pelo dashboard
-            column_mapping = {
-                'Country': 'Country',
-                'Last': 'Last',
-                'Previous': 'Previous',
-                'Reference': 'Reference',
-                'Unit': 'Unit'
-            }
-            
-            # Aplicar o mapeamento apenas para colunas que existem
-            for old_col, new_col in column_mapping.items():
-                if old_col in df.columns:
-                    df = df.rename(columns={old_col: new_col})
-            
-            return df
-        else:
-            raise Exception("Não foi possível extrair dados da tabela (cabeçalhos ou linhas vazios)")
-    
-    except Exception as e:
-        logger.error(f"Erro ao extrair dados: {str(e)}")
-        # Salvar o HTML da página para debug
-        with open("unemployment_page_source.html", "w", encoding="utf-8") as f:
-            f.write(driver.page_source)
-        logger.info("HTML da página salvo como unemployment_page_source.html")
-        
-        # Usar dados estáticos para o dashboard em caso de falha
-        return create_static_data()
-    finally:
-        driver.quit()
-
-def create_static_data():
-    """Cria um DataFrame estático com os dados da tabela fornecida."""
-    logger.info("Usando dados estáticos para o dashboard")
-    
-    data = {
-        'Country': [
-            'Argentina', 'Bahamas', 'Barbados', 'Belize', 'Bolivia', 'Brazil', 'Canada',
-            'Cayman Islands', 'Chile', 'Colombia', 'Costa Rica', 'Cuba', 'Dominican Republic',
-            'Ecuador', 'El Salvador', 'Guatemala', 'Guyana', 'Haiti', 'Honduras', 'Jamaica',
-            'Mexico', 'Nicaragua', 'Panama', 'Paraguay', 'Peru', 'Puerto Rico', 'Suriname',
-            'Trinidad and Tobago', 'United States', 'Uruguay', 'Venezuela'
-        ],
-        'Last': [
-            6.4, 9.5, 7.1, 3.4, 2.7, 6.8, 6.7, 3.3, 8.4, 10.33, 6.9, 1.2, 4.8, 5.1, 5.2, 2.3,
-            14.0, 14.9, 6.4, 3.5, 2.5, 2.8, 7.7, 4.6, 6.3, 5.4, 8.0, 4.1, 4.2, 7.9, 5.9
-        ],
-        'Previous': [
-            6.9, 10.1, 7.7, 5.0, 2.8, 6.5, 6.6, 2.1, 8.0, 11.64, 6.6, 1.8, 5.3, 3.6, 5.0, 3.0,
-            12.4, 14.8, 8.7, 3.6, 2.7, 3.0, 10.3, 5.3, 6.2, 5.4, 8.2, 4.8, 4.1, 8.1, 5.3
-        ],
-        'Reference': [
-            'Dec/24', 'Dec/23', 'Sep/24', 'Dec/23', 'Sep/24', 'Feb/25', 'Mar/25', 'Dec/23',
-            'Feb/25', 'Feb/25', 'Dec/24', 'Dec/23', 'Dec/24', 'Jan/25', 'Dec/23', 'Dec/23',
-            'Dec/23', 'Dec/23', 'Dec/23', 'Dec/24', 'Feb/25', 'Feb/25', 'Dec/23', 'Dec/24',
-            'Feb/25', 'Jan/25', 'Dec/23', 'Sep/24', 'Mar/25', 'Feb/25', 'Dec/23'
-        ],
-        'Unit': ['%'] * 31
-    }
-    
-    return pd.DataFrame(data)
-
-def save_data(df):
-    """Salva os dados extraídos em formato CSV e Excel."""
-    # Criar pasta de dados se não existir
-    if not os.path.exists('data'):
-        os.makedirs('data')
-    
-    # Adicionar timestamp ao nome do arquivo
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Salvar como CSV
-    csv_path = f'data/americas_unemployment_data_{timestamp}.csv'
-    df.to_csv(csv_path, index=False)
-    
-    # Salvar como Excel
-    excel_path = f'data/americas_unemployment_data_{timestamp}.xlsx'
-    df.to_excel(excel_path, index=False)
-    
-    logger.info(f"Dados salvos em {csv_path} e {excel_path}")
-    return csv_path, excel_path
-
-def prepare_data_for_dashboard(df):
-    """Prepara os dados para o dashboard."""
-    # Converter colunas numéricas
-    for col in ['Last', 'Previous']:
-        if col in df.columns:
-            # Converter para numérico
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-    
-    # Calcular a variação percentual
-    df['Change'] = ((df['Last'] - df['Previous']) / df['Previous'] * 100).round(2)
-    
-    # Definir regiões para análise
-    regions = {
-        'North America': ['Canada', 'United States', 'Mexico'],
-        'Central America': ['Belize', 'Costa Rica', 'El Salvador', 'Guatemala', 'Honduras', 'Nicaragua', 'Panama'],
-        'Caribbean': ['Bahamas', 'Barbados', 'Cayman Islands', 'Cuba', 'Dominican Republic', 'Haiti', 'Jamaica', 'Puerto Rico', 'Trinidad and Tobago'],
-        'South America': ['Argentina', 'Bolivia', 'Brazil', 'Chile', 'Colombia', 'Ecuador', 'Guyana', 'Paraguay', 'Peru', 'Suriname', 'Uruguay', 'Venezuela']
-    }
-    
-    # Adicionar coluna de região
-    df['Region'] = df['Country'].apply(lambda x: next((k for k, v in regions.items() if x in v), 'Other'))
-    
-    # Adicionar coluna de "saúde" do indicador
-    def calculate_unemployment_health(row):
-        rate = row['Last']
-        if pd.notna(rate):
-            if rate < 5:
-                return 'Bom'
-            elif rate < 10:
-                return 'Médio'
-            else:
-                return 'Ruim'
-        return 'Neutro'
-    
-    df['Health'] = df.apply(calculate_unemployment_health, axis=1)
-    
-    return df
-
-def create_dashboard(df):
-    """Cria e executa o dashboard com os dados fornecidos."""
-    # Inicializar o app
-    app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
-    
-    # Layout do dashboard
-    app.layout = dbc.Container([
-        dbc.Row([
-            dbc.Col([
-                html.H1("Taxa de Desemprego nas Américas", className="text-center my-4"),
-                html.P("Análise comparativa das taxas de desemprego nos países das Américas", className="text-center mb-4")
-            ])
-        ]),
-        
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Selecione o Tipo de Visualização"),
-                    dbc.CardBody([
-                        dcc.Dropdown(
-                            id='chart-type',
-                            options=[
-                                {'label': 'Mapa de Calor por Região', 'value': 'heatmap'},
-                                {'label': 'Gráfico de Barras - Taxa Atual', 'value': 'bar_current'},
-                                {'label': 'Gráfico de Barras - Comparação Atual vs Anterior', 'value': 'bar_compare'},
-                                {'label': 'Gráfico de Dispersão - Taxa Atual vs Variação', 'value': 'scatter'},
-                                {'label': 'Treemap por Região', 'value': 'treemap'},
-                                {'label': 'Top 5 Maiores Taxas', 'value': 'top5_high'},
-                                {'label': 'Top 5 Menores Taxas', 'value': 'top5_low'}
-                            ],
-                            value='bar_current',
-                            clearable=False
-                        )
-                    ])
-                ], className="mb-4")
-            ])
-        ]),
-        
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Visualização"),
-                    dbc.CardBody([
-                        dcc.Graph(id='main-chart', style={'height': '600px'})
-                    ])
-                ], className="mb-4")
-            ])
-        ]),
-        
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Tabela de Dados - Taxas de Desemprego por País"),
-                    dbc.CardBody([
-                        dash_table.DataTable(
-                            id='data-table',
-                            columns=[
-                                {'name': 'País', 'id': 'Country'},
-                                {'name': 'Taxa Atual (%)', 'id': 'Last'},
-                                {'name': 'Taxa Anterior (%)', 'id': 'Previous'},
-                                {'name': 'Variação (%)', 'id': 'Change'},
-                                {'name': 'Região', 'id': 'Region'},
-                                {'name': 'Situação', 'id': 'Health'},
-                                {'name': 'Referência', 'id': 'Reference'}
-                            ],
-                            data=df.to_dict('records'),
-                            sort_action='native',
-                            filter_action='native',
-                            page_size=10,
-                            style_table={'overflowX': 'auto'},
-                            style_cell={
-                                'textAlign': 'left',
-                                'padding': '8px',
-                                'minWidth': '100px'
-                            },
-                            style_header={
-                                'backgroundColor': 'rgb(230, 230, 230)',
-                                'fontWeight': 'bold'
-                            },
-                            style_data_conditional=[
-                                {
-                                    'if': {'column_id': 'Health', 'filter_query': '{Health} = "Bom"'},
-                                    'backgroundColor': 'rgba(75, 192, 192, 0.2)',
-                                    'color': 'green'
-                                },
-                                {
-                                    'if': {'column_id': 'Health', 'filter_query': '{Health} = "Médio"'},
-                                    'backgroundColor': 'rgba(255, 206, 86, 0.2)',
-                                    'color': 'orange'
-                                },
-                                {
-                                    'if': {'column_id': 'Health', 'filter_query': '{Health} = "Ruim"'},
-                                    'backgroundColor': 'rgba(255, 99, 132, 0.2)',
-                                    'color': 'red'
-                                },
-                                {
-                                    'if': {'column_id': 'Change', 'filter_query': '{Change} < 0'},
-                                    'color': 'green'
-                                },
-                                {
-                                    'if': {'column_id': 'Change', 'filter_query': '{Change} > 0'},
-                                    'color': 'red'
-                                }
-                            ]
-                        )
-                    ])
-                ], className="mb-4")
-            ])
-        ]),
-        
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Resumo Estatístico"),
-                    dbc.CardBody([
-                        html.Div([
-                            html.P(f"Média de Desemprego: {df['Last'].mean():.2f}%"),
-                            html.P(f"Mediana de Desemprego: {df['Last'].median():.2f}%"),
-                            html.P(f"Maior Taxa: {df['Last'].max():.2f}% ({df.loc[df['Last'].idxmax(), 'Country']})"),
-                            html.P(f"Menor Taxa: {df['Last'].min():.2f}% ({df.loc[df['Last'].idxmin(), 'Country']})"),
-                            html.P(f"Países com Melhora: {(df['Change'] < 0).sum()} ({(df['Change'] < 0).sum() / len(df) * 100:.1f}%)"),
-                            html.P(f"Países com Piora: {(df['Change'] > 0).sum()} ({(df['Change'] > 0).sum() / len(df) * 100:.1f}%)")
-                        ])
-                    ])
-                ], className="mb-4")
-            ])
-        ]),
-        
-        dbc.Row([
-            dbc.Col([
-                html.P(
-                    "Fonte: Trading Economics - Dados extraídos em " + 
-                    datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
-                    className="text-muted text-center"
-                ),
-                html.P(
-                    "Dashboard desenvolvido com Python, Dash e Plotly",
-                    className="text-muted text-center"
-                )
-            ])
-        ])
-    ], fluid=True)
-    
-    # Callback para atualizar o gráfico principal
-    @app.callback(
-        Output('main-chart', 'figure'),
-        [Input('chart-type', 'value')]
-    )
-    def update_chart(chart_type):
-        """Atualiza o gráfico principal com base no tipo selecionado."""
-        if chart_type == 'heatmap':
-            # Criar um pivot table para o mapa de calor
-            pivot_df = df.pivot_table(
-                values='Last', 
-                index='Country', 
-                columns='Region', 
-                aggfunc='first'
-            ).fillna(0)
-            
-            fig = px.imshow(
-                pivot_df,
-                labels=dict(x="Região", y="País", color="Taxa de Desemprego (%)"),
-                title="Mapa de Calor das Taxas de Desemprego por Região",
-                color_continuous_scale='YlOrRd'
-            )
-            
-            return fig
-            
-        elif chart_type == 'bar_current':
-            # Ordenar por taxa atual
-            sorted_df = df.sort_values('Last', ascending=False)
-            
-            fig = px.bar(
-                sorted_df,
-                x='Country',
-                y='Last',
-                color='Region',
-                title="Taxa de Desemprego Atual por País",
-                labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'},
-                color_discrete_sequence=px.colors.qualitative.Set3
-            )
-            
-            fig.update_layout(xaxis_tickangle=-45)
-            return fig
-            
-        elif chart_type == 'bar_compare':
-            # Selecionar os 15 principais países para melhor visualização
-            top_df = df.sort_values('Last', ascending=False).head(15)
-            
-            fig = go.Figure()
-            
-            fig.add_trace(go.Bar(
-                x=top_df['Country'],
-                y=top_df['Last'],
-                name='Taxa Atual',
-                marker_color='indianred'
-            ))
-            
-            fig.add_trace(go.Bar(
-                x=top_df['Country'],
-                y=top_df['Previous'],
-                name='Taxa Anterior',
-                marker_color='lightsalmon'
-            ))
-            
-            fig.update_layout(
-                title="Comparação: Taxa de Desemprego Atual vs Anterior (Top 15)",
-                xaxis_title="País",
-                yaxis_title="Taxa de Desemprego (%)",
-                barmode='group',
-                xaxis_tickangle=-45
-            )
-            
-            return fig
-            
-        elif chart_type == 'scatter':
-            fig = px.scatter(
-                df,
-                x='Last',
-                y='Change',
-                color='Region',
-                size='Last',
-                hover_name='Country',
-                title="Relação entre Taxa Atual e Variação Percentual",
-                labels={
-                    'Last': 'Taxa de Desemprego Atual (%)',
-                    'Change': 'Variação em relação à taxa anterior (%)'
-                },
-                color_discrete_sequence=px.colors.qualitative.Pastel
-            )
-            
-            # Adicionar linha horizontal em y=0 para referência
-            fig.add_hline(y=0, line_dash="dash", line_color="gray")
-            
-            return fig
-            
-        elif chart_type == 'treemap':
-            fig = px.treemap(
-                df,
-                path=[px.Constant("Américas"), 'Region', 'Country'],
-                values='Last',
-                color='Last',
-                hover_data=['Previous', 'Change'],
-                color_continuous_scale='RdBu_r',
-                title="Treemap das Taxas de Desemprego por Região e País"
-            )
-            
-            return fig
-            
-        elif chart_type == 'top5_high':
-            # Top 5 maiores taxas
-            top5_df = df.sort_values('Last', ascending=False).head(5)
-            
-            fig = px.bar(
-                top5_df,
-                x='Country',
-                y='Last',
-                color='Last',
-                text='Last',
-                title="Top 5 Países com Maiores Taxas de Desemprego",
-                labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'},
-                color_continuous_scale='Reds'
-            )
-            
-            fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-            
-            return fig
-            
-        elif chart_type == 'top5_low':
-            # Top 5 menores taxas
-            top5_df = df.sort_values('Last').head(5)
-            
-            fig = px.bar(
-                top5_df,
-                x='Country',
-                y='Last',
-                color='Last',
-                text='Last',
-                title="Top 5 Países com Menores Taxas de Desemprego",
-                labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'},
-                color_continuous_scale='Greens'
-            )
-            
-            fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-            
-            return fig
-        
-        # Caso padrão
-        return px.bar(
-            df.sort_values('Last', ascending=False),
-            x='Country',
-            y='Last',
-            title="Taxa de Desemprego Atual por País",
-            labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'}
-        )
-    
-    return app
-
-def main():
-    """Função principal que executa o fluxo de extração, processamento e visualização dos dados."""
-    print("Iniciando extração de dados de desemprego nas Américas...")
-    
-    try:
-        # Extrair dados
-        df = extract_unemployment_data()
-        
-        # Salvar dados brutos
-        csv_path, excel_path = save_data(df)
-        
-        # Preparar dados para o dashboard
-        df_dashboard = prepare_data_for_dashboard(df)
-        
-        # Exibir informações sobre os dados extraídos
-        print(f"Dados extraídos com sucesso! Total de {len(df)} países com dados de desemprego.")
-        print("\nPrimeiros 5 países:")
-        print(df.head())
-        
-        print("\nCriando e iniciando o dashboard...")
-        
-        # Criar e iniciar o dashboard
-        app = create_dashboard(df_dashboard)
-        
-        print("\nDashboard pronto! Iniciando servidor...")
-        print("Acesse o dashboard em http://127.0.0.1:8050/")
-        
-        # Iniciar o servidor
-        app.run(debug=True)
-    
-    except Exception as e:
-        print(f"Erro durante a execução: {str(e)}")
-        logger.error(f"Erro durante a execução: {str(e)}", exc_info=True)
-
-if __name__ == "__main__":
+import argparse
+import time
+from functools import partial
+import pandas as pd
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from datetime import datetime
+import os
+import logging
+import requests
+import lxml.html
+import dash
+from dash import dcc, html, dash_table
+from dash.dependencies import Input, Output
+import plotly.express as px
+import plotly.graph_objects as go
+import dash_bootstrap_components as dbc
+
+from chromedriver_cache import resolve_chromedriver
+from data_prep import TABLE_COLUMNS, optimize_dtypes, prepare_data, summarize, to_records
+from driver_pool import DriverPool
+from figure_cache import FigureCache
+from history_store import HistoryStore
+from run_report import DEFAULT_REPORT_DIR, NULL_REPORT, RunReport
+from snapshots import SNAPSHOT_EXTENSION, EXPORT_FORMATS, SnapshotManifest, export_snapshot_async, write_snapshot
+
+# Configurar logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Perfis de execução do navegador:
+# - debug: navegador visível, carrega a página completa e salva screenshot/HTML para análise
+# - production: headless, bloqueia recursos não essenciais e não salva artefatos de debug
+SCRAPE_PROFILES = {
+    'debug': {
+        'headless': False,
+        'block_resources': False,
+        'page_load_strategy': 'normal',
+        'debug_artifacts': True,
+    },
+    'production': {
+        'headless': True,
+        'block_resources': True,
+        'page_load_strategy': 'eager',
+        'debug_artifacts': False,
+    },
+}
+
+# Padrões de URL bloqueados no perfil de produção (imagens, fontes, mídia e domínios de terceiros)
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm',
+    '*googletagmanager.com*', '*google-analytics.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*adservice.google.com*', '*facebook.net*',
+    '*facebook.com*', '*twitter.com*', '*quantserve.com*', '*scorecardresearch.com*',
+    '*amazon-adsystem.com*', '*adnxs.com*', '*criteo.com*', '*taboola.com*',
+]
+
+def get_scrape_profile(profile=None):
+    """Retorna a configuração do perfil (padrão: variável SCRAPE_PROFILE ou 'debug')."""
+    name = profile or os.environ.get('SCRAPE_PROFILE', 'debug')
+    if name not in SCRAPE_PROFILES:
+        raise ValueError(f"Perfil de extração desconhecido: {name}")
+    return SCRAPE_PROFILES[name]
+
+def setup_driver(profile=None, report=NULL_REPORT):
+    """Configura e retorna o driver do Chrome para automação."""
+    settings = get_scrape_profile(profile)
+    chrome_options = Options()
+    if settings['headless']:
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    # Desabilitar o TensorFlow Lite
+    chrome_options.add_argument("--disable-features=NativeNotifications")
+    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    # 'eager' libera o driver assim que o DOM está pronto, sem esperar imagens e scripts de terceiros
+    chrome_options.page_load_strategy = settings['page_load_strategy']
+    
+    if settings['block_resources']:
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.media_stream': 2,
+            'profile.managed_default_content_settings.notifications': 2,
+            'profile.managed_default_content_settings.geolocation': 2,
+        })
+    
+    # Usar o ChromeDriver do cache local (webdriver_manager só é chamado se a versão não corresponder)
+    with report.phase('driver.resolve'):
+        service = Service(resolve_chromedriver())
+    with report.phase('driver.start'):
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+    
+    if settings['block_resources']:
+        # Bloquear fontes, mídia e domínios de anúncios/analytics via DevTools
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    return driver
+
+# Script executado no navegador para extrair cabeçalhos e linhas de uma só vez,
+# evitando uma requisição ao WebDriver para cada célula da tabela
+TABLE_EXTRACTION_SCRIPT = """
+const table = arguments[0];
+const text = (el) => (el.innerText || el.textContent || '').trim();
+const headers = Array.from(table.querySelectorAll('th')).map(text);
+const rows = [];
+Array.from(table.querySelectorAll('tr')).slice(1).forEach((tr) => {
+    const cells = Array.from(tr.querySelectorAll('td')).map(text);
+    if (cells.length) {
+        rows.push(cells);
+    }
+});
+return {headers: headers, rows: rows};
+"""
+
+def extract_table_with_script(driver, table):
+    """Extrai cabeçalhos e linhas da tabela com uma única chamada execute_script."""
+    result = driver.execute_script(TABLE_EXTRACTION_SCRIPT, table)
+
+    if not isinstance(result, dict) or not isinstance(result.get('rows'), list):
+        raise ValueError("Resultado inesperado do script de extração da tabela")
+
+    headers = [str(header).strip() for header in result.get('headers') or []]
+    rows = [[str(cell).strip() for cell in row] for row in result['rows'] if row]
+    return headers, rows
+
+def extract_table_per_element(table):
+    """Extrai cabeçalhos e linhas percorrendo cada elemento da tabela (mais lento)."""
+    # Extrair cabeçalhos
+    headers = []
+    header_elements = table.find_elements(By.TAG_NAME, "th")
+    for header in header_elements:
+        headers.append(header.text.strip())
+
+    # Extrair linhas de dados
+    rows = []
+    row_elements = table.find_elements(By.TAG_NAME, "tr")[1:]  # Pular a linha de cabeçalho
+
+    for row_element in row_elements:
+        row_data = []
+        cell_elements = row_element.find_elements(By.TAG_NAME, "td")
+
+        for cell in cell_elements:
+            row_data.append(cell.text.strip())
+
+        if row_data:  # Verificar se a linha não está vazia
+            rows.append(row_data)
+
+    return headers, rows
+
+def extract_table(driver, table, report=NULL_REPORT):
+    """Extrai a tabela via JavaScript e recorre à extração por elemento em caso de falha."""
+    try:
+        with report.phase('selenium.extract_cells.script'):
+            headers, rows = extract_table_with_script(driver, table)
+        if headers and rows:
+            logger.info("Tabela extraída em uma única chamada via execute_script")
+            report.set('strategy', 'selenium_script')
+            return headers, rows
+        logger.info("Extração via script retornou tabela vazia, usando extração por elemento")
+    except Exception as e:
+        logger.info(f"Extração via script falhou ({str(e)}), usando extração por elemento")
+
+    with report.phase('selenium.extract_cells.per_element'):
+        headers, rows = extract_table_per_element(table)
+    report.set('strategy', 'selenium_per_element')
+    return headers, rows
+
+def build_dataframe(headers, rows):
+    """Monta o DataFrame no formato esperado pelo dashboard a partir de cabeçalhos e linhas."""
+    if not (headers and rows):
+        raise Exception("Não foi possível extrair dados da tabela (cabeçalhos ou linhas vazios)")
+
+    headers = list(headers)
+    rows = [list(row) for row in rows]
+
+    # Ajustar o número de colunas se necessário
+    max_cols = max(len(headers), max(len(row) for row in rows))
+
+    # Expandir headers se necessário
+    if len(headers) < max_cols:
+        headers.extend([f"Coluna {i+1}" for i in range(len(headers), max_cols)])
+
+    # Garantir que todas as linhas tenham o mesmo número de colunas
+    for i in range(len(rows)):
+        if len(rows[i]) < max_cols:
+            rows[i].extend([''] * (max_cols - len(rows[i])))
+        elif len(rows[i]) > max_cols:
+            rows[i] = rows[i][:max_cols]
+
+    df = pd.DataFrame(rows, columns=headers)
+
+    # Renomear colunas para o formato esperado pelo dashboard
+    column_mapping = {
+        'Country': 'Country',
+        'Last': 'Last',
+        'Previous': 'Previous',
+        'Reference': 'Reference',
+        'Unit': 'Unit'
+    }
+
+    # Aplicar o mapeamento apenas para colunas que existem
+    for old_col, new_col in column_mapping.items():
+        if old_col in df.columns:
+            df = df.rename(columns={old_col: new_col})
+
+    return df
+
+# Nova URL para taxas de desemprego nas Américas
+UNEMPLOYMENT_URL = "https://tradingeconomics.com/country-list/unemployment-rate?continent=america"
+
+# Cabeçalhos HTTP para a busca sem navegador (o site recusa clientes sem User-Agent)
+HTTP_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    ),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+def _element_text(element):
+    """Retorna o texto de um elemento lxml com espaços normalizados (como o .text do Selenium)."""
+    return ' '.join(element.text_content().split())
+
+def parse_unemployment_html(html_text):
+    """Extrai a tabela de desemprego de um HTML já baixado.
+
+    Retorna o mesmo DataFrame produzido pela extração via Selenium, ou None se
+    a página não contiver uma tabela com dados (inclusive para HTML vazio).
+    """
+    if not html_text or not html_text.strip():
+        return None
+    document = lxml.html.fromstring(html_text)
+
+    # Mesma ordem de estratégias do Selenium: primeiro table.table, depois qualquer tabela
+    tables = document.xpath('//table[contains(concat(" ", normalize-space(@class), " "), " table ")]')
+    if not tables:
+        tables = document.xpath('//table')
+    if not tables:
+        return None
+
+    table = tables[0]
+    headers = [_element_text(th) for th in table.iter('th')]
+    rows = []
+    for tr in list(table.iter('tr'))[1:]:  # Pular a linha de cabeçalho
+        row_data = [_element_text(td) for td in tr.iter('td')]
+        if row_data:
+            rows.append(row_data)
+
+    if not (headers and rows):
+        return None
+
+    return build_dataframe(headers, rows)
+
+def fetch_unemployment_data_http(url=UNEMPLOYMENT_URL, timeout=15, session=None):
+    """Busca a página via HTTP (sem navegador) e extrai a tabela de desemprego.
+
+    Uma requests.Session pode ser informada para reaproveitar conexões.
+    Retorna None quando a página não traz a tabela no HTML servido.
+    """
+    logger.info(f"Buscando a tabela via HTTP (sem navegador): {url}")
+    response = (session or requests).get(url, headers=HTTP_HEADERS, timeout=timeout)
+    response.raise_for_status()
+    return parse_unemployment_html(response.text)
+
+# Tempos máximos (em segundos) de cada fase de espera do Selenium
+DEFAULT_WAIT_TIMEOUTS = {
+    'page': 30,            # Banner de cookies ou tabela, o que aparecer primeiro
+    'table': 15,           # Tabela, depois de fechar o banner de cookies
+    'fallback_grace': 5,   # Tempo antes de aceitar qualquer tabela como alternativa a table.table
+}
+
+# Estados esperados da página, em ordem de prioridade
+COOKIE_BANNER_STATE = ('cookie_banner', (By.ID, "cookieAcceptButton"))
+TABLE_STATES = [
+    ('table', (By.CSS_SELECTOR, "table.table")),  # Estratégia 1: pela classe (mais comum no Trading Economics)
+    ('table_fallback', (By.TAG_NAME, "table")),   # Estratégia 2: qualquer tabela na página
+]
+
+def wait_for_first_state(driver, states, timeout, fallback_grace=0, poll_frequency=0.25):
+    """Aguarda em paralelo vários estados da página e retorna (nome, elemento) do primeiro que aparecer.
+
+    O banner de cookies só conta quando está clicável. O estado 'table_fallback'
+    só é aceito depois de fallback_grace segundos, para dar prioridade a table.table.
+    Elementos que somem enquanto a página ainda está sendo montada (stale) não
+    interrompem a espera: a verificação é repetida na próxima consulta.
+    """
+    started = time.monotonic()
+
+    def first_state(d):
+        elapsed = time.monotonic() - started
+        for name, locator in states:
+            if name == 'table_fallback' and elapsed < fallback_grace:
+                continue
+            for element in d.find_elements(*locator):
+                if name == 'cookie_banner' and not (element.is_displayed() and element.is_enabled()):
+                    continue
+                return name, element
+        return False
+
+    return WebDriverWait(
+        driver, timeout, poll_frequency=poll_frequency,
+        ignored_exceptions=(StaleElementReferenceException,)
+    ).until(first_state)
+
+def extract_unemployment_data(url=UNEMPLOYMENT_URL, wait_timeouts=None, pool=None, report=NULL_REPORT):
+    """Extrai dados de desemprego nas Américas do site Trading Economics.
+
+    Tenta primeiro a busca via HTTP e só abre o Chrome se ela não encontrar a tabela.
+    Um DriverPool pode ser informado para reaproveitar navegadores entre várias páginas.
+    Um RunReport pode ser informado para registrar a duração de cada fase e a estratégia usada.
+    """
+    try:
+        with report.phase('extract.http'):
+            df = fetch_unemployment_data_http(url)
+        if df is not None:
+            logger.info(f"Tabela extraída via HTTP: {len(df)} linhas")
+            report.set('strategy', 'http')
+            return df
+        logger.info("Nenhuma tabela encontrada no HTML, usando o Selenium")
+    except Exception as e:
+        logger.info(f"Busca via HTTP falhou ({str(e)}), usando o Selenium")
+
+    return extract_unemployment_data_selenium(url, wait_timeouts, pool, report)
+
+def extract_unemployment_data_selenium(url=UNEMPLOYMENT_URL, wait_timeouts=None, pool=None, report=NULL_REPORT):
+    """Extrai dados de desemprego nas Américas usando o Chrome via Selenium.
+
+    wait_timeouts permite sobrescrever os tempos de DEFAULT_WAIT_TIMEOUTS por fase.
+    Se um DriverPool for informado, o navegador é emprestado do pool e reaproveitado
+    nas próximas páginas; caso contrário, um navegador é criado e encerrado aqui.
+    """
+    own_pool = pool is None
+    if own_pool:
+        pool = DriverPool(partial(setup_driver, report=report), size=1)
+    
+    try:
+        with pool.driver() as driver:
+            return scrape_unemployment_table(driver, url, wait_timeouts, report=report)
+    except Exception as e:
+        logger.error(f"Erro ao extrair dados: {str(e)}")
+        
+        # Usar dados estáticos para o dashboard em caso de falha
+        report.set('strategy', 'static')
+        report.set('static_fallback', True)
+        return create_static_data()
+    finally:
+        if own_pool:
+            pool.close()
+
+def scrape_unemployment_table(driver, url=UNEMPLOYMENT_URL, wait_timeouts=None, debug=None, report=NULL_REPORT):
+    """Carrega a página em um driver já aberto e retorna o DataFrame da tabela.
+
+    Com debug ativo (padrão definido pelo perfil de extração), salva um screenshot
+    da página e, em caso de erro, o HTML para análise. A exceção é sempre repassada.
+    """
+    timeouts = {**DEFAULT_WAIT_TIMEOUTS, **(wait_timeouts or {})}
+    if debug is None:
+        debug = get_scrape_profile()['debug_artifacts']
+    
+    try:
+        logger.info(f"Acessando o site Trading Economics: {url}")
+        with report.phase('selenium.page_load'):
+            driver.get(url)
+        
+        # Aguardar o banner de cookies e a tabela ao mesmo tempo, agindo no que aparecer primeiro
+        logger.info("Aguardando o banner de cookies ou a tabela de taxas de desemprego...")
+        with report.phase('selenium.wait_page'):
+            state, element = wait_for_first_state(
+                driver, [COOKIE_BANNER_STATE] + TABLE_STATES,
+                timeouts['page'], fallback_grace=timeouts['fallback_grace']
+            )
+        
+        if state == 'cookie_banner':
+            with report.phase('selenium.cookie_click'):
+                element.click()
+            logger.info("Banner de cookies fechado")
+            with report.phase('selenium.wait_table'):
+                state, table = wait_for_first_state(
+                    driver, TABLE_STATES,
+                    timeouts['table'], fallback_grace=timeouts['fallback_grace']
+                )
+        else:
+            table = element
+            logger.info("Nenhum banner de cookies encontrado ou já foi aceito")
+        
+        report.set('table_state', state)
+        if state == 'table':
+            logger.info("Tabela encontrada pela classe table")
+        else:
+            logger.info("Tabela encontrada pelo seletor alternativo")
+        
+        # Tirar screenshot para debug
+        if debug:
+            with report.phase('selenium.screenshot'):
+                driver.save_screenshot("unemployment_page_screenshot.png")
+            logger.info("Screenshot salvo como unemployment_page_screenshot.png")
+        
+        # Extrair cabeçalhos e linhas (uma única chamada ao WebDriver, com fallback por elemento)
+        headers, rows = extract_table(driver, table, report)
+        
+        logger.info(f"Cabeçalhos encontrados: {headers}")
+        logger.info(f"Total de {len(rows)} linhas de dados extraídas")
+        
+        with report.phase('selenium.build_dataframe'):
+            return build_dataframe(headers, rows)
+    
+    except Exception:
+        if not debug:
+            raise
+        
+        # Salvar o HTML da página para debug
+        try:
+            with open("unemployment_page_source.html", "w", encoding="utf-8") as f:
+                f.write(driver.page_source)
+            logger.info("HTML da página salvo como unemployment_page_source.html")
+        except Exception:
+            logger.info("Não foi possível salvar o HTML da página")
+        raise
+
+def create_static_data():
+    """Cria um DataFrame estático com os dados da tabela fornecida."""
+    logger.info("Usando dados estáticos para o dashboard")
+    
+    data = {
+        'Country': [
+            'Argentina', 'Bahamas', 'Barbados', 'Belize', 'Bolivia', 'Brazil', 'Canada',
+            'Cayman Islands', 'Chile', 'Colombia', 'Costa Rica', 'Cuba', 'Dominican Republic',
+            'Ecuador', 'El Salvador', 'Guatemala', 'Guyana', 'Haiti', 'Honduras', 'Jamaica',
+            'Mexico', 'Nicaragua', 'Panama', 'Paraguay', 'Peru', 'Puerto Rico', 'Suriname',
+            'Trinidad and Tobago', 'United States', 'Uruguay', 'Venezuela'
+        ],
+        'Last': [
+            6.4, 9.5, 7.1, 3.4, 2.7, 6.8, 6.7, 3.3, 8.4, 10.33, 6.9, 1.2, 4.8, 5.1, 5.2, 2.3,
+            14.0, 14.9, 6.4, 3.5, 2.5, 2.8, 7.7, 4.6, 6.3, 5.4, 8.0, 4.1, 4.2, 7.9, 5.9
+        ],
+        'Previous': [
+            6.9, 10.1, 7.7, 5.0, 2.8, 6.5, 6.6, 2.1, 8.0, 11.64, 6.6, 1.8, 5.3, 3.6, 5.0, 3.0,
+            12.4, 14.8, 8.7, 3.6, 2.7, 3.0, 10.3, 5.3, 6.2, 5.4, 8.2, 4.8, 4.1, 8.1, 5.3
+        ],
+        'Reference': [
+            'Dec/24', 'Dec/23', 'Sep/24', 'Dec/23', 'Sep/24', 'Feb/25', 'Mar/25', 'Dec/23',
+            'Feb/25', 'Feb/25', 'Dec/24', 'Dec/23', 'Dec/24', 'Jan/25', 'Dec/23', 'Dec/23',
+            'Dec/23', 'Dec/23', 'Dec/23', 'Dec/24', 'Feb/25', 'Feb/25', 'Dec/23', 'Dec/24',
+            'Feb/25', 'Jan/25', 'Dec/23', 'Sep/24', 'Mar/25', 'Feb/25', 'Dec/23'
+        ],
+        'Unit': ['%'] * 31
+    }
+    
+    return pd.DataFrame(data)
+
+def save_data(df, name='americas_unemployment_data', data_dir='data', exports=(), report=NULL_REPORT,
+              static_fallback=False):
+    """Salva os dados extraídos como snapshot Parquet.
+
+    As exportações CSV/Excel (exports, ex.: ('csv', 'xlsx')) são opcionais e geradas
+    em segundo plano, sem atrasar o restante do fluxo; suas durações entram no
+    relatório quando terminam. static_fallback marca no manifest os dados de
+    create_static_data(), que o histórico ignora.
+    """
+    # Criar pasta de dados se não existir
+    if not os.path.exists(data_dir):
+        os.makedirs(data_dir)
+    
+    # Adicionar timestamp ao nome do arquivo
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    # Salvar o snapshot colunar (gravação atômica)
+    snapshot_path = f'{data_dir}/{name}_{timestamp}{SNAPSHOT_EXTENSION}'
+    with report.phase('save.write_snapshot'):
+        write_snapshot(df, snapshot_path)
+    logger.info(f"Dados salvos em {snapshot_path}")
+    report.set('snapshot', snapshot_path)
+    
+    # Registrar o snapshot no manifest da pasta
+    with report.phase('save.manifest'):
+        SnapshotManifest(data_dir).append(snapshot_path, df, static_fallback=static_fallback)
+    
+    # Exportações opcionais fora do caminho crítico
+    if exports:
+        export_snapshot_async(df, snapshot_path, exports, report=report)
+    
+    return snapshot_path
+
+def prepare_data_for_dashboard(df, report=NULL_REPORT):
+    """Prepara os dados para o dashboard (mesmo pipeline usado pelo dashboard.py)."""
+    with report.phase('prepare.prepare_data'):
+        df = prepare_data(df)
+    with report.phase('prepare.optimize_dtypes'):
+        return optimize_dtypes(df)
+
+def create_dashboard(df, data_version=None):
+    """Cria e executa o dashboard com os dados fornecidos.
+
+    data_version identifica os dados (ex.: id do snapshot) no cache de figuras.
+    """
+    # Estatísticas do resumo, calculadas uma única vez
+    summary = summarize(df)['overall']
+
+    # Inicializar o app
+    app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
+    
+    # Layout do dashboard
+    app.layout = dbc.Container([
+        dbc.Row([
+            dbc.Col([
+                html.H1("Taxa de Desemprego nas Américas", className="text-center my-4"),
+                html.P("Análise comparativa das taxas de desemprego nos países das Américas", className="text-center mb-4")
+            ])
+        ]),
+        
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Selecione o Tipo de Visualização"),
+                    dbc.CardBody([
+                        dcc.Dropdown(
+                            id='chart-type',
+                            options=[
+                                {'label': 'Mapa de Calor por Região', 'value': 'heatmap'},
+                                {'label': 'Gráfico de Barras - Taxa Atual', 'value': 'bar_current'},
+                                {'label': 'Gráfico de Barras - Comparação Atual vs Anterior', 'value': 'bar_compare'},
+                                {'label': 'Gráfico de Dispersão - Taxa Atual vs Variação', 'value': 'scatter'},
+                                {'label': 'Treemap por Região', 'value': 'treemap'},
+                                {'label': 'Top 5 Maiores Taxas', 'value': 'top5_high'},
+                                {'label': 'Top 5 Menores Taxas', 'value': 'top5_low'}
+                            ],
+                            value='bar_current',
+                            clearable=False
+                        )
+                    ])
+                ], className="mb-4")
+            ])
+        ]),
+        
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Visualização"),
+                    dbc.CardBody([
+                        dcc.Graph(id='main-chart', style={'height': '600px'})
+                    ])
+                ], className="mb-4")
+            ])
+        ]),
+        
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Tabela de Dados - Taxas de Desemprego por País"),
+                    dbc.CardBody([
+                        dash_table.DataTable(
+                            id='data-table',
+                            columns=[
+                                {'name': 'País', 'id': 'Country'},
+                                {'name': 'Taxa Atual (%)', 'id': 'Last'},
+                                {'name': 'Taxa Anterior (%)', 'id': 'Previous'},
+                                {'name': 'Variação (%)', 'id': 'Change'},
+                                {'name': 'Região', 'id': 'Region'},
+                                {'name': 'Situação', 'id': 'Health'},
+                                {'name': 'Referência', 'id': 'Reference'},
+                                {'name': 'Meses desde a Referência', 'id': 'MonthsStale', 'type': 'numeric'}
+                            ],
+                            data=to_records(df, TABLE_COLUMNS),
+                            sort_action='native',
+                            filter_action='native',
+                            page_size=10,
+                            style_table={'overflowX': 'auto'},
+                            style_cell={
+                                'textAlign': 'left',
+                                'padding': '8px',
+                                'minWidth': '100px'
+                            },
+                            style_header={
+                                'backgroundColor': 'rgb(230, 230, 230)',
+                                'fontWeight': 'bold'
+                            },
+                            style_data_conditional=[
+                                {
+                                    'if': {'column_id': 'Health', 'filter_query': '{Health} = "Bom"'},
+                                    'backgroundColor': 'rgba(75, 192, 192, 0.2)',
+                                    'color': 'green'
+                                },
+                                {
+                                    'if': {'column_id': 'Health', 'filter_query': '{Health} = "Médio"'},
+                                    'backgroundColor': 'rgba(255, 206, 86, 0.2)',
+                                    'color': 'orange'
+                                },
+                                {
+                                    'if': {'column_id': 'Health', 'filter_query': '{Health} = "Ruim"'},
+                                    'backgroundColor': 'rgba(255, 99, 132, 0.2)',
+                                    'color': 'red'
+                                },
+                                {
+                                    'if': {'column_id': 'Change', 'filter_query': '{Change} < 0'},
+                                    'color': 'green'
+                                },
+                                {
+                                    'if': {'column_id': 'Change', 'filter_query': '{Change} > 0'},
+                                    'color': 'red'
+                                },
+                                {
+                                    'if': {'column_id': 'MonthsStale', 'filter_query': '{MonthsStale} >= 12'},
+                                    'color': 'orange'
+                                }
+                            ]
+                        )
+                    ])
+                ], className="mb-4")
+            ])
+        ]),
+        
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Resumo Estatístico"),
+                    dbc.CardBody([
+                        html.Div([
+                            html.P(f"Média de Desemprego: {summary['mean_last']:.2f}%"),
+                            html.P(f"Mediana de Desemprego: {summary['median_last']:.2f}%"),
+                            html.P(f"Maior Taxa: {summary['max_last']:.2f}% ({summary['max_country']})"),
+                            html.P(f"Menor Taxa: {summary['min_last']:.2f}% ({summary['min_country']})"),
+                            html.P(f"Países com Melhora: {summary['improved']} ({summary['improved_pct']:.1f}%)"),
+                            html.P(f"Países com Piora: {summary['worsened']} ({summary['worsened_pct']:.1f}%)")
+                        ])
+                    ])
+                ], className="mb-4")
+            ])
+        ]),
+        
+        dbc.Row([
+            dbc.Col([
+                html.P(
+                    "Fonte: Trading Economics - Dados extraídos em " + 
+                    datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
+                    className="text-muted text-center"
+                ),
+                html.P(
+                    "Dashboard desenvolvido com Python, Dash e Plotly",
+                    className="text-muted text-center"
+                )
+            ])
+        ])
+    ], fluid=True)
+    
+    # Cache das figuras: os dados não mudam enquanto o app está no ar
+    figure_cache = FigureCache()
+    app.figure_cache = figure_cache
+    if data_version is None:
+        data_version = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    # Callback para atualizar o gráfico principal
+    @app.callback(
+        Output('main-chart', 'figure'),
+        [Input('chart-type', 'value')]
+    )
+    def update_chart(chart_type):
+        """Atualiza o gráfico principal com base no tipo selecionado (usando o cache de figuras)."""
+        return figure_cache.get_or_build(chart_type, data_version, 'bootstrap', lambda: build_chart(chart_type))
+    
+    def build_chart(chart_type):
+        """Constrói o gráfico principal para o tipo selecionado."""
+        if chart_type == 'heatmap':
+            # Criar um pivot table para o mapa de calor
+            pivot_df = df.pivot_table(
+                values='Last', 
+                index='Country', 
+                columns='Region', 
+                aggfunc='first',
+                observed=True
+            ).fillna(0)
+            
+            fig = px.imshow(
+                pivot_df,
+                labels=dict(x="Região", y="País", color="Taxa de Desemprego (%)"),
+                title="Mapa de Calor das Taxas de Desemprego por Região",
+                color_continuous_scale='YlOrRd'
+            )
+            
+            return fig
+            
+        elif chart_type == 'bar_current':
+            # Ordenar por taxa atual
+            sorted_df = df.sort_values('Last', ascending=False)
+            
+            # Região como object: agrupar por cor em coluna categórica gera FutureWarning no pandas
+            fig = px.bar(
+                sorted_df.astype({'Region': 'object'}),
+                x='Country',
+                y='Last',
+                color='Region',
+                title="Taxa de Desemprego Atual por País",
+                hover_data=['Reference', 'MonthsStale'],
+                labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País', 'MonthsStale': 'Meses desde a Referência'},
+                color_discrete_sequence=px.colors.qualitative.Set3
+            )
+            
+            fig.update_layout(xaxis_tickangle=-45)
+            return fig
+            
+        elif chart_type == 'bar_compare':
+            # Selecionar os 15 principais países para melhor visualização
+            top_df = df.sort_values('Last', ascending=False).head(15)
+            
+            fig = go.Figure()
+            
+            fig.add_trace(go.Bar(
+                x=top_df['Country'],
+                y=top_df['Last'],
+                name='Taxa Atual',
+                marker_color='indianred'
+            ))
+            
+            fig.add_trace(go.Bar(
+                x=top_df['Country'],
+                y=top_df['Previous'],
+                name='Taxa Anterior',
+                marker_color='lightsalmon'
+            ))
+            
+            fig.update_layout(
+                title="Comparação: Taxa de Desemprego Atual vs Anterior (Top 15)",
+                xaxis_title="País",
+                yaxis_title="Taxa de Desemprego (%)",
+                barmode='group',
+                xaxis_tickangle=-45
+            )
+            
+            return fig
+            
+        elif chart_type == 'scatter':
+            # O tamanho do marcador não aceita valores ausentes
+            fig = px.scatter(
+                df.dropna(subset=['Last']).astype({'Region': 'object'}),
+                x='Last',
+                y='Change',
+                color='Region',
+                size='Last',
+                hover_name='Country',
+                hover_data=['Reference', 'MonthsStale'],
+                title="Relação entre Taxa Atual e Variação Percentual",
+                labels={
+                    'Last': 'Taxa de Desemprego Atual (%)',
+                    'Change': 'Variação em relação à taxa anterior (%)',
+                    'MonthsStale': 'Meses desde a Referência'
+                },
+                color_discrete_sequence=px.colors.qualitative.Pastel
+            )
+            
+            # Adicionar linha horizontal em y=0 para referência
+            fig.add_hline(y=0, line_dash="dash", line_color="gray")
+            
+            return fig
+            
+        elif chart_type == 'treemap':
+            # O treemap agrupa pelo caminho: categorias viram texto para não gerar combinações vazias
+            fig = px.treemap(
+                df.astype({'Region': 'object', 'Country': 'object'}),
+                path=[px.Constant("Américas"), 'Region', 'Country'],
+                values='Last',
+                color='Last',
+                hover_data=['Previous', 'Change', 'Reference', 'MonthsStale'],
+                color_continuous_scale='RdBu_r',
+                title="Treemap das Taxas de Desemprego por Região e País"
+            )
+            
+            return fig
+            
+        elif chart_type == 'top5_high':
+            # Top 5 maiores taxas
+            top5_df = df.sort_values('Last', ascending=False).head(5)
+            
+            fig = px.bar(
+                top5_df,
+                x='Country',
+                y='Last',
+                color='Last',
+                text='Last',
+                title="Top 5 Países com Maiores Taxas de Desemprego",
+                labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'},
+                color_continuous_scale='Reds'
+            )
+            
+            fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
+            
+            return fig
+            
+        elif chart_type == 'top5_low':
+            # Top 5 menores taxas
+            top5_df = df.sort_values('Last').head(5)
+            
+            fig = px.bar(
+                top5_df,
+                x='Country',
+                y='Last',
+                color='Last',
+                text='Last',
+                title="Top 5 Países com Menores Taxas de Desemprego",
+                labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'},
+                color_continuous_scale='Greens'
+            )
+            
+            fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
+            
+            return fig
+        
+        # Caso padrão
+        return px.bar(
+            df.sort_values('Last', ascending=False),
+            x='Country',
+            y='Last',
+            title="Taxa de Desemprego Atual por País",
+            labels={'Last': 'Taxa de Desemprego (%)', 'Country': 'País'}
+        )
+    
+    return app
+
+def main():
+    """Função principal que executa o fluxo de extração, processamento e visualização dos dados."""
+    parser = argparse.ArgumentParser(description="Extração de dados de desemprego nas Américas")
+    parser.add_argument(
+        '--export', nargs='*', choices=EXPORT_FORMATS, default=[],
+        help="Exportações adicionais geradas em segundo plano (ex.: --export csv xlsx)"
+    )
+    parser.add_argument(
+        '--report-dir', default=DEFAULT_REPORT_DIR,
+        help="Pasta dos relatórios de execução em JSON (padrão: data/reports)"
+    )
+    args = parser.parse_args()
+    
+    # Relatório da execução: duração de cada fase, linhas e estratégia de extração
+    report = RunReport(args.report_dir)
+    report.set('url', UNEMPLOYMENT_URL)
+    report.set('profile', os.environ.get('SCRAPE_PROFILE', 'debug'))
+    report.set('exports', list(args.export))
+    
+    print("Iniciando extração de dados de desemprego nas Américas...")
+    
+    try:
+        # Extrair dados
+        with report.phase('extract'):
+            df = extract_unemployment_data(report=report)
+        report.set_rows('extracted', len(df))
+        
+        static_fallback = bool(report.fields.get('static_fallback'))
+        
+        # Salvar dados brutos
+        with report.phase('save'):
+            snapshot_path = save_data(df, exports=args.export, report=report, static_fallback=static_fallback)
+        snapshot_id = os.path.splitext(os.path.basename(snapshot_path))[0]
+        
+        # Incorporar a extração ao histórico (uma linha por país e mês de referência).
+        # Os dados estáticos de create_static_data() não entram: sobrescreveriam valores reais
+        if static_fallback:
+            logger.warning("Extração usou os dados estáticos; histórico não atualizado")
+        else:
+            try:
+                with report.phase('history.ingest'):
+                    report.set_rows('history_added', HistoryStore().ingest(df, snapshot_id))
+            except Exception as e:
+                logger.error(f"Erro ao atualizar o histórico: {str(e)}")
+        
+        # Preparar dados para o dashboard
+        with report.phase('prepare'):
+            df_dashboard = prepare_data_for_dashboard(df, report=report)
+        report.set_rows('dashboard', len(df_dashboard))
+        
+        # Gravar o relatório antes de iniciar o servidor (que só termina quando o processo é encerrado)
+        report.finish()
+        print(f"Relatório da execução salvo em {report.save()}")
+        
+        # Exibir informações sobre os dados extraídos
+        print(f"Dados extraídos com sucesso! Total de {len(df)} países com dados de desemprego.")
+        print("\nPrimeiros 5 países:")
+        print(df.head())
+        
+        print("\nCriando e iniciando o dashboard...")
+        
+        # Criar e iniciar o dashboard
+        app = create_dashboard(df_dashboard, data_version=snapshot_id)
+        
+        print("\nDashboard pronto! Iniciando servidor...")
+        print("Acesse o dashboard em http://127.0.0.1:8050/")
+        
+        # Iniciar o servidor de desenvolvimento (DASHBOARD_DEBUG=0 desativa o modo debug)
+        app.run(debug=os.environ.get('DASHBOARD_DEBUG', '1') == '1')
+    
+    except Exception as e:
+        print(f"Erro durante a execução: {str(e)}")
+        logger.error(f"Erro durante a execução: {str(e)}", exc_info=True)
+        if report.status == 'running':
+            report.finish(error=e)
+            report.save()
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,319 @@
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from flask import Response, g, request
+
+# Limites dos buckets de latência (segundos) e de tamanho das respostas (bytes)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Intervalo (segundos) entre as gravações do estado de cada processo no modo multiprocesso
+DEFAULT_FLUSH_INTERVAL = 5
+
+logger = logging.getLogger(__name__)
+
+# Rótulo usado para valores fora do conjunto conhecido (ex.: callbacks inexistentes)
+UNKNOWN_LABEL = 'unknown'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labelnames, values, extra=None):
+    pairs = list(zip(labelnames, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+class Counter:
+    """Contador com rótulos, exportado no formato texto do Prometheus."""
+
+    type = 'counter'
+
+    def __init__(self, registry, name, documentation, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        if not self.registry.enabled:
+            return
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def state(self):
+        """Valores atuais como lista serializável em JSON: [[rótulos], valor]."""
+        with self._lock:
+            return [[list(key), value] for key, value in self._values.items()]
+
+    @staticmethod
+    def merge(values, state):
+        """Soma um estado (de state()) ao dicionário values."""
+        for key, value in state:
+            key = tuple(key)
+            values[key] = values.get(key, 0) + value
+
+    def reset(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def samples(self, values):
+        for key, value in sorted(values.items()):
+            yield f'{self.name}{_format_labels(self.labelnames, key)} {value}'
+
+
+class Histogram:
+    """Histograma com buckets fixos e rótulos, exportado no formato texto do Prometheus.
+
+    Cada observação custa uma busca binária e um incremento sob lock; os
+    percentis (ex.: p99) são calculados pelo Prometheus com histogram_quantile.
+    """
+
+    type = 'histogram'
+
+    def __init__(self, registry, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        if not self.registry.enabled:
+            return
+        key = tuple(labels[name] for name in self.labelnames)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Contagens por bucket (o último é +Inf), soma e número de observações
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Mede a duração do bloco `with` e a registra no histograma."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def state(self):
+        """Valores atuais como lista serializável em JSON: [[rótulos], [contagens, soma, total]]."""
+        with self._lock:
+            return [[list(key), [list(counts), total, count]] for key, (counts, total, count) in self._values.items()]
+
+    @staticmethod
+    def merge(values, state):
+        """Soma um estado (de state()) ao dicionário values, bucket a bucket."""
+        for key, (counts, total, count) in state:
+            key = tuple(key)
+            current = values.get(key)
+            if current is None:
+                values[key] = [list(counts), total, count]
+                continue
+            current[0] = [a + b for a, b in zip(current[0], counts)]
+            current[1] += total
+            current[2] += count
+
+    def reset(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def samples(self, values):
+        for key, (counts, total, count) in sorted(values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                yield f'{self.name}_bucket{_format_labels(self.labelnames, key, ("le", le))} {cumulative}'
+            yield f'{self.name}_sum{_format_labels(self.labelnames, key)} {total}'
+            yield f'{self.name}_count{_format_labels(self.labelnames, key)} {count}'
+
+
+class MetricsRegistry:
+    """Conjunto de métricas do processo; com enabled=False, as observações são ignoradas.
+
+    Com multiprocess_dir (ex.: vários workers do gunicorn), cada processo grava o seu
+    estado em um arquivo JSON na pasta a cada flush_interval segundos, e render()
+    soma os arquivos de todos os processos: qualquer worker que atenda /metrics
+    publica os totais do servidor. Arquivos de workers já encerrados continuam
+    somando, para que os contadores não voltem atrás quando um worker é reciclado.
+    """
+
+    def __init__(self, enabled=True, multiprocess_dir=None, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        self.enabled = enabled
+        self.multiprocess_dir = multiprocess_dir
+        self.flush_interval = flush_interval
+        self._metrics = []
+        self._state_path = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._fork_hook = False
+
+    def counter(self, name, documentation, labelnames=()):
+        metric = Counter(self, name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        metric = Histogram(self, name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def start(self):
+        """Inicia a gravação periódica do estado (apenas no modo multiprocesso).
+
+        Como em DataProvider.start(), a thread não sobrevive ao fork: cada worker
+        recomeça com valores zerados e o seu próprio arquivo.
+        """
+        if not (self.enabled and self.multiprocess_dir) or (self._thread is not None and self._thread.is_alive()):
+            return
+        os.makedirs(self.multiprocess_dir, exist_ok=True)
+        # pid e instante de início: um pid reaproveitado não sobrescreve o arquivo de um worker encerrado
+        self._state_path = os.path.join(self.multiprocess_dir, f'metrics_{os.getpid()}_{time.time_ns()}.json')
+        if not self._fork_hook and hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+            self._fork_hook = True
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._flush_loop, name='metrics-flush', daemon=True)
+        self._thread.start()
+
+    def _after_fork(self):
+        # Os valores do processo pai já estão no arquivo dele; os locks podem ter sido copiados travados
+        for metric in self._metrics:
+            metric.reset()
+        self._thread = None
+        self.start()
+
+    def stop(self):
+        self._stop.set()
+        self.flush()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Grava o estado do processo no seu arquivo (sem efeito fora do modo multiprocesso)."""
+        if self._state_path is None:
+            return
+        state = {metric.name: metric.state() for metric in self._metrics}
+        tmp_path = f'{self._state_path}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self._state_path)
+        except OSError as e:
+            logger.error(f"Erro ao gravar as métricas em {self._state_path}: {e}")
+
+    def _collect(self):
+        """Valores de cada métrica: do processo atual ou somados de todos os processos."""
+        values = {metric.name: {} for metric in self._metrics}
+        if self._state_path is None:
+            for metric in self._metrics:
+                metric.merge(values[metric.name], metric.state())
+            return values
+
+        self.flush()
+        for path in glob.glob(os.path.join(self.multiprocess_dir, 'metrics_*.json')):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for metric in self._metrics:
+                metric.merge(values[metric.name], state.get(metric.name, []))
+        return values
+
+    def render(self):
+        """Todas as métricas no formato texto do Prometheus."""
+        values = self._collect()
+        lines = []
+        for metric in self._metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.type}')
+            lines.extend(metric.samples(values[metric.name]))
+        return '\n'.join(lines) + '\n'
+
+
+def callback_label(output, known_outputs=None):
+    """Nome do callback a partir do campo output da requisição do Dash.
+
+    Saídas múltiplas ('..data-table.data...data-table.page_count..') viram
+    'data-table.data+data-table.page_count'. Com known_outputs (ex.: app.callback_map),
+    saídas desconhecidas viram UNKNOWN_LABEL, para que requisições com valores
+    arbitrários não criem novas séries.
+    """
+    if not isinstance(output, str) or (known_outputs is not None and output not in known_outputs):
+        return UNKNOWN_LABEL
+    if output.startswith('..') and output.endswith('..'):
+        return '+'.join(part.strip('.') for part in output[2:-2].split('...'))
+    return output
+
+
+def instrument_dash(app, registry, path='/metrics'):
+    """Mede latência, tamanho das respostas e erros dos callbacks do Dash e publica em `path`.
+
+    As medições são feitas no servidor Flask, em torno de /_dash-update-component,
+    então valem para todos os callbacks sem alterar cada um deles.
+    """
+    server = app.server
+    callback_path = app.config.routes_pathname_prefix + '_dash-update-component'
+
+    latency = registry.histogram(
+        'dashboard_callback_duration_seconds', 'Duração dos callbacks do Dash', ['callback']
+    )
+    payload = registry.histogram(
+        'dashboard_callback_response_bytes', 'Tamanho das respostas dos callbacks do Dash (antes da compressão)',
+        ['callback'], buckets=SIZE_BUCKETS
+    )
+    errors = registry.counter(
+        'dashboard_callback_errors_total', 'Callbacks do Dash que terminaram com erro', ['callback']
+    )
+
+    @server.before_request
+    def start_callback_timer():
+        if request.path == callback_path:
+            g.metrics_start = time.perf_counter()
+
+    @server.after_request
+    def record_callback(response):
+        start = g.pop('metrics_start', None)
+        if start is None:
+            return response
+        body = request.get_json(silent=True) or {}
+        label = callback_label(body.get('output'), app.callback_map)
+        latency.observe(time.perf_counter() - start, callback=label)
+        if response.status_code >= 500:
+            errors.inc(callback=label)
+        elif response.content_length is not None:
+            payload.observe(response.content_length, callback=label)
+        return response
+
+    @server.route(path)
+    def metrics():
+        return Response(registry.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+    return metrics
@@ -0,0 +1,133 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Pasta padrão dos relatórios de execução (um JSON por execução)
+DEFAULT_REPORT_DIR = os.path.join('data', 'reports')
+
+
+class RunReport:
+    """Relatório estruturado de uma execução do pipeline de extração.
+
+    Registra a duração de cada fase (na ordem em que foram executadas), a
+    contagem de linhas de cada etapa, a estratégia de extração que funcionou
+    e se os dados estáticos foram usados. Com enabled=False, nada é registrado.
+    """
+
+    def __init__(self, report_dir=DEFAULT_REPORT_DIR, enabled=True):
+        self.enabled = enabled
+        self.started_at = datetime.now()
+        self.run_id = self.started_at.strftime('%Y%m%d_%H%M%S')
+        self.path = os.path.join(report_dir, f'run_{self.run_id}.json')
+        self.status = 'running'
+        self.error = None
+        self.finished_at = None
+        self.phases = []
+        self.rows = {}
+        self.fields = {'strategy': None, 'static_fallback': False}
+        self._start = time.perf_counter()
+        self._duration = None
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        """Mede a duração do bloco `with` como a fase `name` (ex.: 'extract.http').
+
+        Exceções são registradas na fase e repassadas.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        # offset: início da fase em segundos desde o início da execução (para linhas do tempo)
+        entry = {'name': name, 'offset': round(start - self._start, 6), 'status': 'ok'}
+        try:
+            yield
+        except BaseException as e:
+            entry['status'] = 'error'
+            entry['error'] = f'{type(e).__name__}: {e}'
+            raise
+        finally:
+            entry['seconds'] = round(time.perf_counter() - start, 6)
+            with self._lock:
+                self.phases.append(entry)
+
+    def set(self, key, value):
+        """Registra um campo do relatório (ex.: 'strategy', 'snapshot')."""
+        with self._lock:
+            self.fields[key] = value
+
+    def set_rows(self, stage, count):
+        """Registra a quantidade de linhas de uma etapa (ex.: 'extracted', 'dashboard')."""
+        with self._lock:
+            self.rows[stage] = int(count)
+
+    def finish(self, error=None):
+        """Encerra a contagem do tempo total e define o status da execução."""
+        with self._lock:
+            self.finished_at = datetime.now()
+            self._duration = time.perf_counter() - self._start
+            self.status = 'error' if error is not None else 'ok'
+            self.error = str(error) if error is not None else None
+
+    def to_dict(self):
+        with self._lock:
+            duration = self._duration if self._duration is not None else time.perf_counter() - self._start
+            return {
+                'run_id': self.run_id,
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'finished_at': self.finished_at.isoformat(timespec='seconds') if self.finished_at else None,
+                'status': self.status,
+                'error': self.error,
+                'total_seconds': round(duration, 6),
+                **self.fields,
+                'rows': dict(self.rows),
+                'phases': [dict(entry) for entry in self.phases],
+            }
+
+    def save(self):
+        """Grava (ou regrava) o relatório em JSON e retorna o caminho, ou None se desativado.
+
+        Pode ser chamado de novo depois que fases em segundo plano (ex.: exportações) terminam.
+        """
+        if not self.enabled:
+            return None
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        # A última gravação sempre parte do estado mais recente do relatório
+        with self._save_lock:
+            report = self.to_dict()
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        return self.path
+
+
+# Relatório desativado, usado quando as funções do pipeline são chamadas sem relatório
+NULL_REPORT = RunReport(enabled=False)
+
+
+def load_reports(report_dir=DEFAULT_REPORT_DIR):
+    """Carrega todos os relatórios da pasta, do mais antigo para o mais recente."""
+    if not os.path.isdir(report_dir):
+        return []
+    reports = []
+    for filename in sorted(os.listdir(report_dir)):
+        if not (filename.startswith('run_') and filename.endswith('.json')):
+            continue
+        try:
+            with open(os.path.join(report_dir, filename), encoding='utf-8') as f:
+                reports.append(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Relatório inválido ignorado ({filename}): {str(e)}")
+    return reports
@@ -0,0 +1,76 @@
+"""Servidor de produção do dashboard (sem debug e sem recarregamento automático do código).
+
+Usa o gunicorn (Linux/macOS), com a configuração de gunicorn.conf.py, ou o waitress
+(Windows, ou quando o gunicorn não está instalado).
+
+Uso: python serve.py [--server gunicorn|waitress] [--bind 0.0.0.0:8050] [--workers 4] [--threads 4] [--timeout 60]
+"""
+import argparse
+import importlib.util
+import logging
+import os
+import sys
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def default_server():
+    """gunicorn quando disponível (não roda no Windows), senão waitress."""
+    if sys.platform != 'win32' and importlib.util.find_spec('gunicorn') is not None:
+        return 'gunicorn'
+    return 'waitress'
+
+
+def run_gunicorn(args):
+    """Substitui o processo atual pelo gunicorn, com gunicorn.conf.py e as opções informadas."""
+    command = [
+        sys.executable, '-m', 'gunicorn',
+        '--config', os.path.join(BASE_DIR, 'gunicorn.conf.py'),
+        '--chdir', os.getcwd(),
+        '--pythonpath', BASE_DIR,
+    ]
+    if args.bind:
+        command += ['--bind', args.bind]
+    if args.workers:
+        command += ['--workers', str(args.workers)]
+    if args.threads:
+        command += ['--threads', str(args.threads)]
+    if args.timeout:
+        command += ['--timeout', str(args.timeout)]
+    command.append('dashboard:server')
+    os.execv(sys.executable, command)
+
+
+def run_waitress(args):
+    """Serve o app com o waitress: um processo, várias threads, dados carregados uma vez."""
+    from waitress import serve
+
+    from dashboard import server
+
+    host, _, port = (args.bind or os.environ.get('DASHBOARD_BIND', '0.0.0.0:8050')).rpartition(':')
+    threads = args.threads or int(os.environ.get('DASHBOARD_THREADS', 8))
+    timeout = args.timeout or int(os.environ.get('DASHBOARD_TIMEOUT', 60))
+    logger.info(f"Servindo o dashboard com waitress em {host}:{port} ({threads} threads)")
+    serve(server, host=host, port=int(port), threads=threads, channel_timeout=timeout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor de produção do dashboard de desemprego")
+    parser.add_argument('--server', choices=['gunicorn', 'waitress'], default=default_server())
+    parser.add_argument('--bind', help="Endereço e porta (padrão: DASHBOARD_BIND ou 0.0.0.0:8050)")
+    parser.add_argument('--workers', type=int, help="Processos do gunicorn (padrão: DASHBOARD_WORKERS)")
+    parser.add_argument('--threads', type=int, help="Threads por processo (padrão: DASHBOARD_THREADS)")
+    parser.add_argument('--timeout', type=int, help="Tempo limite por requisição, em segundos")
+    args = parser.parse_args()
+
+    if args.server == 'gunicorn':
+        run_gunicorn(args)
+    else:
+        run_waitress(args)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
@@ -0,0 +1,220 @@
+import bisect
+import glob
+import hashlib
+import json
+import logging
+import os
+import threading
+from contextlib import nullcontext
+from datetime import datetime
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Formato principal dos snapshots (colunar, preserva os tipos das colunas)
+SNAPSHOT_EXTENSION = '.parquet'
+
+# Exportações opcionais geradas em segundo plano a partir do snapshot
+EXPORT_FORMATS = ('csv', 'xlsx')
+
+NUMERIC_COLUMNS = ['Last', 'Previous']
+
+
+def parse_numeric_columns(df):
+    """Converte as colunas numéricas do scraping (texto) para números."""
+    df = df.copy()
+    for col in NUMERIC_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+
+def _atomic_write(path, writer):
+    """Grava em um arquivo temporário na mesma pasta e renomeia ao final.
+
+    Leitores nunca enxergam um arquivo pela metade: ou o arquivo antigo, ou o novo completo.
+    """
+    directory, filename = os.path.split(path)
+    stem, extension = os.path.splitext(filename)
+    # Arquivo oculto e com a mesma extensão (o pandas escolhe o engine pela extensão)
+    tmp_path = os.path.join(directory, f'.{stem}.tmp{extension}')
+    try:
+        writer(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def write_snapshot(df, path):
+    """Grava o DataFrame como snapshot Parquet, com as colunas numéricas já convertidas."""
+    df = parse_numeric_columns(df)
+    _atomic_write(path, lambda tmp: df.to_parquet(tmp, index=False))
+    return path
+
+
+def export_snapshot(df, snapshot_path, formats=EXPORT_FORMATS, report=None):
+    """Gera as exportações CSV/Excel ao lado do snapshot e retorna os caminhos criados.
+
+    Com um RunReport, cada formato é registrado como a fase 'export.<formato>'.
+    """
+    base_path = os.path.splitext(snapshot_path)[0]
+    paths = []
+    for fmt in formats:
+        path = f'{base_path}.{fmt}'
+        with report.phase(f'export.{fmt}') if report is not None else nullcontext():
+            if fmt == 'csv':
+                _atomic_write(path, lambda tmp: df.to_csv(tmp, index=False))
+            elif fmt == 'xlsx':
+                _atomic_write(path, lambda tmp: df.to_excel(tmp, index=False))
+            else:
+                raise ValueError(f"Formato de exportação desconhecido: {fmt}")
+        paths.append(path)
+    return paths
+
+
+def export_snapshot_async(df, snapshot_path, formats=EXPORT_FORMATS, report=None):
+    """Gera as exportações em uma thread separada, fora do caminho crítico.
+
+    A thread não é daemon: o processo só termina depois que as exportações acabam.
+    Com um RunReport, o relatório é gravado de novo ao final, já com as durações das exportações.
+    """
+    def run():
+        try:
+            paths = export_snapshot(df, snapshot_path, formats, report)
+            logger.info(f"Exportações geradas: {', '.join(paths)}")
+        except Exception as e:
+            logger.error(f"Erro ao gerar exportações de {snapshot_path}: {str(e)}")
+        if report is not None and report.status != 'running':
+            report.save()
+
+    thread = threading.Thread(target=run, name='snapshot-export')
+    thread.start()
+    return thread
+
+
+def find_latest_snapshot(data_dir='data', manifest=None):
+    """Retorna o snapshot mais recente da pasta.
+
+    Usa o manifest (sem listar a pasta); para pastas sem manifest, de execuções
+    antigas, procura o arquivo Parquet ou CSV mais recente. Um SnapshotManifest
+    já criado pode ser informado para reaproveitar as entradas em cache.
+    """
+    manifest = manifest or SnapshotManifest(data_dir)
+    path = manifest.resolve_path(manifest.latest())
+    if path and os.path.exists(path):
+        return path
+
+    list_of_files = glob.glob(os.path.join(data_dir, f'*{SNAPSHOT_EXTENSION}'))
+    if not list_of_files:
+        list_of_files = glob.glob(os.path.join(data_dir, '*.csv'))
+    return max(list_of_files, key=os.path.getctime) if list_of_files else None
+
+
+def load_snapshot(path):
+    """Carrega um snapshot, lendo Parquet diretamente ou CSV (formato antigo)."""
+    if path.endswith(SNAPSHOT_EXTENSION):
+        return pd.read_parquet(path)
+    return parse_numeric_columns(pd.read_csv(path))
+
+
+class SnapshotManifest:
+    """Índice append-only dos snapshots de uma pasta (um JSON por linha em manifest.jsonl).
+
+    Cada entrada guarda id, arquivo, número de linhas, hash SHA-256 e data de criação.
+    As entradas ficam em memória, ordenadas por criação, e o arquivo só é relido
+    quando muda: latest(), at() e recent() seguem a mesma ordem, mesmo que o arquivo
+    tenha sido copiado ou restaurado fora de ordem.
+    """
+
+    FILENAME = 'manifest.jsonl'
+
+    def __init__(self, data_dir='data'):
+        self.data_dir = data_dir
+        self.path = os.path.join(data_dir, self.FILENAME)
+        self._lock = threading.Lock()
+        self._cache_key = None
+        self._entries = []
+        self._created_at = []
+
+    def append(self, snapshot_path, df, static_fallback=False):
+        """Registra um snapshot recém-gravado e retorna a entrada criada.
+
+        static_fallback marca snapshots gravados com os dados estáticos de reserva,
+        que não devem entrar no histórico.
+        """
+        filename = os.path.basename(snapshot_path)
+        entry = {
+            'snapshot_id': os.path.splitext(filename)[0],
+            'path': filename,
+            'rows': int(len(df)),
+            'sha256': _file_sha256(snapshot_path),
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'static_fallback': bool(static_fallback),
+        }
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        return entry
+
+    def latest(self):
+        """Retorna a entrada criada por último (ou None), pela mesma ordem usada em at()."""
+        try:
+            entries = self._load()[0]
+        except (OSError, ValueError):
+            return None
+        return entries[-1] if entries else None
+
+    def _load(self):
+        """Retorna (entradas, datas de criação) em cache, relendo o arquivo apenas quando ele muda.
+
+        As listas são substituídas (nunca alteradas) a cada releitura; quem as recebe
+        não deve modificá-las.
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return [], []
+        cache_key = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if cache_key != self._cache_key:
+                with open(self.path, encoding='utf-8') as f:
+                    entries = [json.loads(line) for line in f if line.strip()]
+                entries.sort(key=lambda entry: entry['created_at'])
+                self._entries = entries
+                # Chaves ordenadas para a busca binária de at(), montadas uma vez por releitura
+                self._created_at = [entry['created_at'] for entry in entries]
+                self._cache_key = cache_key
+            return self._entries, self._created_at
+
+    def entries(self):
+        """Retorna todas as entradas, relendo o arquivo apenas quando ele muda."""
+        return list(self._load()[0])
+
+    def recent(self, count):
+        """Retorna as `count` entradas mais recentes (ordenadas por criação)."""
+        return list(self._load()[0][-count:]) if count > 0 else []
+
+    def at(self, when):
+        """Retorna o snapshot vigente no instante `when` (o último criado até essa data)."""
+        if isinstance(when, datetime):
+            when = when.isoformat(timespec='seconds')
+        entries, created_at = self._load()
+        index = bisect.bisect_right(created_at, when)
+        return entries[index - 1] if index else None
+
+    def resolve_path(self, entry):
+        """Converte uma entrada no caminho do arquivo de snapshot."""
+        return os.path.join(self.data_dir, entry['path']) if entry else None
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,206 @@
+import argparse
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+
+import requests
+from flask import request
+
+logger = logging.getLogger(__name__)
+
+# Pasta servida pelo Dash em /assets/ e índice dos arquivos gerados (nome lógico -> arquivo com hash)
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+MANIFEST_FILENAME = 'asset-manifest.json'
+
+# Arquivos gerados levam o hash do conteúdo no nome (ex.: bootstrap.3f2a9c01b7de.css),
+# então podem ficar em cache no navegador por tempo indeterminado
+HASHED_FILENAME = re.compile(r'\.[0-9a-f]{12}\.[A-Za-z0-9]+$')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# O Dash inclui automaticamente todo .css/.js da pasta assets; os arquivos com hash são
+# incluídos explicitamente (na ordem certa) via external_stylesheets
+ASSETS_IGNORE = r'\.[0-9a-f]{12}\.(css|js)$'
+
+# Origem de cada arquivo (também usada como fallback enquanto os arquivos locais não existem)
+BOOTSTRAP_URL = 'https://cdn.jsdelivr.net/npm/bootswatch@5.3.1/dist/darkly/bootstrap.min.css'
+FONTS_URL = 'https://fonts.googleapis.com/css2?family=Open+Sans:wght@300;400;600;700&display=swap'
+BACKGROUND_URL = 'https://images.unsplash.com/photo-1477959858617-67f85cf4f1df?ixlib=rb-4.0.3&auto=format&fit=crop&w=1920&q=80'
+
+CDN_FALLBACKS = {
+    'bootstrap.css': BOOTSTRAP_URL,
+    'fonts.css': FONTS_URL,
+    'background.webp': BACKGROUND_URL,
+}
+
+# Subconjuntos de caracteres da fonte mantidos (português usa apenas latin)
+DEFAULT_FONT_SUBSETS = ('latin', 'latin-ext')
+
+# O Google Fonts só envia WOFF2 (com unicode-range por subconjunto) para navegadores modernos
+FONTS_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+
+def load_manifest(assets_dir=ASSETS_DIR):
+    """Retorna o índice dos arquivos gerados ({} se static_assets.py ainda não foi executado)."""
+    try:
+        with open(os.path.join(assets_dir, MANIFEST_FILENAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class StaticAssets:
+    """Endereços dos arquivos estáticos do dashboard: locais (com hash) ou, na falta deles, CDN."""
+
+    def __init__(self, assets_dir=ASSETS_DIR, fallbacks=CDN_FALLBACKS, assets_url='/assets/'):
+        self.manifest = load_manifest(assets_dir)
+        self.fallbacks = fallbacks
+        self.assets_url = assets_url
+        if not self.manifest:
+            logger.info("Arquivos estáticos locais não encontrados; usando CDN (execute python static_assets.py)")
+
+    @property
+    def local(self):
+        return bool(self.manifest)
+
+    def url(self, name):
+        """Endereço do arquivo: /assets/<nome com hash> ou o endereço externo original."""
+        if name in self.manifest:
+            return self.assets_url + self.manifest[name]
+        return self.fallbacks[name]
+
+    def install_cache_headers(self, server):
+        """Adiciona Cache-Control de longa duração às respostas de arquivos com hash no nome."""
+        prefix = self.assets_url
+
+        @server.after_request
+        def immutable_assets(response):
+            if (request.path.startswith(prefix) and response.status_code in (200, 304)
+                    and HASHED_FILENAME.search(request.path)):
+                response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+            return response
+
+        return immutable_assets
+
+
+def _hashed_name(name, content):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}{ext}"
+
+
+def _write_asset(assets_dir, name, content):
+    """Grava o conteúdo com o hash no nome e retorna o nome do arquivo."""
+    filename = _hashed_name(name, content)
+    with open(os.path.join(assets_dir, filename), 'wb') as f:
+        f.write(content)
+    logger.info(f"{filename}: {len(content) / 1024:.1f} KB")
+    return filename
+
+
+def _download(session, url, **kwargs):
+    response = session.get(url, timeout=30, **kwargs)
+    response.raise_for_status()
+    return response
+
+
+def build_background(session, url=BACKGROUND_URL, max_width=1920, quality=70):
+    """Baixa a imagem de fundo, reduz para max_width e converte para WebP."""
+    try:
+        from PIL import Image
+    except ImportError:
+        raise RuntimeError("Pillow é necessário para gerar a imagem WebP (pip install Pillow)")
+
+    image = Image.open(io.BytesIO(_download(session, url).content))
+    if image.width > max_width:
+        image = image.resize((max_width, round(image.height * max_width / image.width)), Image.LANCZOS)
+    output = io.BytesIO()
+    image.convert('RGB').save(output, 'WEBP', quality=quality, method=6)
+    return output.getvalue()
+
+
+def build_bootstrap(session, url=BOOTSTRAP_URL):
+    """Baixa o tema Bootstrap, sem o @import de fontes externas (o dashboard usa Open Sans)."""
+    css = _download(session, url).text
+    css = re.sub(r'@import url\([^)]*fonts\.googleapis\.com[^)]*\);?', '', css)
+    return css.encode('utf-8')
+
+
+def build_fonts(session, assets_dir, url=FONTS_URL, subsets=DEFAULT_FONT_SUBSETS):
+    """Baixa a fonte Open Sans apenas nos subconjuntos informados.
+
+    Retorna o CSS (com os endereços reescritos para os arquivos locais) e o
+    índice dos arquivos WOFF2 gravados (nome lógico -> arquivo com hash).
+    """
+    css = _download(session, url, headers={'User-Agent': FONTS_USER_AGENT}).text
+    blocks = re.findall(r'/\*\s*([\w-]+)\s*\*/\s*(@font-face\s*\{[^}]*\})', css)
+    if not blocks:
+        raise RuntimeError("Resposta inesperada do Google Fonts (nenhum @font-face encontrado)")
+
+    font_files = {}
+    kept = []
+    for subset, block in blocks:
+        if subset not in subsets:
+            continue
+        weight = re.search(r'font-weight:\s*(\d+)', block)
+        for font_url in re.findall(r'url\(([^)]+)\)', block):
+            if font_url not in font_files:
+                # Fontes variáveis usam o mesmo arquivo para todos os pesos: baixado uma vez
+                name = f"open-sans-{subset}-{weight.group(1) if weight else 'regular'}{os.path.splitext(font_url)[1] or '.woff2'}"
+                font_files[font_url] = (name, _write_asset(assets_dir, name, _download(session, font_url).content))
+            block = block.replace(f'url({font_url})', f'url({font_files[font_url][1]})')
+        kept.append(f'/* {subset} */\n{block}')
+
+    return '\n'.join(kept).encode('utf-8'), dict(font_files.values())
+
+
+def build_assets(assets_dir=ASSETS_DIR, subsets=DEFAULT_FONT_SUBSETS, max_width=1920, quality=70):
+    """Gera os arquivos estáticos locais e o índice asset-manifest.json.
+
+    Arquivos de execuções anteriores que não fazem mais parte do índice são removidos.
+    """
+    os.makedirs(assets_dir, exist_ok=True)
+    previous = load_manifest(assets_dir)
+    session = requests.Session()
+
+    manifest = {
+        'bootstrap.css': _write_asset(assets_dir, 'bootstrap.css', build_bootstrap(session)),
+        'background.webp': _write_asset(
+            assets_dir, 'background.webp', build_background(session, max_width=max_width, quality=quality)
+        ),
+    }
+    fonts_css, font_files = build_fonts(session, assets_dir, subsets=subsets)
+    manifest['fonts.css'] = _write_asset(assets_dir, 'fonts.css', fonts_css)
+    manifest.update(font_files)
+
+    with open(os.path.join(assets_dir, MANIFEST_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    current = set(manifest.values())
+    for filename in set(previous.values()):
+        if filename not in current and os.path.exists(os.path.join(assets_dir, filename)):
+            os.remove(os.path.join(assets_dir, filename))
+    return manifest
+
+
+def main():
+    """Baixa e prepara os arquivos estáticos do dashboard para uso sem acesso à internet."""
+    parser = argparse.ArgumentParser(description="Gera os arquivos estáticos locais do dashboard em assets/")
+    parser.add_argument('--assets-dir', default=ASSETS_DIR)
+    parser.add_argument('--subsets', nargs='+', default=list(DEFAULT_FONT_SUBSETS),
+                        help="Subconjuntos da fonte (ex.: latin latin-ext)")
+    parser.add_argument('--max-width', type=int, default=1920, help="Largura máxima da imagem de fundo")
+    parser.add_argument('--quality', type=int, default=70, help="Qualidade WebP da imagem de fundo (0-100)")
+    args = parser.parse_args()
+
+    manifest = build_assets(args.assets_dir, args.subsets, args.max_width, args.quality)
+    print(f"{len(manifest)} arquivos gerados em {args.assets_dir}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
@@ -0,0 +1,180 @@
+import math
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data_prep import to_records
+
+# Casas decimais dos valores float32 exibidos na tabela (mesmo arredondamento de to_records)
+FLOAT32_DECIMALS = 4
+
+# Operadores de texto: o valor é sempre comparado como texto, sem conversão para número
+TEXT_OPERATORS = ('contains', 'datestartswith')
+
+# Operadores aceitos no filter_query do DataTable (forma por extenso e simbólica)
+FILTER_OPERATORS = [
+    ['ge ', '>='],
+    ['le ', '<='],
+    ['lt ', '<'],
+    ['gt ', '>'],
+    ['ne ', '!='],
+    ['eq ', '='],
+    ['contains '],
+    ['datestartswith '],
+]
+
+
+def split_filter_part(filter_part):
+    """Separa uma condição do filtro ('{Last} > 5') em (coluna, operador, valor)."""
+    for operator_type in FILTER_OPERATORS:
+        for operator in operator_type:
+            if operator in filter_part:
+                name_part, value_part = filter_part.split(operator, 1)
+                name = name_part[name_part.find('{') + 1: name_part.rfind('}')]
+                operator_name = operator_type[0].strip()
+                value_part = value_part.strip()
+                if not value_part:
+                    return None, None, None
+                quote = value_part[0]
+                if quote == value_part[-1] and quote in ("'", '"', '`') and len(value_part) > 1:
+                    value = value_part[1:-1].replace('\\' + quote, quote)
+                elif operator_name in TEXT_OPERATORS:
+                    # 'contains 10' deve encontrar 10.33: o texto não passa por float()
+                    value = value_part
+                else:
+                    try:
+                        value = float(value_part)
+                    except ValueError:
+                        value = value_part
+                return name, operator_name, value
+    return None, None, None
+
+
+def _numeric_values(series):
+    """Valores numéricos da coluna como float64, iguais aos exibidos na tabela.
+
+    Colunas float32 são arredondadas como em to_records, para que 6.4 seja
+    comparado como 6.4, e não como 6.400000095367432.
+    """
+    values = series.to_numpy(dtype='float64', na_value=np.nan)
+    if series.dtype == 'float32':
+        values = np.round(values, FLOAT32_DECIMALS)
+    return values
+
+
+def _string_mask(series, predicate):
+    """Aplica um teste de texto; em colunas categóricas, testa apenas as categorias distintas."""
+    if series.dtype == 'float32':
+        series = pd.Series(_numeric_values(series), index=series.index)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        matches = np.append(predicate(series.cat.categories.astype(str).to_series()).to_numpy(dtype=bool), False)
+        return matches[series.cat.codes.to_numpy()]
+    return predicate(series.astype(str)).to_numpy(dtype=bool) & series.notna().to_numpy()
+
+
+class TableIndex:
+    """Consulta paginada do DataTable no servidor (ordenação, filtro e paginação).
+
+    Guarda uma cópia enxuta das colunas da tabela e, para cada coluna/direção,
+    a ordem de ordenação calculada na primeira consulta, de modo que trocar de
+    página ou de filtro não reordena os dados de novo.
+    """
+
+    def __init__(self, df, columns):
+        self.df = df[columns].reset_index(drop=True)
+        self._sort_orders = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.df)
+
+    def sort_order(self, column, ascending=True):
+        """Posições das linhas ordenadas pela coluna (valores ausentes sempre no fim)."""
+        key = (column, ascending)
+        with self._lock:
+            order = self._sort_orders.get(key)
+        if order is None:
+            order = self.df[column].sort_values(
+                ascending=ascending, na_position='last', kind='stable'
+            ).index.to_numpy()
+            with self._lock:
+                self._sort_orders[key] = order
+        return order
+
+    def filter_mask(self, filter_query):
+        """Máscara booleana das linhas que atendem ao filter_query (None se não houver filtro)."""
+        if not filter_query:
+            return None
+
+        mask = np.ones(len(self.df), dtype=bool)
+        for filter_part in filter_query.split(' && '):
+            column, operator, value = split_filter_part(filter_part)
+            if column not in self.df.columns:
+                continue
+            mask &= self._condition_mask(self.df[column], operator, value)
+        return mask
+
+    @staticmethod
+    def _condition_mask(series, operator, value):
+        if operator == 'contains':
+            text = str(value).lower()
+            return _string_mask(series, lambda s: s.str.lower().str.contains(text, regex=False))
+        if operator == 'datestartswith':
+            text = str(value)
+            return _string_mask(series, lambda s: s.str.startswith(text))
+
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                return np.zeros(len(series), dtype=bool)
+            values = _numeric_values(series)
+        else:
+            if isinstance(value, float) and value.is_integer():
+                value = str(int(value))
+            value = str(value)
+            values = series.astype(object).to_numpy()
+            if operator not in ('eq', 'ne'):
+                values = np.where(pd.isna(values), '', values.astype(str))
+
+        with np.errstate(invalid='ignore'):
+            if operator == 'eq':
+                return np.asarray(values == value, dtype=bool)
+            if operator == 'ne':
+                return np.asarray(values != value, dtype=bool)
+            if operator == 'lt':
+                return np.asarray(values < value, dtype=bool)
+            if operator == 'le':
+                return np.asarray(values <= value, dtype=bool)
+            if operator == 'gt':
+                return np.asarray(values > value, dtype=bool)
+            if operator == 'ge':
+                return np.asarray(values >= value, dtype=bool)
+        return np.ones(len(series), dtype=bool)
+
+    def query(self, page_current=0, page_size=10, sort_by=None, filter_query=''):
+        """Retorna (registros da página, número de páginas) para o estado atual da tabela."""
+        mask = self.filter_mask(filter_query)
+        sort_by = [item for item in (sort_by or []) if item.get('column_id') in self.df.columns]
+
+        if len(sort_by) == 1:
+            order = self.sort_order(sort_by[0]['column_id'], sort_by[0]['direction'] == 'asc')
+            if mask is not None:
+                order = order[mask[order]]
+        else:
+            order = np.flatnonzero(mask) if mask is not None else np.arange(len(self.df))
+            if sort_by:
+                subset = self.df.iloc[order]
+                subset = subset.sort_values(
+                    [item['column_id'] for item in sort_by],
+                    ascending=[item['direction'] == 'asc' for item in sort_by],
+                    na_position='last', kind='stable'
+                )
+                order = subset.index.to_numpy()
+
+        page_size = max(int(page_size or 1), 1)
+        page_count = max(math.ceil(len(order) / page_size), 1)
+        page_current = min(max(int(page_current or 0), 0), page_count - 1)
+        rows = order[page_current * page_size:(page_current + 1) * page_size]
+        return to_records(self.df.iloc[rows]), page_count
@@ -0,0 +1,75 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_prep import current_month, months_stale, optimize_dtypes, parse_reference_periods, prepare_data, summarize
+
+
+def prepared(last, previous):
+    raw = pd.DataFrame({
+        'Country': ['Brazil', 'Chile', 'Canada'][:len(last)],
+        'Last': last,
+        'Previous': previous,
+        'Reference': ['Feb/25'] * len(last),
+        'Unit': ['%'] * len(last),
+    })
+    return optimize_dtypes(prepare_data(raw, as_of=pd.Period('2025-04', 'M')))
+
+
+def test_summarize_overall_and_regions():
+    summary = summarize(prepared([6.8, 8.4, 6.7], [6.5, 8.0, 6.9]))
+    overall = summary['overall']
+
+    assert overall['rows'] == 3
+    assert overall['mean_last'] == pytest.approx(7.3, abs=1e-5)
+    assert overall['median_last'] == pytest.approx(6.8, abs=1e-5)
+    assert (overall['max_country'], overall['min_country']) == ('Chile', 'Canada')
+    assert (overall['improved'], overall['worsened']) == (1, 2)
+    assert overall['worsened_pct'] == pytest.approx(200 / 3)
+    assert summary['regions']['South America']['rows'] == 2
+    assert summary['regions']['North America']['max_country'] == 'Canada'
+
+
+def test_summarize_without_numeric_rates():
+    overall = summarize(prepared([np.nan, np.nan], [np.nan, 5.0]))['overall']
+
+    for key in ('mean_last', 'mean_delta', 'median_last', 'max_last', 'min_last'):
+        assert math.isnan(overall[key])
+    assert overall['max_country'] is None
+    # Os layouts formatam esses valores diretamente: não podem ser None
+    assert f"{overall['mean_last']:.2f}%" == 'nan%'
+    assert not overall['mean_delta'] > 0
+
+
+def test_summarize_empty():
+    overall = summarize(prepared([], []))['overall']
+    assert overall['rows'] == 0
+    assert math.isnan(overall['mean_last'])
+    assert overall['improved_pct'] == 0.0
+
+
+def test_parse_reference_periods():
+    references = pd.Series(['Dec/24', 'Feb/25', 'Dec/24', 'n/a', None], index=[10, 11, 12, 13, 14])
+    periods = parse_reference_periods(references)
+
+    assert periods.dtype == 'period[M]'
+    assert periods.index.tolist() == [10, 11, 12, 13, 14]
+    assert periods[:3].astype(str).tolist() == ['2024-12', '2025-02', '2024-12']
+    assert periods[13:].isna().all()
+
+
+def test_months_stale():
+    periods = parse_reference_periods(pd.Series(['Dec/24', 'Apr/25', 'n/a']))
+    stale = months_stale(periods, as_of='2025-04')
+
+    assert stale.dtype == 'Int16'
+    assert stale[:2].tolist() == [4, 0]
+    assert stale.isna()[2]
+
+
+def test_months_stale_defaults_to_current_month():
+    month = current_month()
+    periods = pd.Series([month - 3], dtype='period[M]')
+    assert months_stale(periods).tolist() == [3]
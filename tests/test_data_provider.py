@@ -0,0 +1,124 @@
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+import data_provider
+from data_prep import current_month
+from data_provider import RECENT_SNAPSHOTS, DataProvider, snapshot_version
+from snapshots import SNAPSHOT_EXTENSION, SnapshotManifest, write_snapshot
+
+RAW = pd.DataFrame({
+    'Country': ['Brazil', 'Chile'],
+    'Last': [6.8, 8.4],
+    'Previous': [6.5, 8.0],
+    'Reference': ['Feb/25', 'Feb/25'],
+    'Unit': ['%', '%'],
+})
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Pasta com RECENT_SNAPSHOTS + 3 snapshots registrados no manifest (s0 é o mais antigo)."""
+    with open(tmp_path / SnapshotManifest.FILENAME, 'w', encoding='utf-8') as manifest:
+        for i in range(RECENT_SNAPSHOTS + 3):
+            write_snapshot(RAW, str(tmp_path / f's{i}{SNAPSHOT_EXTENSION}'))
+            entry = {'snapshot_id': f's{i}', 'path': f's{i}{SNAPSHOT_EXTENSION}', 'rows': len(RAW),
+                     'created_at': f'2025-01-01T00:00:{i:02d}'}
+            manifest.write(json.dumps(entry) + '\n')
+    return str(tmp_path)
+
+
+def version(snapshot_id, as_of=None):
+    return snapshot_version(snapshot_id, as_of if as_of is not None else current_month())
+
+
+def count_loads(monkeypatch, delay=0):
+    loads = []
+    original = data_provider.DataSnapshot
+
+    def loading(path, as_of=None):
+        loads.append(os.path.basename(path))
+        time.sleep(delay)
+        return original(path, as_of)
+
+    monkeypatch.setattr(data_provider, 'DataSnapshot', loading)
+    return loads
+
+
+def test_serves_only_recent_manifest_versions(data_dir):
+    provider = DataProvider(data_dir, poll_interval=0)
+    newest = RECENT_SNAPSHOTS + 2
+    assert provider.current().version == version(f's{newest}')
+
+    for i in range(newest - RECENT_SNAPSHOTS, newest):
+        assert provider.snapshot(version(f's{i}')).version == version(f's{i}')
+    assert provider.snapshot(version(f's{newest - RECENT_SNAPSHOTS - 1}')) is None
+    assert provider.snapshot(version('../s0')) is None
+    assert provider.snapshot(version('nope')) is None
+    assert provider.snapshot('s3') is None
+
+
+def test_recent_versions_stay_in_memory(data_dir, monkeypatch):
+    provider = DataProvider(data_dir, poll_interval=0)
+    loads = count_loads(monkeypatch)
+    snapshot_ids = [f's{i}' for i in range(2, 2 + RECENT_SNAPSHOTS)]
+
+    for _ in range(3):
+        for snapshot_id in snapshot_ids:
+            assert provider.snapshot(version(snapshot_id)).version == version(snapshot_id)
+    assert sorted(loads) == sorted(f'{snapshot_id}{SNAPSHOT_EXTENSION}' for snapshot_id in snapshot_ids)
+
+
+def test_concurrent_requests_load_once(data_dir, monkeypatch):
+    provider = DataProvider(data_dir, poll_interval=0)
+    loads = count_loads(monkeypatch, delay=0.2)
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(provider.snapshot(version('s3')))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == [f's3{SNAPSHOT_EXTENSION}']
+    assert len({id(result) for result in results}) == 1
+
+
+def test_after_fork_recreates_locks(data_dir):
+    provider = DataProvider(data_dir, poll_interval=0)
+    provider._recent_lock.acquire()
+    provider._after_fork()
+    assert provider.snapshot(version('s3')).version == version('s3')
+
+
+def test_month_rollover_recomputes_staleness(data_dir, monkeypatch):
+    provider = DataProvider(data_dir, poll_interval=0)
+    before = provider.current()
+    assert before.df['MonthsStale'].iloc[0] == (current_month() - pd.Period('2025-02', freq='M')).n
+
+    next_month = current_month() + 1
+    monkeypatch.setattr(data_provider, 'current_month', lambda: next_month)
+    changes = []
+    provider.on_change(changes.append)
+
+    after = provider.current()
+    assert after.version == version(after.snapshot_id, next_month) != before.version
+    assert (after.df['MonthsStale'] == before.df['MonthsStale'] + 1).all()
+    assert changes == [after]
+    # Páginas geradas antes da virada continuam recebendo a versão do mês anterior
+    assert provider.snapshot(before.version) is before
+    assert provider.current() is after
+
+
+def test_rejects_versions_outside_current_and_previous_month(data_dir):
+    provider = DataProvider(data_dir, poll_interval=0)
+    month = current_month()
+    assert provider.snapshot(version('s3', month - 1)).as_of == month - 1
+    assert provider.snapshot(version('s3', month - 2)) is None
+    assert provider.snapshot(version('s3', month + 1)) is None
+    assert provider.snapshot(f's3@{month}-01') is None
+    assert provider.snapshot('s3@garbage') is None
@@ -0,0 +1,91 @@
+import pytest
+
+from driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self, name):
+        self.name = name
+        self.alive = True
+        self.quit_calls = 0
+        self.visited = []
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError('browser is gone')
+        return self.visited[-1] if self.visited else 'about:blank'
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def delete_all_cookies(self):
+        pass
+
+    def execute_script(self, script):
+        pass
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+class Factory:
+    def __init__(self):
+        self.created = []
+
+    def __call__(self):
+        driver = FakeDriver(f'd{len(self.created)}')
+        self.created.append(driver)
+        return driver
+
+
+def test_reuses_driver_until_max_pages():
+    factory = Factory()
+    with DriverPool(factory, size=1, max_pages_per_driver=3) as pool:
+        used = []
+        for _ in range(7):
+            with pool.driver() as driver:
+                used.append(driver.name)
+
+    assert used == ['d0'] * 3 + ['d1'] * 3 + ['d2']
+    assert [driver.quit_calls for driver in factory.created] == [1, 1, 1]
+
+
+def test_resets_state_between_pages():
+    factory = Factory()
+    with DriverPool(factory) as pool:
+        with pool.driver() as driver:
+            driver.get('https://example.com')
+        with pool.driver() as driver:
+            assert driver.current_url == 'about:blank'
+    assert len(factory.created) == 1
+
+
+def test_error_discards_driver():
+    factory = Factory()
+    with DriverPool(factory) as pool:
+        with pytest.raises(ValueError):
+            with pool.driver():
+                raise ValueError('page failed')
+        with pool.driver() as driver:
+            assert driver.name == 'd1'
+    assert factory.created[0].quit_calls == 1
+
+
+def test_dead_idle_driver_is_replaced():
+    factory = Factory()
+    with DriverPool(factory) as pool:
+        with pool.driver() as driver:
+            pass
+        driver.alive = False
+        with pool.driver() as driver:
+            assert driver.name == 'd1'
+    assert factory.created[0].quit_calls == 1
+
+
+def test_closed_pool_refuses_checkout():
+    pool = DriverPool(Factory())
+    pool.close()
+    with pytest.raises(RuntimeError):
+        with pool.driver():
+            pass
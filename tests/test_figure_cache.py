@@ -0,0 +1,83 @@
+import threading
+import time
+
+import pytest
+
+from figure_cache import FigureCache
+
+
+def test_builds_once_per_key():
+    cache = FigureCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {'data': []}
+
+    first = cache.get_or_build('bar', 'v1', 'dark', build)
+    assert cache.get_or_build('bar', 'v1', 'dark', build) is first
+    cache.get_or_build('bar', 'v1', 'light', build)
+    cache.get_or_build('bar', 'v2', 'dark', build)
+
+    assert len(builds) == 3
+    assert cache.stats() == {'hits': 1, 'misses': 3, 'hit_ratio': 0.25, 'size': 3, 'maxsize': 32}
+
+
+def test_evicts_least_recently_used():
+    cache = FigureCache(maxsize=2)
+    cache.get_or_build('a', 'v1', 'dark', lambda: 'a')
+    cache.get_or_build('b', 'v1', 'dark', lambda: 'b')
+    # 'a' passa a ser o mais recente; 'b' sai quando 'c' entra
+    cache.get_or_build('a', 'v1', 'dark', lambda: 'rebuilt')
+    cache.get_or_build('c', 'v1', 'dark', lambda: 'c')
+
+    assert cache.get_or_build('a', 'v1', 'dark', lambda: 'rebuilt') == 'a'
+    assert cache.get_or_build('b', 'v1', 'dark', lambda: 'rebuilt') == 'rebuilt'
+    assert cache.stats()['size'] == 2
+
+
+def test_concurrent_requests_build_once():
+    cache = FigureCache()
+    builds = []
+    results = []
+
+    def build():
+        builds.append(1)
+        time.sleep(0.2)
+        return object()
+
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_build('bar', 'v1', 'dark', build)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert len({id(result) for result in results}) == 1
+
+
+def test_failed_build_is_not_cached_and_releases_waiters():
+    cache = FigureCache()
+
+    def fail():
+        raise ValueError('bad data')
+
+    with pytest.raises(ValueError):
+        cache.get_or_build('bar', 'v1', 'dark', fail)
+    assert cache.get_or_build('bar', 'v1', 'dark', lambda: 'ok') == 'ok'
+
+
+def test_invalidate_keeps_only_requested_version():
+    cache = FigureCache()
+    cache.get_or_build('bar', 'v1', 'dark', lambda: 'old')
+    cache.get_or_build('bar', 'v2', 'dark', lambda: 'new')
+
+    cache.invalidate(keep_version='v2')
+    assert cache.get_or_build('bar', 'v2', 'dark', lambda: 'rebuilt') == 'new'
+    assert cache.get_or_build('bar', 'v1', 'dark', lambda: 'rebuilt') == 'rebuilt'
+
+    cache.invalidate()
+    assert cache.stats()['size'] == 0
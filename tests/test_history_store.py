@@ -0,0 +1,71 @@
+import os
+
+import pandas as pd
+import pytest
+
+from history_store import HistoryStore
+from snapshots import SNAPSHOT_EXTENSION, SnapshotManifest, write_snapshot
+
+
+def raw(last, countries=('Brazil', 'Chile'), reference='Feb/25'):
+    return pd.DataFrame({
+        'Country': list(countries),
+        'Last': [str(value) for value in last],
+        'Previous': ['1.0'] * len(countries),
+        'Reference': [reference] * len(countries),
+        'Unit': ['%'] * len(countries),
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    return HistoryStore(str(tmp_path / 'history.sqlite3'))
+
+
+def add_snapshot(data_dir, snapshot_id, df, static_fallback=False):
+    path = os.path.join(data_dir, f'{snapshot_id}{SNAPSHOT_EXTENSION}')
+    write_snapshot(df, path)
+    SnapshotManifest(data_dir).append(path, df, static_fallback=static_fallback)
+
+
+def test_ingest_manifest_skips_static_fallback(tmp_path, store):
+    data_dir = str(tmp_path)
+    add_snapshot(data_dir, 'real', raw([6.8, 8.4]))
+    add_snapshot(data_dir, 'static', raw([99.0, 99.0]), static_fallback=True)
+
+    assert store.ingest_manifest(data_dir) == 2
+    assert not store.is_ingested('static')
+    assert store.series()['Last'].tolist() == [6.8, 8.4]
+
+
+def test_ingest_is_idempotent_per_snapshot(store):
+    assert store.ingest(raw([6.8, 8.4]), 'a') == 2
+    assert store.ingest(raw([7.0, 9.0]), 'a') == 0
+    assert store.is_ingested('a')
+    assert store.series()['Last'].tolist() == [6.8, 8.4]
+
+
+def test_same_reference_updates_instead_of_duplicating(store):
+    store.ingest(raw([6.8, 8.4]), 'a')
+    assert store.ingest(raw([6.9, 8.5]), 'b') == 0
+
+    series = store.series()
+    assert len(series) == 2
+    assert series['Last'].tolist() == [6.9, 8.5]
+    assert (series['Period'] == pd.Period('2025-02', freq='M')).all()
+
+
+def test_new_reference_adds_rows(store):
+    store.ingest(raw([6.8, 8.4]), 'a')
+    assert store.ingest(raw([6.5], countries=('Brazil',), reference='Mar/25'), 'b') == 1
+
+    assert store.series(countries=['Brazil'])['Reference'].tolist() == ['Feb/25', 'Mar/25']
+    latest = store.latest_per_country().set_index('Country')
+    assert latest.loc['Brazil', 'Reference'] == 'Mar/25'
+    assert latest.loc['Chile', 'Reference'] == 'Feb/25'
+
+
+def test_rows_without_country_or_reference_are_skipped(store):
+    df = raw([6.8, 8.4])
+    df.loc[1, 'Reference'] = None
+    assert store.ingest(df, 'a') == 1
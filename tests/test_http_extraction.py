@@ -0,0 +1,103 @@
+import os
+
+import pandas as pd
+import pytest
+
+import main
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def test_parse_table_with_table_class():
+    df = main.parse_unemployment_html(read_fixture('unemployment_table.html'))
+
+    expected = main.build_dataframe(
+        ['Country', 'Last', 'Previous', 'Reference', 'Unit'],
+        [
+            ['Argentina', '6.4', '6.9', 'Dec/24', '%'],
+            ['Brazil', '6.8', '6.5', 'Feb/25', '%'],
+            ['Trinidad and Tobago', '4.1', '4.8', 'Sep/24', '%'],
+        ],
+    )
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_parse_bare_table():
+    df = main.parse_unemployment_html(read_fixture('unemployment_bare_table.html'))
+
+    expected = main.build_dataframe(
+        ['Country', 'Last', 'Previous', 'Reference', 'Unit'],
+        [['Canada', '6.7', '6.6', 'Mar/25', '%'], ['Mexico', '2.5', '2.7', 'Feb/25', '%']],
+    )
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_parse_ragged_rows():
+    df = main.parse_unemployment_html(read_fixture('unemployment_ragged_rows.html'))
+
+    expected = main.build_dataframe(
+        ['Country', 'Last', 'Previous'],
+        [
+            ['Chile', '8.4', '8.0', 'Feb/25', '%'],
+            ['Cuba', '1.2'],
+            ['Peru', '6.3', '6.2', 'Feb/25'],
+        ],
+    )
+    pd.testing.assert_frame_equal(df, expected)
+    assert list(df.columns) == ['Country', 'Last', 'Previous', 'Coluna 4', 'Coluna 5']
+    assert df.loc[1].tolist() == ['Cuba', '1.2', '', '', '']
+
+
+@pytest.mark.parametrize('html_text', [
+    read_fixture('unemployment_no_table.html'),
+    '',
+    '   \n\t',
+    None,
+])
+def test_parse_without_table_returns_none(html_text):
+    assert main.parse_unemployment_html(html_text) is None
+
+
+class FakeResponse:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise main.requests.HTTPError(f'{self.status_code} Error')
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append((url, headers, timeout))
+        return self.response
+
+
+def test_fetch_uses_session_and_parses_page():
+    session = FakeSession(FakeResponse(read_fixture('unemployment_table.html')))
+
+    df = main.fetch_unemployment_data_http('https://example.test/page', timeout=3, session=session)
+
+    assert session.calls == [('https://example.test/page', main.HTTP_HEADERS, 3)]
+    assert df['Country'].tolist() == ['Argentina', 'Brazil', 'Trinidad and Tobago']
+
+
+def test_fetch_returns_none_without_table():
+    session = FakeSession(FakeResponse(read_fixture('unemployment_no_table.html')))
+    assert main.fetch_unemployment_data_http(session=session) is None
+
+
+def test_fetch_raises_on_http_error():
+    session = FakeSession(FakeResponse('', status_code=403))
+    with pytest.raises(main.requests.HTTPError):
+        main.fetch_unemployment_data_http(session=session)
@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+from metrics import UNKNOWN_LABEL, MetricsRegistry, callback_label
+
+
+def make_metrics(registry):
+    requests = registry.counter('app_requests_total', 'Requisições', ['route'])
+    latency = registry.histogram('app_latency_seconds', 'Latência', ['route'], buckets=(0.1, 1.0))
+    return requests, latency
+
+
+def test_render_prometheus_text():
+    registry = MetricsRegistry()
+    requests, latency = make_metrics(registry)
+    requests.inc(route='/')
+    requests.inc(2, route='/')
+    latency.observe(0.05, route='/')
+    latency.observe(0.5, route='/')
+    latency.observe(5, route='/')
+
+    assert registry.render().splitlines() == [
+        '# HELP app_requests_total Requisições',
+        '# TYPE app_requests_total counter',
+        'app_requests_total{route="/"} 3',
+        '# HELP app_latency_seconds Latência',
+        '# TYPE app_latency_seconds histogram',
+        'app_latency_seconds_bucket{route="/",le="0.1"} 1',
+        'app_latency_seconds_bucket{route="/",le="1.0"} 2',
+        'app_latency_seconds_bucket{route="/",le="+Inf"} 3',
+        'app_latency_seconds_sum{route="/"} 5.55',
+        'app_latency_seconds_count{route="/"} 3',
+    ]
+
+
+def test_render_escapes_labels():
+    registry = MetricsRegistry()
+    requests, _ = make_metrics(registry)
+    requests.inc(route='a"b\\c\nd')
+    assert 'app_requests_total{route="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+
+def test_disabled_registry_ignores_observations():
+    registry = MetricsRegistry(enabled=False)
+    requests, latency = make_metrics(registry)
+    requests.inc(route='/')
+    with latency.time(route='/'):
+        pass
+    assert '{' not in registry.render()
+
+
+def test_multiprocess_render_sums_all_processes(tmp_path):
+    # Dois "workers" gravando na mesma pasta; qualquer um publica os totais
+    workers = []
+    for _ in range(2):
+        registry = MetricsRegistry(multiprocess_dir=str(tmp_path), flush_interval=3600)
+        registry.start()
+        workers.append((registry, *make_metrics(registry)))
+
+    first, second = workers
+    first[1].inc(route='/')
+    second[1].inc(3, route='/')
+    second[1].inc(route='/x')
+    first[2].observe(0.05, route='/')
+    second[2].observe(0.5, route='/')
+    second[0].flush()
+
+    for registry, _, _ in workers:
+        lines = registry.render().splitlines()
+        assert 'app_requests_total{route="/"} 4' in lines
+        assert 'app_requests_total{route="/x"} 1' in lines
+        assert 'app_latency_seconds_bucket{route="/",le="1.0"} 2' in lines
+        assert 'app_latency_seconds_count{route="/"} 2' in lines
+        registry.stop()
+    assert len(os.listdir(tmp_path)) == 2
+
+
+@pytest.mark.parametrize('output, known, expected', [
+    ('main-chart.figure', None, 'main-chart.figure'),
+    ('..data-table.data...data-table.page_count..', None, 'data-table.data+data-table.page_count'),
+    ('main-chart.figure', {'main-chart.figure': None}, 'main-chart.figure'),
+    ('bogus.x', {'main-chart.figure': None}, UNKNOWN_LABEL),
+    (None, None, UNKNOWN_LABEL),
+    (['not', 'a', 'string'], None, UNKNOWN_LABEL),
+])
+def test_callback_label(output, known, expected):
+    assert callback_label(output, known) == expected
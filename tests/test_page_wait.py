@@ -0,0 +1,60 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+
+import main
+
+
+class FakeElement:
+    def __init__(self, stale=False, displayed=True):
+        self.stale = stale
+        self.displayed = displayed
+
+    def is_displayed(self):
+        if self.stale:
+            raise StaleElementReferenceException('element is not attached to the page document')
+        return self.displayed
+
+    def is_enabled(self):
+        return True
+
+
+class FakeDriver:
+    """Driver que devolve, a cada consulta, os elementos definidos por pages(n)."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.polls = 0
+
+    def find_elements(self, by, value):
+        if value == 'cookieAcceptButton':
+            self.polls += 1
+        return self.pages(self.polls).get(value, [])
+
+
+STATES = [main.COOKIE_BANNER_STATE] + main.TABLE_STATES
+
+
+def test_stale_banner_keeps_polling():
+    # Nas duas primeiras consultas o banner é recriado pela página (stale)
+    driver = FakeDriver(lambda n: {'cookieAcceptButton': [FakeElement(stale=n < 3)]})
+
+    state, _ = main.wait_for_first_state(driver, STATES, timeout=5, poll_frequency=0.01)
+
+    assert state == 'cookie_banner'
+    assert driver.polls == 3
+
+
+def test_table_class_has_priority_over_fallback():
+    table = FakeElement()
+    driver = FakeDriver(lambda n: {'table.table': [table], 'table': [FakeElement()]})
+
+    state, element = main.wait_for_first_state(driver, STATES, timeout=5, fallback_grace=5, poll_frequency=0.01)
+
+    assert (state, element) == ('table', table)
+
+
+def test_hidden_banner_times_out():
+    driver = FakeDriver(lambda n: {'cookieAcceptButton': [FakeElement(displayed=False)]})
+
+    with pytest.raises(TimeoutException):
+        main.wait_for_first_state(driver, STATES, timeout=0.1, poll_frequency=0.01)
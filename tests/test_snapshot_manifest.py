@@ -0,0 +1,49 @@
+import json
+import os
+
+from snapshots import SnapshotManifest, find_latest_snapshot
+
+
+def write_manifest(data_dir, created_at):
+    with open(data_dir / SnapshotManifest.FILENAME, 'w', encoding='utf-8') as f:
+        for i, when in enumerate(created_at):
+            f.write(json.dumps({'snapshot_id': f's{i}', 'path': f's{i}.parquet', 'created_at': when}) + '\n')
+
+
+def test_at_returns_snapshot_in_effect(tmp_path):
+    # Fora de ordem no arquivo: as entradas são ordenadas pela data de criação
+    write_manifest(tmp_path, ['2025-03-01T00:00:00', '2025-01-01T00:00:00', '2025-02-01T12:00:00'])
+    manifest = SnapshotManifest(str(tmp_path))
+
+    assert manifest.at('2024-12-31T23:59:59') is None
+    assert manifest.at('2025-01-01T00:00:00')['snapshot_id'] == 's1'
+    assert manifest.at('2025-02-15T00:00:00')['snapshot_id'] == 's2'
+    assert manifest.at('2030-01-01T00:00:00')['snapshot_id'] == 's0'
+    # latest() segue a mesma ordem de at(), não a última linha do arquivo
+    assert manifest.latest()['snapshot_id'] == 's0'
+    assert [entry['snapshot_id'] for entry in manifest.recent(2)] == ['s2', 's0']
+
+
+def test_find_latest_snapshot_uses_creation_order(tmp_path):
+    write_manifest(tmp_path, ['2025-03-01T00:00:00', '2025-01-01T00:00:00'])
+    for name in ('s0.parquet', 's1.parquet'):
+        (tmp_path / name).write_bytes(b'')
+
+    assert find_latest_snapshot(str(tmp_path)) == os.path.join(str(tmp_path), 's0.parquet')
+
+
+def test_at_sees_appended_entries(tmp_path):
+    write_manifest(tmp_path, ['2025-01-01T00:00:00'])
+    manifest = SnapshotManifest(str(tmp_path))
+    assert manifest.at('2025-06-01T00:00:00')['snapshot_id'] == 's0'
+
+    write_manifest(tmp_path, ['2025-01-01T00:00:00', '2025-05-01T00:00:00'])
+    assert manifest.at('2025-06-01T00:00:00')['snapshot_id'] == 's1'
+    assert [entry['snapshot_id'] for entry in manifest.entries()] == ['s0', 's1']
+
+
+def test_missing_manifest(tmp_path):
+    manifest = SnapshotManifest(str(tmp_path))
+    assert manifest.entries() == []
+    assert manifest.at('2025-01-01T00:00:00') is None
+    assert manifest.latest() is None
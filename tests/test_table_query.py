@@ -0,0 +1,124 @@
+import pandas as pd
+import pytest
+
+from data_prep import TABLE_COLUMNS, optimize_dtypes, prepare_data
+from table_query import TableIndex, split_filter_part
+
+RAW = pd.DataFrame({
+    'Country': ['Argentina', 'Bolivia', 'Brazil', 'Canada', 'Colombia', 'Cuba', 'Honduras', 'Mexico'],
+    'Last': [6.4, 2.7, 6.8, 6.7, 10.33, 1.2, 6.4, 2.5],
+    'Previous': [6.9, 2.8, 6.5, 6.6, 11.64, 1.8, 8.7, 2.7],
+    'Reference': ['Dec/24', 'Sep/24', 'Feb/25', 'Mar/25', 'Feb/25', 'Dec/23', 'Dec/23', 'Feb/25'],
+    'Unit': ['%'] * 8,
+})
+
+
+@pytest.fixture(scope='module')
+def index():
+    # Mesmo pipeline do dashboard: taxas em float32 e texto em categorias
+    df = optimize_dtypes(prepare_data(RAW, as_of=pd.Period('2025-04', 'M')))
+    assert df['Last'].dtype == 'float32'
+    return TableIndex(df, TABLE_COLUMNS)
+
+
+def countries(records):
+    return [record['Country'] for record in records]
+
+
+def query_all(index, **kwargs):
+    records, _ = index.query(page_current=0, page_size=100, **kwargs)
+    return records
+
+
+@pytest.mark.parametrize('filter_part, expected', [
+    ('{Last} > 5', ('Last', 'gt', 5.0)),
+    ('{Last} >= 6.4', ('Last', 'ge', 6.4)),
+    ('{Last} le 10.33', ('Last', 'le', 10.33)),
+    ('{Country} = "Brazil"', ('Country', 'eq', 'Brazil')),
+    ("{Country} ne 'Cuba'", ('Country', 'ne', 'Cuba')),
+    ('{Region} contains south', ('Region', 'contains', 'south')),
+    ('{Last} contains 10', ('Last', 'contains', '10')),
+    ('{Reference} datestartswith 2024', ('Reference', 'datestartswith', '2024')),
+    ('{Country} = "say \\"hi\\""', ('Country', 'eq', 'say "hi"')),
+    ('{Last} >', (None, None, None)),
+    ('Last', (None, None, None)),
+])
+def test_split_filter_part(filter_part, expected):
+    assert split_filter_part(filter_part) == expected
+
+
+def test_query_sort(index):
+    records = query_all(index, sort_by=[{'column_id': 'Last', 'direction': 'desc'}])
+    assert countries(records)[:2] == ['Colombia', 'Brazil']
+    assert records[0]['Last'] == 10.33
+
+    records = query_all(index, sort_by=[{'column_id': 'Last', 'direction': 'asc'}])
+    assert countries(records)[:2] == ['Cuba', 'Mexico']
+
+
+def test_query_multi_sort(index):
+    records = query_all(index, sort_by=[
+        {'column_id': 'Last', 'direction': 'asc'},
+        {'column_id': 'Country', 'direction': 'desc'},
+    ])
+    assert countries(records) == [
+        'Cuba', 'Mexico', 'Bolivia', 'Honduras', 'Argentina', 'Canada', 'Brazil', 'Colombia'
+    ]
+
+
+def test_query_ignores_unknown_sort_column(index):
+    records = query_all(index, sort_by=[{'column_id': 'Nope', 'direction': 'asc'}])
+    assert countries(records) == list(RAW['Country'])
+
+
+def test_query_pagination_and_clamping(index):
+    sort_by = [{'column_id': 'Country', 'direction': 'asc'}]
+    records, page_count = index.query(page_current=1, page_size=3, sort_by=sort_by)
+    assert page_count == 3
+    assert countries(records) == ['Canada', 'Colombia', 'Cuba']
+
+    # Páginas fora do intervalo são limitadas à primeira/última
+    records, _ = index.query(page_current=99, page_size=3, sort_by=sort_by)
+    assert countries(records) == ['Honduras', 'Mexico']
+    records, _ = index.query(page_current=-1, page_size=3, sort_by=sort_by)
+    assert countries(records) == ['Argentina', 'Bolivia', 'Brazil']
+
+
+def test_query_empty_filter_result(index):
+    records, page_count = index.query(page_current=3, page_size=3, filter_query='{Last} > 100')
+    assert records == []
+    assert page_count == 1
+
+
+@pytest.mark.parametrize('filter_query, expected', [
+    ('{Last} = 6.4', {'Argentina', 'Honduras'}),
+    ('{Last} eq 6.4', {'Argentina', 'Honduras'}),
+    ('{Last} != 6.4', {'Bolivia', 'Brazil', 'Canada', 'Colombia', 'Cuba', 'Mexico'}),
+    ('{Last} <= 6.4', {'Argentina', 'Bolivia', 'Cuba', 'Honduras', 'Mexico'}),
+    ('{Last} < 6.4', {'Bolivia', 'Cuba', 'Mexico'}),
+    ('{Last} ge 10.33', {'Colombia'}),
+    ('{Last} > 10.33', set()),
+    ('{Previous} = 11.64', {'Colombia'}),
+    ('{Last} contains 10', {'Colombia'}),
+    ('{Last} contains 6.4', {'Argentina', 'Honduras'}),
+])
+def test_query_float_filters(index, filter_query, expected):
+    assert set(countries(query_all(index, filter_query=filter_query))) == expected
+
+
+def test_query_text_filters(index):
+    assert set(countries(query_all(index, filter_query='{Region} contains south'))) == {
+        'Argentina', 'Bolivia', 'Brazil', 'Colombia'
+    }
+    assert countries(query_all(index, filter_query='{Country} = "Cuba"')) == ['Cuba']
+    assert set(countries(query_all(
+        index, filter_query='{Region} contains south && {Last} > 5'
+    ))) == {'Argentina', 'Brazil', 'Colombia'}
+
+
+def test_query_filter_with_sort(index):
+    records = query_all(
+        index, filter_query='{Last} >= 6.4', sort_by=[{'column_id': 'Last', 'direction': 'desc'}]
+    )
+    assert countries(records)[:3] == ['Colombia', 'Brazil', 'Canada']
+    assert set(countries(records)[3:]) == {'Argentina', 'Honduras'}